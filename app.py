@@ -2,7 +2,10 @@
 import streamlit as st
 from datetime import datetime
 
+from src.bulk import BulkManager, UPLOAD_FORMATS, read_upload
+from src.cache import ExtractionCache
 from src.job_extractor import JobExtractor
+from src.models import job_information_schema
 from src.file_generator import generate_txt_file, generate_json_file
 from utils.validators import validate_api_key, validate_job_description
 
@@ -14,6 +17,338 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+
+@st.cache_resource
+def get_extraction_cache() -> ExtractionCache:
+    """Shared on-disk extraction cache, opened once per server process."""
+    return ExtractionCache()
+
+
+@st.cache_resource(max_entries=32, ttl=3600, show_spinner=False)
+def get_extractor(api_key: str) -> JobExtractor:
+    """Long-lived extractor per API key, shared across reruns and sessions.
+
+    Constructing a genai.Client takes tens of milliseconds and every new
+    client opens fresh HTTPS connections; reusing one keeps its connection
+    pool alive between extractions. Least recently used keys are evicted
+    past max_entries, and idle ones after the TTL.
+    """
+    # Build the full-extraction response schema now rather than on the first request
+    job_information_schema()
+    return JobExtractor(api_key=api_key, cache=get_extraction_cache())
+
+
+@st.cache_resource
+def get_bulk_manager() -> BulkManager:
+    """Registry of background bulk batches, shared by all sessions so any of them can reconnect."""
+    return BulkManager()
+
+
+# Display labels for progressively rendered (streamed) fields, in display order
+PARTIAL_FIELD_LABELS = {
+    "job_title": "Job Title",
+    "company_name": "Company",
+    "department": "Department",
+    "seniority_level": "Seniority Level",
+    "years_of_experience": "Years of Experience",
+    "work_type": "Work Type",
+    "location": "Location",
+    "salary": "Salary",
+    "education_requirements": "Education Requirements",
+    "required_criteria": "Required Criteria",
+    "preferred_qualifications": "Preferred Qualifications",
+    "skills": "Skills & Technologies",
+    "scope_of_responsibilities": "Scope of Responsibilities",
+    "benefits": "Benefits & Perks",
+    "additional_info": "Additional Information",
+}
+
+
+def render_partial_result(partial: dict) -> str:
+    """Render the fields received so far from a streaming extraction as markdown."""
+    lines = ["#### ⏳ Receiving results..."]
+    for field, label in PARTIAL_FIELD_LABELS.items():
+        value = partial.get(field)
+        if not value:
+            continue
+        if isinstance(value, list):
+            lines.append(f"**{label}:**")
+            lines.extend(f"{i}. {item}" for i, item in enumerate(value, 1))
+        else:
+            lines.append(f"**{label}:** {value}")
+    return "\n\n".join(lines)
+
+
+# Result sections: (expander index, title, "Show to Copy" key, fields, show field labels)
+RESULT_SECTIONS = [
+    (0, "📋 Basic Information", "copy_basic",
+     ["job_title", "company_name", "department", "seniority_level", "years_of_experience"], True),
+    (1, "📍 Work Arrangement", "copy_work", ["work_type", "location"], True),
+    (2, "💰 Compensation", "copy_salary", ["salary"], True),
+    (3, "🎓 Education Requirements", "copy_education", ["education_requirements"], False),
+    (4, "✅ Required Criteria", "copy_criteria", ["required_criteria"], False),
+    (5, "⭐ Preferred Qualifications", "copy_pref", ["preferred_qualifications"], False),
+    (6, "🛠️ Skills & Technologies", "copy_skills", ["skills"], False),
+    (7, "📋 Scope of Responsibilities", "copy_resp", ["scope_of_responsibilities"], False),
+    (8, "🎁 Benefits & Perks", "copy_benefits", ["benefits"], False),
+    (9, "ℹ️ Additional Information", "copy_additional", ["additional_info"], False),
+]
+
+
+def rendered(result, key: str, render):
+    """Return render() for the displayed result, computed once per result and key.
+
+    The memo lives in session state next to the result it belongs to, so a
+    new extraction (a new result object) starts with fresh renderings.
+
+    Args:
+        result: JobInformation being displayed
+        key: Name of the rendering (e.g. "txt", "json", "section:2")
+        render: Zero-argument function producing it
+    """
+    memo = st.session_state.get("renderings")
+    if memo is None or memo[0] is not result:
+        memo = st.session_state.renderings = (result, {})
+    renderings = memo[1]
+    if key not in renderings:
+        renderings[key] = render()
+    return renderings[key]
+
+
+def render_section(result, fields: list, labeled: bool) -> tuple:
+    """Build a result section as (markdown, copyable plain text); empty strings if it has no data."""
+    markdown, text = [], []
+    for field in fields:
+        value = getattr(result, field)
+        if isinstance(value, list):
+            numbered = [f"{i}. {item}" for i, item in enumerate(value, 1)]
+            markdown.extend(numbered)
+            text.extend(numbered)
+        elif value or field == "job_title":
+            label = PARTIAL_FIELD_LABELS[field]
+            markdown.append(f"**{label}:** {value}" if labeled else str(value))
+            text.append(f"{label}: {value}" if labeled else str(value))
+    # Two trailing spaces keep labeled values on separate lines
+    return ("  \n" if labeled else "\n").join(markdown), "\n".join(text)
+
+
+@st.fragment
+def results_panel(result) -> None:
+    """Summary, expand/collapse controls and result sections.
+
+    Runs as a fragment: its buttons rerun only this panel, and section text
+    is memoized per result (see rendered()), so interactions do not rebuild the page.
+    """
+    # Summary Stats Card
+    st.markdown("### 📈 Summary")
+    stats_col1, stats_col2, stats_col3, stats_col4 = st.columns(4)
+    with stats_col1:
+        st.metric("Skills", len(result.skills))
+    with stats_col2:
+        st.metric("Requirements", len(result.required_criteria))
+    with stats_col3:
+        st.metric("Responsibilities", len(result.scope_of_responsibilities))
+    with stats_col4:
+        st.metric("Benefits", len(result.benefits))
+    
+    st.markdown("---")
+    
+    # Expand/Collapse All Controls
+    control_col1, control_col2 = st.columns([1, 1])
+    with control_col1:
+        expand_all = st.button("📖 Expand All", use_container_width=True)
+    with control_col2:
+        collapse_all = st.button("📕 Collapse All", use_container_width=True)
+    
+    if expand_all:
+        st.session_state.expanded_sections = {key: True for key in range(len(RESULT_SECTIONS))}
+    if collapse_all:
+        st.session_state.expanded_sections = {key: False for key in range(len(RESULT_SECTIONS))}
+    
+    for index, title, copy_key, fields, labeled in RESULT_SECTIONS:
+        markdown, text = rendered(
+            result, f"section:{index}", lambda fields=fields, labeled=labeled: render_section(result, fields, labeled)
+        )
+        if not markdown:
+            continue
+        with st.expander(title, expanded=st.session_state.expanded_sections.get(index, index == 0)):
+            st.markdown(markdown)
+            # Copy button - show text in code block for easy selection
+            if st.button("📋 Show to Copy", key=copy_key, use_container_width=True):
+                st.code(text, language=None)
+                st.success("Select the text above and copy (Ctrl+C / Cmd+C)")
+
+
+@st.fragment
+def download_panel(result) -> None:
+    """TXT and JSON download buttons, with payloads generated once per result."""
+    st.subheader("📥 Download Results")
+    # One timestamp per result keeps file names (and so the download widgets) stable across reruns
+    stamp = rendered(result, "timestamp", lambda: datetime.now().strftime('%Y%m%d_%H%M%S'))
+    
+    download_col1, download_col2 = st.columns(2)
+    
+    with download_col1:
+        try:
+            st.download_button(
+                label="📄 Download as TXT",
+                data=rendered(result, "txt", lambda: generate_txt_file(result)),
+                file_name=f"job_extraction_{stamp}.txt",
+                mime="text/plain",
+                use_container_width=True
+            )
+        except Exception as e:
+            st.error(f"Error generating TXT file: {e}")
+    
+    with download_col2:
+        try:
+            st.download_button(
+                label="📦 Download as JSON",
+                data=rendered(result, "json", lambda: generate_json_file(result)),
+                file_name=f"job_extraction_{stamp}.json",
+                mime="application/json",
+                use_container_width=True
+            )
+        except Exception as e:
+            st.error(f"Error generating JSON file: {e}")
+
+
+# Columns of the bulk results table: (field, column label)
+BULK_COLUMNS = [
+    ("job_title", "Job Title"),
+    ("company_name", "Company"),
+    ("seniority_level", "Seniority"),
+    ("location", "Location"),
+    ("work_type", "Work Type"),
+    ("salary", "Salary"),
+    ("skills", "Skills"),
+]
+BULK_PAGE_SIZE = 25
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def bulk_export(batch_id: str, done: int) -> str:
+    """Combined JSONL of a batch's results; `done` is part of the cache key so new results refresh it."""
+    return get_bulk_manager().get(batch_id).export()
+
+
+def bulk_start_panel(api_key: str) -> None:
+    """Upload form that queues a file of postings as a new background batch."""
+    uploaded = st.file_uploader(
+        "Postings file",
+        type=list(UPLOAD_FORMATS) + ["json"],
+        help="CSV or JSONL with one posting per record, or a ZIP of CSV/JSONL/TXT files (one posting per TXT file)"
+    )
+    field_col1, field_col2, field_col3 = st.columns(3)
+    with field_col1:
+        text_field = st.text_input("Description field", value="description")
+    with field_col2:
+        id_field = st.text_input("ID field", value="id")
+    with field_col3:
+        workers = st.slider("Parallel workers", min_value=1, max_value=8, value=4,
+                            help="Each worker keeps up to 8 requests in flight")
+    
+    if st.button("🚀 Start Batch", type="primary", use_container_width=True, disabled=uploaded is None):
+        if not validate_api_key(api_key):
+            st.error("⚠️ Please enter a valid Gemini API key")
+            return
+        try:
+            job, added, skipped = get_bulk_manager().create(
+                read_upload(uploaded.name, uploaded, text_field, id_field)
+            )
+        except Exception as e:
+            st.error(f"❌ Could not read {uploaded.name}: {e}")
+            return
+        if not added:
+            st.error("⚠️ No postings with a description of at least 50 characters were found")
+            return
+        # The per-key extractor is shared with single extractions, keeping one client and connection pool
+        extractor = get_extractor(api_key)
+        job.start(lambda: extractor, workers=workers)
+        st.session_state.bulk_batch_id = job.batch_id
+        st.session_state.bulk_workers = workers
+        st.query_params["batch"] = job.batch_id
+        if skipped:
+            st.toast(f"Skipped {skipped} postings shorter than 50 characters")
+        st.rerun()
+
+
+def bulk_batch_panel(batch_id: str, live: bool) -> None:
+    """Progress, throughput, paginated results and the combined download for one batch.
+
+    Run as a fragment that refreshes itself every few seconds while the
+    batch is running (`live`), and only on its own widgets afterwards.
+    """
+    job = get_bulk_manager().get(batch_id)
+    progress = job.progress()
+    if live and not progress.running:
+        # Finished: rerun the whole page once to stop the periodic refresh
+        st.rerun()
+    
+    st.caption(f"Batch `{batch_id}` - reload this page or open its URL to reconnect while it runs.")
+    st.progress(
+        progress.finished / progress.total if progress.total else 1.0,
+        text=f"{progress.finished} of {progress.total} postings processed"
+    )
+    metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
+    metric_col1.metric("Done", progress.counts["done"])
+    metric_col2.metric("Failed", progress.counts["failed"])
+    metric_col3.metric("Remaining", progress.counts["pending"] + progress.counts["in_flight"])
+    metric_col4.metric("Throughput", f"{progress.throughput * 60:.1f}/min")
+    if progress.error:
+        st.error(f"❌ Batch stopped: {progress.error}")
+    
+    done = progress.counts["done"]
+    if done:
+        pages = (done + BULK_PAGE_SIZE - 1) // BULK_PAGE_SIZE
+        page = st.number_input("Page", min_value=1, max_value=pages, value=1, key=f"bulk_page_{batch_id}")
+        rows = []
+        for posting_id, info in job.results(limit=BULK_PAGE_SIZE, offset=(page - 1) * BULK_PAGE_SIZE):
+            row = {"ID": posting_id}
+            for field, label in BULK_COLUMNS:
+                value = getattr(info, field)
+                row[label] = ", ".join(value) if isinstance(value, list) else value
+            rows.append(row)
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+        st.caption(f"Page {page} of {pages}")
+    
+    if progress.counts["failed"]:
+        with st.expander(f"⚠️ {progress.counts['failed']} failed postings"):
+            st.dataframe(
+                [{"ID": posting_id, "Attempts": attempts, "Error": reason}
+                 for posting_id, attempts, reason in job.failures()],
+                use_container_width=True, hide_index=True
+            )
+    
+    action_col1, action_col2 = st.columns(2)
+    with action_col1:
+        if progress.running:
+            if st.button("⏹️ Stop", use_container_width=True):
+                job.stop()
+        elif done:
+            st.download_button(
+                label="📦 Download All (JSONL)",
+                data=bulk_export(batch_id, done),
+                file_name=f"job_extractions_{batch_id}.jsonl",
+                mime="application/json",
+                use_container_width=True
+            )
+    with action_col2:
+        if not progress.running and progress.counts["pending"]:
+            if st.button("▶️ Resume", use_container_width=True):
+                if validate_api_key(st.session_state.api_key):
+                    extractor = get_extractor(st.session_state.api_key)
+                    job.start(lambda: extractor, workers=st.session_state.get("bulk_workers", 4))
+                    st.rerun()
+                else:
+                    st.error("⚠️ Please enter a valid Gemini API key")
+        if st.button("➕ New Batch", use_container_width=True,
+                     help="Detach from this batch; a running batch keeps going in the background"):
+            st.session_state.bulk_batch_id = None
+            st.query_params.pop("batch", None)
+            st.rerun()
+
+
 # Sample job description for demo
 SAMPLE_JOB_DESCRIPTION = """We are looking for a Senior Software Engineer to join our growing team.
 
@@ -55,6 +390,9 @@ if 'job_description_text' not in st.session_state:
     st.session_state.job_description_text = ""
 if 'expanded_sections' not in st.session_state:
     st.session_state.expanded_sections = {}
+if 'bulk_batch_id' not in st.session_state:
+    # Reconnect to the batch named in the URL, e.g. after a reload
+    st.session_state.bulk_batch_id = st.query_params.get("batch")
 
 # Header
 st.title("🔍 JobSpecMiner")
@@ -122,6 +460,11 @@ with col1:
         type="primary",
         use_container_width=True
     )
+    stream_results = st.checkbox(
+        "⚡ Stream results as they arrive",
+        value=True,
+        help="Show fields as soon as the model produces them instead of waiting for the full response"
+    )
 
 with col2:
     st.header("📊 Results")
@@ -148,8 +491,24 @@ with col2:
             # Process extraction
             with st.spinner("🔄 Extracting information from job description..."):
                 try:
-                    extractor = JobExtractor(api_key=api_key)
-                    result = extractor.extract_information(job_description)
+                    extractor = get_extractor(api_key)
+                    if stream_results:
+                        # Render fields progressively as the response streams in
+                        live_view = st.empty()
+                        partial = {}
+                        result = None
+                        for event in extractor.extract_information_stream(job_description):
+                            if event.kind == "item":
+                                partial.setdefault(event.field, []).append(event.value)
+                            elif event.kind == "field":
+                                partial[event.field] = event.value
+                            else:
+                                result = event.value
+                                continue
+                            live_view.markdown(render_partial_result(partial))
+                        live_view.empty()
+                    else:
+                        result = extractor.extract_information(job_description)
                     
                     if result:
                         st.session_state.extraction_result = result
@@ -165,196 +524,25 @@ with col2:
                     st.session_state.extraction_error = f"Error: {str(e)}"
                     st.error(f"❌ Error: {str(e)}")
     
-    # Display Results
+    # Display Results (each panel reruns on its own when its widgets are used)
     if st.session_state.extraction_result:
         result = st.session_state.extraction_result
-        
-        # Summary Stats Card
-        st.markdown("### 📈 Summary")
-        stats_col1, stats_col2, stats_col3, stats_col4 = st.columns(4)
-        
-        with stats_col1:
-            st.metric("Skills", len(result.skills) if result.skills else 0)
-        with stats_col2:
-            st.metric("Requirements", len(result.required_criteria) if result.required_criteria else 0)
-        with stats_col3:
-            st.metric("Responsibilities", len(result.scope_of_responsibilities) if result.scope_of_responsibilities else 0)
-        with stats_col4:
-            st.metric("Benefits", len(result.benefits) if result.benefits else 0)
-        
+        results_panel(result)
         st.markdown("---")
-        
-        # Expand/Collapse All Controls
-        control_col1, control_col2 = st.columns([1, 1])
-        with control_col1:
-            expand_all = st.button("📖 Expand All", use_container_width=True)
-        with control_col2:
-            collapse_all = st.button("📕 Collapse All", use_container_width=True)
-        
-        if expand_all:
-            st.session_state.expanded_sections = {key: True for key in range(10)}
-        if collapse_all:
-            st.session_state.expanded_sections = {key: False for key in range(10)}
-        
-        # Basic Information
-        with st.expander("📋 Basic Information", expanded=st.session_state.expanded_sections.get(0, True)):
-            info_text = f"Job Title: {result.job_title}\n"
-            if result.company_name:
-                info_text += f"Company: {result.company_name}\n"
-            if result.department:
-                info_text += f"Department: {result.department}\n"
-            if result.seniority_level:
-                info_text += f"Seniority Level: {result.seniority_level}\n"
-            if result.years_of_experience:
-                info_text += f"Years of Experience: {result.years_of_experience}"
-            
-            st.write(f"**Job Title:** {result.job_title}")
-            if result.company_name:
-                st.write(f"**Company:** {result.company_name}")
-            if result.department:
-                st.write(f"**Department:** {result.department}")
-            if result.seniority_level:
-                st.write(f"**Seniority Level:** {result.seniority_level}")
-            if result.years_of_experience:
-                st.write(f"**Years of Experience:** {result.years_of_experience}")
-            
-            # Copy button - show text in code block for easy selection
-            if st.button("📋 Show to Copy", key="copy_basic", use_container_width=True):
-                st.code(info_text, language=None)
-                st.success("Select the text above and copy (Ctrl+C / Cmd+C)")
-        
-        # Work Arrangement
-        if result.work_type or result.location:
-            with st.expander("📍 Work Arrangement", expanded=st.session_state.expanded_sections.get(1, False)):
-                work_text = ""
-                if result.work_type:
-                    st.write(f"**Work Type:** {result.work_type}")
-                    work_text += f"Work Type: {result.work_type}\n"
-                if result.location:
-                    st.write(f"**Location:** {result.location}")
-                    work_text += f"Location: {result.location}"
-                
-                if st.button("📋 Show to Copy", key="copy_work", use_container_width=True):
-                    st.code(work_text, language=None)
-                    st.success("Select the text above and copy (Ctrl+C / Cmd+C)")
-        
-        # Compensation
-        if result.salary:
-            with st.expander("💰 Compensation", expanded=st.session_state.expanded_sections.get(2, False)):
-                st.write(f"**Salary:** {result.salary}")
-                if st.button("📋 Copy", key="copy_salary", use_container_width=True):
-                    try:
-                        pyperclip.copy(f"Salary: {result.salary}")
-                        st.success("Copied to clipboard!")
-                    except:
-                        st.info("Copy functionality requires pyperclip. Install with: pip install pyperclip")
-        
-        # Education
-        if result.education_requirements:
-            with st.expander("🎓 Education Requirements", expanded=st.session_state.expanded_sections.get(3, False)):
-                st.write(result.education_requirements)
-                if st.button("📋 Show to Copy", key="copy_education", use_container_width=True):
-                    st.code(result.education_requirements, language=None)
-                    st.success("Select the text above and copy (Ctrl+C / Cmd+C)")
-        
-        # Required Criteria
-        if result.required_criteria:
-            with st.expander("✅ Required Criteria", expanded=st.session_state.expanded_sections.get(4, False)):
-                criteria_text = "\n".join([f"{i}. {criterion}" for i, criterion in enumerate(result.required_criteria, 1)])
-                for i, criterion in enumerate(result.required_criteria, 1):
-                    st.write(f"{i}. {criterion}")
-                
-                if st.button("📋 Show to Copy", key="copy_criteria", use_container_width=True):
-                    st.code(criteria_text, language=None)
-                    st.success("Select the text above and copy (Ctrl+C / Cmd+C)")
-        
-        # Preferred Qualifications
-        if result.preferred_qualifications:
-            with st.expander("⭐ Preferred Qualifications", expanded=st.session_state.expanded_sections.get(5, False)):
-                pref_text = "\n".join([f"{i}. {qual}" for i, qual in enumerate(result.preferred_qualifications, 1)])
-                for i, qual in enumerate(result.preferred_qualifications, 1):
-                    st.write(f"{i}. {qual}")
-                
-                if st.button("📋 Show to Copy", key="copy_pref", use_container_width=True):
-                    st.code(pref_text, language=None)
-                    st.success("Select the text above and copy (Ctrl+C / Cmd+C)")
-        
-        # Skills
-        if result.skills:
-            with st.expander("🛠️ Skills & Technologies", expanded=st.session_state.expanded_sections.get(6, False)):
-                skills_text = "\n".join([f"{i}. {skill}" for i, skill in enumerate(result.skills, 1)])
-                for i, skill in enumerate(result.skills, 1):
-                    st.write(f"{i}. {skill}")
-                
-                if st.button("📋 Show to Copy", key="copy_skills", use_container_width=True):
-                    st.code(skills_text, language=None)
-                    st.success("Select the text above and copy (Ctrl+C / Cmd+C)")
-        
-        # Responsibilities
-        if result.scope_of_responsibilities:
-            with st.expander("📋 Scope of Responsibilities", expanded=st.session_state.expanded_sections.get(7, False)):
-                resp_text = "\n".join([f"{i}. {responsibility}" for i, responsibility in enumerate(result.scope_of_responsibilities, 1)])
-                for i, responsibility in enumerate(result.scope_of_responsibilities, 1):
-                    st.write(f"{i}. {responsibility}")
-                
-                if st.button("📋 Show to Copy", key="copy_resp", use_container_width=True):
-                    st.code(resp_text, language=None)
-                    st.success("Select the text above and copy (Ctrl+C / Cmd+C)")
-        
-        # Benefits
-        if result.benefits:
-            with st.expander("🎁 Benefits & Perks", expanded=st.session_state.expanded_sections.get(8, False)):
-                benefits_text = "\n".join([f"{i}. {benefit}" for i, benefit in enumerate(result.benefits, 1)])
-                for i, benefit in enumerate(result.benefits, 1):
-                    st.write(f"{i}. {benefit}")
-                
-                if st.button("📋 Show to Copy", key="copy_benefits", use_container_width=True):
-                    st.code(benefits_text, language=None)
-                    st.success("Select the text above and copy (Ctrl+C / Cmd+C)")
-        
-        # Additional Information
-        if result.additional_info:
-            with st.expander("ℹ️ Additional Information", expanded=st.session_state.expanded_sections.get(9, False)):
-                st.write(result.additional_info)
-                if st.button("📋 Show to Copy", key="copy_additional", use_container_width=True):
-                    st.code(result.additional_info, language=None)
-                    st.success("Select the text above and copy (Ctrl+C / Cmd+C)")
-        
-        st.markdown("---")
-        
-        # Download Section
-        st.subheader("📥 Download Results")
-        
-        download_col1, download_col2 = st.columns(2)
-        
-        with download_col1:
-            try:
-                txt_content = generate_txt_file(result)
-                st.download_button(
-                    label="📄 Download as TXT",
-                    data=txt_content,
-                    file_name=f"job_extraction_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
-                    mime="text/plain",
-                    use_container_width=True
-                )
-            except Exception as e:
-                st.error(f"Error generating TXT file: {e}")
-        
-        with download_col2:
-            try:
-                json_content = generate_json_file(result)
-                st.download_button(
-                    label="📦 Download as JSON",
-                    data=json_content,
-                    file_name=f"job_extraction_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                    mime="application/json",
-                    use_container_width=True
-                )
-            except Exception as e:
-                st.error(f"Error generating JSON file: {e}")
+        download_panel(result)
     else:
         st.info("👆 Enter your API key and job description, then click 'Extract Information' to get started.")
 
+# Bulk upload
+st.markdown("---")
+st.header("📦 Bulk Upload")
+bulk_job = get_bulk_manager().get(st.session_state.bulk_batch_id) if st.session_state.bulk_batch_id else None
+if bulk_job is None:
+    bulk_start_panel(st.session_state.api_key)
+else:
+    live = bulk_job.running
+    st.fragment(bulk_batch_panel, run_every=2 if live else None)(bulk_job.batch_id, live)
+
 # Footer
 st.markdown("---")
 st.markdown(
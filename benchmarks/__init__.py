@@ -0,0 +1 @@
+"""Benchmarks for JobSpecMiner extraction paths."""
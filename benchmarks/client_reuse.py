@@ -0,0 +1,88 @@
+"""Measure per-extraction latency with a fresh JobExtractor per request versus one reused extractor.
+
+Usage:
+    GEMINI_API_KEY=... python -m benchmarks.client_reuse [--runs 10]
+    python -m benchmarks.client_reuse --offline [--runs 50]
+
+A fresh extractor pays for genai.Client construction and a new HTTPS
+connection (TLS handshake) on every request, which is what the web app did
+before extractors were cached per API key. --offline skips the API and only
+measures client construction plus request preparation, so it leaves out the
+connection setup saved by keep-alive.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.field_subsets import SAMPLE_POSTING
+from src.job_extractor import JobExtractor
+from src.models import ALL_FIELDS
+
+
+def measure(make_extractor: Callable[[], JobExtractor], posting: str, runs: int, offline: bool) -> List[float]:
+    """Latency of `runs` extractions, each using the extractor returned by make_extractor()."""
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        extractor = make_extractor()
+        if offline:
+            extractor._request(posting, ALL_FIELDS, None)
+        else:
+            extractor.generate(posting)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Compare fresh and reused extractors and print the per-extraction saving."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Extractions per variant")
+    parser.add_argument("--model", default="gemini-2.5-flash", help="Gemini model name")
+    parser.add_argument("--offline", action="store_true", help="Measure construction and request preparation only")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key and not args.offline:
+        print("Error: set GEMINI_API_KEY to run this benchmark (or use --offline)", file=sys.stderr)
+        return 2
+    api_key = api_key or "offline-benchmark-key"
+
+    def fresh() -> JobExtractor:
+        return JobExtractor(api_key=api_key, model_name=args.model)
+
+    shared = fresh()
+    # Warm up the shared extractor's connection and schema so both variants start equal
+    measure(lambda: shared, SAMPLE_POSTING, 1, args.offline)
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, make_extractor in (("fresh", fresh), ("reused", lambda: shared)):
+        latencies = measure(make_extractor, SAMPLE_POSTING, args.runs, args.offline)
+        results[name] = {
+            "median_ms": statistics.median(latencies) * 1e3,
+            "mean_ms": statistics.mean(latencies) * 1e3,
+            "max_ms": max(latencies) * 1e3,
+        }
+    saving = results["fresh"]["median_ms"] - results["reused"]["median_ms"]
+    results["saving"] = {
+        "median_ms": saving,
+        "ratio": saving / results["fresh"]["median_ms"] if results["fresh"]["median_ms"] else 0.0,
+    }
+
+    print(f"{'variant':<10}{'median':>12}{'mean':>12}{'max':>12}")
+    for name in ("fresh", "reused"):
+        result = results[name]
+        print(f"{name:<10}{result['median_ms']:>10.2f}ms{result['mean_ms']:>10.2f}ms{result['max_ms']:>10.2f}ms")
+    print(f"Reuse saves {saving:.2f} ms per extraction ({results['saving']['ratio']:.1%} of the median)")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"offline": args.offline, "runs": args.runs, "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
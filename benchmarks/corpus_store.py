@@ -0,0 +1,109 @@
+"""Compare bytes per record of the mmap corpus store with in-memory JobInformation instances.
+
+Usage:
+    python -m benchmarks.corpus_store [--records 200000] [--output results.json]
+
+The model baseline is the tracemalloc size of JobInformation objects
+parsed from JSONL, the way results are read back from a queue, cache or
+output file, so every record holds its own copy of each string. The store
+is the file CorpusWriter writes, which Corpus maps without loading.
+Also reported: write throughput, open time, random-access and full-scan
+materialization rates, and value_counts() against a Counter over the
+model instances. Synthetic list items repeat more than in real postings,
+so compare the per-field breakdown for the fields that matter to you.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from typing import Optional
+
+from benchmarks.offline import synthetic_job_info
+from src.corpus import Corpus, CorpusWriter
+from src.models import JobInformation
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Build a corpus file from synthetic results and print its size and access costs."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=200000, help="Synthetic results to store")
+    parser.add_argument("--lookups", type=int, default=10000, help="Random records materialized")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    lines = [synthetic_job_info(rng, number).model_dump_json() for number in range(args.records)]
+    jsonl_bytes = sum(len(line.encode("utf-8")) + 1 for line in lines)
+
+    tracemalloc.start()
+    models = [JobInformation.model_validate_json(line) for line in lines]
+    model_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del lines
+
+    results = {"records": args.records, "jsonl_bytes_per_record": jsonl_bytes / args.records}
+    results["model_bytes_per_record"] = model_bytes / args.records
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "results.corpus")
+        start = time.perf_counter()
+        with CorpusWriter(path) as writer:
+            for number, job_info in enumerate(models):
+                writer.write(str(number), job_info)
+        results["write_records_per_s"] = args.records / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        corpus = Corpus(path)
+        results["open_ms"] = (time.perf_counter() - start) * 1e3
+        stats = corpus.stats()
+        results["corpus_bytes_per_record"] = stats["bytes_per_record"]
+        results["field_bytes_per_record"] = {name: size / args.records for name, size in stats["field_bytes"].items()}
+
+        rows = [rng.randrange(args.records) for _ in range(args.lookups)]
+        start = time.perf_counter()
+        for row in rows:
+            corpus[row]
+        results["random_access_per_s"] = args.lookups / (time.perf_counter() - start)
+        assert all(corpus[row] == models[row] for row in rows[:100])
+
+        start = time.perf_counter()
+        for _ in corpus:
+            pass
+        results["scan_records_per_s"] = args.records / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        corpus.value_counts("skills", 10)
+        results["value_counts_ms"] = (time.perf_counter() - start) * 1e3
+        start = time.perf_counter()
+        Counter(skill for job_info in models for skill in job_info.skills).most_common(10)
+        results["model_counter_ms"] = (time.perf_counter() - start) * 1e3
+        corpus.close()
+
+    print(f"{args.records} records")
+    print(
+        f"Bytes/record: models {results['model_bytes_per_record']:.0f} | JSONL {results['jsonl_bytes_per_record']:.0f}"
+        f" | corpus {results['corpus_bytes_per_record']:.0f}"
+        f" ({results['model_bytes_per_record'] / results['corpus_bytes_per_record']:.0f}x smaller than models)"
+    )
+    print(
+        "Corpus bytes/record by field: "
+        + ", ".join(f"{name} {size:.1f}" for name, size in results["field_bytes_per_record"].items())
+    )
+    print(
+        f"Write {results['write_records_per_s']:.0f} records/s | open {results['open_ms']:.1f} ms | "
+        f"random access {results['random_access_per_s']:.0f} records/s | full scan {results['scan_records_per_s']:.0f} records/s"
+    )
+    print(f"Top skills: value_counts {results['value_counts_ms']:.1f} ms vs Counter over models {results['model_counter_ms']:.1f} ms")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
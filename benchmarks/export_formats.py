@@ -0,0 +1,125 @@
+"""Compare write throughput, file size and memory of the export formats against per-record JSON.
+
+Usage:
+    python -m benchmarks.export_formats [--records 200000] [--row-group-size 10000] [--output results.json]
+
+Every format writes the same synthetic JobInformation records to a
+temporary file. "json" is the existing per-record path (generate_json_file
+for each result, one line each), the others are the streaming writers in
+src/export.py. Peak memory is the tracemalloc peak of a separate pass over
+--memory-sample records plus the peak of Arrow's memory pool, so it shows
+whether a writer holds more than one row group at a time.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.offline import synthetic_job_info
+from src.export import open_result_writer
+from src.file_generator import generate_json_file
+from src.models import JobInformation
+
+
+FORMATS = ("json", "csv", "parquet", "arrow")
+
+
+def write_json(path: str, records: List[JobInformation], row_group_size: int) -> None:
+    """The per-record baseline: one generate_json_file() string per result."""
+    with open(path, "w", encoding="utf-8") as f:
+        for number, job_info in enumerate(records):
+            f.write(f'{{"id": "{number}", "job_information": {generate_json_file(job_info, indent=None)}}}\n')
+
+
+def streaming_writer(output_format: str) -> Callable[[str, List[JobInformation], int], None]:
+    """Write function for one of the streaming export formats."""
+    def write(path: str, records: List[JobInformation], row_group_size: int) -> None:
+        with open_result_writer(path, output_format, row_group_size) as writer:
+            for number, job_info in enumerate(records):
+                writer.write(str(number), job_info)
+    return write
+
+
+def arrow_pool_peak() -> int:
+    """Peak bytes allocated from Arrow's memory pool so far, or 0 without pyarrow."""
+    try:
+        import pyarrow
+    except ImportError:
+        return 0
+    return pyarrow.default_memory_pool().max_memory() or 0
+
+
+def bench_format(
+    output_format: str,
+    records: List[JobInformation],
+    memory_sample: int,
+    row_group_size: int,
+    directory: str,
+) -> Dict[str, float]:
+    """Throughput, file size and peak memory of one format."""
+    write = write_json if output_format == "json" else streaming_writer(output_format)
+    path = os.path.join(directory, f"results.{output_format}")
+
+    start = time.perf_counter()
+    write(path, records, row_group_size)
+    elapsed = time.perf_counter() - start
+    size = os.path.getsize(path)
+
+    tracemalloc.start()
+    write(path, records[:memory_sample], row_group_size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "records": len(records),
+        "throughput_per_s": len(records) / elapsed if elapsed > 0 else 0.0,
+        "file_bytes": size,
+        "bytes_per_record": size / len(records),
+        "peak_memory_mb": peak / 2**20,
+    }
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Write the same records in every format and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=200000, help="Synthetic results to write")
+    parser.add_argument("--row-group-size", type=int, default=10000, help="Records per row group")
+    parser.add_argument("--memory-sample", type=int, default=50000, help="Records traced for peak memory")
+    parser.add_argument("--only", action="append", choices=FORMATS, help="Run only this format (repeatable)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    records = [synthetic_job_info(rng, number) for number in range(args.records)]
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for output_format in args.only or FORMATS:
+            try:
+                results[output_format] = bench_format(
+                    output_format, records, args.memory_sample, args.row_group_size, directory
+                )
+            except ImportError as e:
+                print(f"Skipping {output_format}: {e}", file=sys.stderr)
+
+    baseline = results.get("json")
+    print(f"{'format':<10}{'records/s':>12}{'MB':>10}{'B/record':>10}{'vs json':>9}{'peak MB':>9}")
+    for output_format, result in results.items():
+        ratio = result["file_bytes"] / baseline["file_bytes"] if baseline else 1.0
+        print(
+            f"{output_format:<10}{result['throughput_per_s']:>12.0f}{result['file_bytes'] / 2**20:>10.1f}"
+            f"{result['bytes_per_record']:>10.1f}{ratio:>8.1%}{result['peak_memory_mb']:>9.1f}"
+        )
+    print(f"Arrow memory pool peak: {arrow_pool_peak() / 2**20:.1f} MB")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"records": args.records, "row_group_size": args.row_group_size, "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""Measure FacetIndex build rate, memory and query latency on a synthetic corpus.
+
+Usage:
+    python -m benchmarks.facet_index [--postings 1000000] [--queries 200]
+    python -m benchmarks.facet_index --postings 5000000
+
+Facet values follow Zipf-like distributions over realistic vocabulary
+sizes (thousands of skills and locations, tens of thousands of companies),
+so common terms are dense enough to be bitmaps and rare ones stay sparse.
+Each query kind is warmed up, then run --queries times with random values;
+latency covers the whole search() call including the first page of IDs and
+facet counts.
+"""
+import argparse
+import itertools
+import json
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from src.models import JobInformation
+from src.search import FacetIndex
+
+
+LEVELS = ["Junior", "Mid-level", "Senior", "Staff", "Principal", "Lead", "Intern"]
+WORK_TYPES = ["Remote", "Hybrid", "On-site"]
+TITLES = ["Software Engineer", "Data Scientist", "Product Manager", "DevOps Engineer", "Designer", "Analyst"]
+
+
+def zipf_weights(count: int) -> List[float]:
+    """Cumulative Zipf weights (1/rank) for random.choices(cum_weights=...)."""
+    return list(itertools.accumulate(1 / (rank + 1) for rank in range(count)))
+
+
+def zipf_choice(rng: random.Random, values: List[str], cum_weights: List[float], k: int = 1) -> List[str]:
+    """Draw k distinct values with Zipf-like weights."""
+    chosen = set()
+    while len(chosen) < k:
+        chosen.update(rng.choices(values, cum_weights=cum_weights, k=k - len(chosen)))
+    return list(chosen)
+
+
+def synthetic_corpus(rng: random.Random, count: int, skills: int, locations: int, companies: int):
+    """Yield (posting_id, JobInformation) pairs with skewed facet distributions."""
+    skill_names = ["Python", "Kubernetes", "SQL", "AWS", "Docker", "Java", "Go", "React"]
+    skill_names += [f"skill{i}" for i in range(skills - len(skill_names))]
+    location_names = ["Berlin", "London", "New York, NY", "Remote"] + [f"City {i}" for i in range(locations - 4)]
+    company_names = [f"Company {i}" for i in range(companies)]
+    skill_weights = zipf_weights(len(skill_names))
+    location_weights = zipf_weights(len(location_names))
+    company_weights = zipf_weights(len(company_names))
+    for number in range(count):
+        skill_list = zipf_choice(rng, skill_names, skill_weights, rng.randrange(3, 10))
+        yield str(number), JobInformation.model_construct(
+            job_title=f"{rng.choice(LEVELS)} {rng.choice(TITLES)}",
+            seniority_level=rng.choice(LEVELS),
+            work_type=rng.choice(WORK_TYPES),
+            location=zipf_choice(rng, location_names, location_weights)[0],
+            company_name=zipf_choice(rng, company_names, company_weights)[0],
+            skills=skill_list,
+            required_criteria=[f"Experience with {skill}" for skill in skill_list[:3]],
+            preferred_qualifications=[],
+            scope_of_responsibilities=["Build and operate services"],
+            benefits=[],
+            years_of_experience=None,
+            salary=None,
+            department=None,
+            education_requirements=None,
+            additional_info=None,
+        )
+
+
+def query_kinds(rng: random.Random) -> Dict[str, Callable[[FacetIndex], object]]:
+    """Named query generators; each call runs one search with random values."""
+    skills = ["Python", "Kubernetes", "SQL", "AWS", "Docker", "Java", "Go", "React", "skill40", "skill900"]
+    locations = ["Berlin", "London", "New York, NY", "Remote", "City 25", "City 700"]
+    return {
+        "senior_remote_skill_city": lambda index: index.search({
+            "seniority_level": "Senior",
+            "work_type": "Remote",
+            "skills": [rng.choice(skills)],
+            "location": rng.choice(locations),
+        }),
+        "two_skills_with_facets": lambda index: index.search(
+            {"skills": rng.sample(skills, 2)}, facets=["company_name", "location"]
+        ),
+        "broad_with_facets": lambda index: index.search(
+            {"work_type": rng.choice(WORK_TYPES)}, facets=["seniority_level", "skills"]
+        ),
+        "text_and_facet": lambda index: index.search(
+            {"seniority_level": rng.choice(LEVELS)}, text=f"{rng.choice(TITLES)} {rng.choice(skills)}"
+        ),
+        "rare_company": lambda index: index.search({"company_name": f"Company {rng.randrange(1000, 20000)}"}),
+        "deep_page": lambda index: index.search({"work_type": "Hybrid"}, offset=rng.randrange(10000, 100000)),
+    }
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Build an index, time query kinds and print latency percentiles."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--postings", type=int, default=1000000, help="Postings to index")
+    parser.add_argument("--queries", type=int, default=200, help="Runs of each query kind")
+    parser.add_argument("--skills", type=int, default=5000, help="Distinct skills")
+    parser.add_argument("--locations", type=int, default=5000, help="Distinct locations")
+    parser.add_argument("--companies", type=int, default=50000, help="Distinct companies")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args(argv)
+    rng = random.Random(args.seed)
+
+    index = FacetIndex()
+    start = time.perf_counter()
+    index.add_many(synthetic_corpus(rng, args.postings, args.skills, args.locations, args.companies))
+    build_seconds = time.perf_counter() - start
+    print(f"Indexed {args.postings} postings in {build_seconds:.1f}s ({args.postings / build_seconds:.0f}/s)")
+
+    results = {}
+    print(f"{'query':<28}{'p50':>10}{'p95':>10}{'max':>10}{'matches':>12}")
+    for name, run in query_kinds(rng).items():
+        # The first use of a term moves its staged appends into numpy and builds its bitmap
+        for _ in range(min(args.queries, 20)):
+            run(index)
+        latencies, matches = [], []
+        for _ in range(args.queries):
+            begin = time.perf_counter()
+            result = run(index)
+            latencies.append(time.perf_counter() - begin)
+            matches.append(result.total)
+        latencies.sort()
+        results[name] = {
+            "p50_ms": statistics.median(latencies) * 1e3,
+            "p95_ms": latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))] * 1e3,
+            "max_ms": latencies[-1] * 1e3,
+            "median_matches": statistics.median(matches),
+        }
+        result = results[name]
+        print(
+            f"{name:<28}{result['p50_ms']:>8.2f}ms{result['p95_ms']:>8.2f}ms{result['max_ms']:>8.2f}ms"
+            f"{result['median_matches']:>12.0f}"
+        )
+    stats = index.stats()
+    print(
+        f"{stats['text_terms']} text terms, {stats['facet_values']} facet values | "
+        f"posting lists {stats['posting_list_bytes'] / 2**20:.0f} MB, bitmaps {stats['bitmap_bytes'] / 2**20:.0f} MB, "
+        f"facet columns {stats['facet_column_bytes'] / 2**20:.0f} MB"
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"postings": args.postings, "build_seconds": build_seconds, "stats": stats, "queries": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""Offline stand-in for genai.Client with configurable latency, errors and responses.
+
+Pass it to JobExtractor(api_key=None, client=FakeClient(...)) to exercise
+every extraction path without network access or an API key.
+"""
+import asyncio
+import json
+import math
+import random
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+
+# Values returned for known properties; anything else gets a placeholder of its type
+SAMPLE_VALUES: Dict[str, Any] = {
+    "job_title": "Senior Software Engineer",
+    "seniority_level": "Senior",
+    "years_of_experience": "5+ years",
+    "work_type": "Hybrid",
+    "location": "San Francisco, CA",
+    "salary": "$150,000 - $200,000",
+    "required_criteria": ["5+ years of software development", "Bachelor's degree in Computer Science"],
+    "preferred_qualifications": ["Experience with Kubernetes"],
+    "scope_of_responsibilities": ["Design and build backend services", "Mentor junior engineers"],
+    "company_name": "Tech Corp",
+    "department": "Engineering",
+    "benefits": ["Health insurance", "401(k) matching", "Remote work options"],
+    "skills": ["Python", "JavaScript", "AWS", "Docker"],
+    "education_requirements": "Bachelor's degree in Computer Science or related field",
+    "additional_info": None,
+}
+
+
+class FakeAPIError(Exception):
+    """Error shaped like a genai APIError: carries an HTTP status `code`."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(f"{code} {message}")
+        self.code = code
+
+
+def _sample(schema: dict, root: dict, name: Optional[str] = None) -> Any:
+    """Build a value matching a JSON schema, preferring SAMPLE_VALUES for known names."""
+    if "$ref" in schema:
+        schema = root["$defs"][schema["$ref"].rsplit("/", 1)[-1]]
+    if name in SAMPLE_VALUES:
+        return SAMPLE_VALUES[name]
+    if "anyOf" in schema:
+        options = [option for option in schema["anyOf"] if option.get("type") != "null"]
+        return _sample(options[0], root, name) if options else None
+    kind = schema.get("type")
+    if kind == "object":
+        return {key: _sample(value, root, key) for key, value in schema.get("properties", {}).items()}
+    if kind == "array":
+        return [_sample(schema.get("items", {}), root)]
+    if kind == "integer":
+        return 0
+    if kind == "number":
+        return 0.0
+    if kind == "boolean":
+        return False
+    return "example"
+
+
+class _Models:
+    """Synchronous models namespace (client.models)."""
+
+    def __init__(self, client: "FakeClient"):
+        self._client = client
+
+    def generate_content(self, model: str, contents: str, config: dict) -> SimpleNamespace:
+        """Sleep for a sampled latency, then return (or fail with) a canned response."""
+        latency, error, text = self._client._plan(contents, config)
+        time.sleep(latency)
+        if error is not None:
+            raise error
+        return self._client._response(contents, text)
+
+    def generate_content_stream(self, model: str, contents: str, config: dict) -> Iterator[SimpleNamespace]:
+        """Yield the canned response in pieces spread over the sampled latency."""
+        latency, error, text = self._client._plan(contents, config)
+        pieces = [
+            text[start:start + self._client.stream_chunk_chars]
+            for start in range(0, len(text), self._client.stream_chunk_chars)
+        ] or [""]
+        time.sleep(latency * self._client.first_chunk_fraction)
+        if error is not None:
+            raise error
+        step = latency * (1 - self._client.first_chunk_fraction) / len(pieces)
+        for number, piece in enumerate(pieces):
+            if number:
+                time.sleep(step)
+            last = number == len(pieces) - 1
+            yield self._client._response(contents, text, piece) if last else SimpleNamespace(text=piece, usage_metadata=None)
+
+
+class _AsyncModels:
+    """Asynchronous models namespace (client.aio.models)."""
+
+    def __init__(self, client: "FakeClient"):
+        self._client = client
+
+    async def generate_content(self, model: str, contents: str, config: dict) -> SimpleNamespace:
+        """Await a sampled latency, then return (or fail with) a canned response."""
+        latency, error, text = self._client._plan(contents, config)
+        await asyncio.sleep(latency)
+        if error is not None:
+            raise error
+        return self._client._response(contents, text)
+
+
+class FakeClient:
+    """Local stand-in for genai.Client.
+
+    Latencies are drawn from a log-normal distribution with the given median
+    and shape, so the tail resembles real API latencies. Responses are
+    generated from the requested response schema (so field subsets, chunk
+    and packed requests all validate) unless canned `responses` are given.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 20.0,
+        latency_sigma: float = 0.5,
+        error_rate: float = 0.0,
+        malformed_rate: float = 0.0,
+        responses: Optional[Sequence[str]] = None,
+        stream_chunk_chars: int = 64,
+        first_chunk_fraction: float = 0.3,
+        seed: Optional[int] = 0,
+    ):
+        """Create the client.
+
+        Args:
+            latency_ms: Median simulated latency in milliseconds (0 for none)
+            latency_sigma: Log-normal shape; larger values give a heavier tail
+            error_rate: Fraction of calls failing with a retryable FakeAPIError (503/429)
+            malformed_rate: Fraction of responses truncated mid-document
+            responses: Canned response texts, cycled in order, instead of schema-generated ones
+            stream_chunk_chars: Characters per streamed piece
+            first_chunk_fraction: Share of the latency spent before the first streamed piece
+            seed: Random seed, or None for a nondeterministic run
+        """
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.responses = list(responses) if responses else None
+        self.stream_chunk_chars = stream_chunk_chars
+        self.first_chunk_fraction = first_chunk_fraction
+        self.calls = 0
+        self.errors = 0
+        self.models = _Models(self)
+        self.aio = SimpleNamespace(models=_AsyncModels(self))
+        self._random = random.Random(seed)
+        self._canned: Dict[int, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _text_for(self, config: dict, contents: str) -> str:
+        """Schema-generated response text, built once per schema object."""
+        schema = config.get("response_json_schema") or config.get("response_schema") or {}
+        entry = self._canned.get(id(schema))
+        if entry is None:
+            # Keep a reference so the id cannot be reused by another schema
+            sample = _sample(schema, schema)
+            entry = self._canned[id(schema)] = (schema, sample, json.dumps(sample))
+        _, sample, text = entry
+        if "postings" in schema.get("properties", {}):
+            # Packed request: one entry per "### Posting <ID>" line of the prompt
+            template = sample["postings"][0]
+            ids = [line.split()[-1] for line in contents.splitlines() if line.startswith("### Posting ")]
+            return json.dumps({"postings": [dict(template, posting_id=posting_id) for posting_id in ids]})
+        return text
+
+    def _plan(self, contents: str, config: dict):
+        """Sample the latency and outcome of one call.
+
+        Returns:
+            Tuple of (latency in seconds, exception to raise or None, response text)
+        """
+        with self._lock:
+            self.calls += 1
+            latency = (
+                self._random.lognormvariate(math.log(self.latency_ms / 1000), self.latency_sigma)
+                if self.latency_ms > 0 else 0.0
+            )
+            roll = self._random.random()
+            if roll < self.error_rate:
+                self.errors += 1
+                code = self._random.choice((429, 503))
+                return latency, FakeAPIError(code, "simulated failure"), ""
+            if self.responses:
+                text = self.responses[(self.calls - 1) % len(self.responses)]
+            else:
+                text = self._text_for(config, contents)
+            if roll < self.error_rate + self.malformed_rate:
+                text = text[:len(text) // 2]
+        return latency, None, text
+
+    def _response(self, contents: str, text: str, piece: Optional[str] = None) -> SimpleNamespace:
+        """Response object carrying text and usage_metadata (about 4 characters per token)."""
+        usage = SimpleNamespace(prompt_token_count=len(contents) // 4 + 1, candidates_token_count=len(text) // 4 + 1)
+        return SimpleNamespace(text=text if piece is None else piece, usage_metadata=usage)
@@ -0,0 +1,132 @@
+"""Measure latency and token savings of field-subset extraction against the live Gemini API.
+
+Usage:
+    GEMINI_API_KEY=... python -m benchmarks.field_subsets [--input posting.txt] [--runs 5]
+    python -m benchmarks.field_subsets --offline
+
+--offline skips the API and only estimates request size (prompt plus
+response schema, at about 4 characters per token).
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional
+
+from src.batch import estimate_tokens
+from src.job_extractor import JobExtractor
+from src.models import ALL_FIELDS, normalize_fields
+
+
+SAMPLE_POSTING = """We are looking for a Senior Software Engineer to join our growing team.
+
+Requirements:
+- 5+ years of experience in software development
+- Strong proficiency in Python, JavaScript, and cloud technologies
+- Experience with microservices architecture
+- Bachelor's degree in Computer Science or related field
+
+Preferred Qualifications:
+- Experience with AWS or Google Cloud Platform
+- Knowledge of machine learning frameworks
+
+Benefits:
+- Competitive salary: $120,000 - $150,000
+- Health, dental, and vision insurance
+- Flexible PTO
+
+Location: Remote (US-based preferred)
+Work Type: Remote/Hybrid"""
+
+SUBSETS: Dict[str, Optional[List[str]]] = {
+    "all": None,
+    "skills+seniority+salary": ["skills", "seniority_level", "salary"],
+    "skills": ["skills"],
+    "salary+location+work_type": ["salary", "location", "work_type"],
+    "title+company": ["job_title", "company_name"],
+}
+
+
+def measure(extractor: JobExtractor, posting: str, fields: Optional[List[str]], runs: int) -> Dict[str, float]:
+    """Run one subset `runs` times and summarize latency and token usage."""
+    requested = normalize_fields(fields)
+    latencies, prompt_tokens, output_tokens = [], [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        response = extractor.client.models.generate_content(
+            model=extractor.model_name,
+            contents=extractor._build_prompt(posting, requested),
+            config=extractor._generation_config(requested),
+        )
+        extractor._parse(response.text, requested, {})
+        latencies.append(time.perf_counter() - start)
+        usage = response.usage_metadata
+        prompt_tokens.append(usage.prompt_token_count or 0)
+        output_tokens.append(usage.candidates_token_count or 0)
+    return {
+        "fields": len(requested),
+        "latency_median_s": statistics.median(latencies),
+        "prompt_tokens": statistics.mean(prompt_tokens),
+        "output_tokens": statistics.mean(output_tokens),
+    }
+
+
+def estimate_request(posting: str, fields: Optional[List[str]]) -> Dict[str, float]:
+    """Estimate request tokens (prompt plus response schema) for a subset without calling the API."""
+    requested = normalize_fields(fields)
+    extractor = JobExtractor.__new__(JobExtractor)
+    prompt = extractor._build_prompt(posting, requested)
+    schema = json.dumps(extractor._generation_config(requested)["response_json_schema"])
+    return {"fields": len(requested), "request_tokens_estimate": estimate_tokens(prompt + schema)}
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Benchmark each subset and print savings relative to a full extraction."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input", help="Text file with a job posting (default: built-in sample)")
+    parser.add_argument("--runs", type=int, default=5, help="Requests per subset")
+    parser.add_argument("--model", default="gemini-2.5-flash", help="Gemini model name")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--offline", action="store_true", help="Only estimate request sizes, without API calls")
+    args = parser.parse_args(argv)
+    posting = open(args.input, encoding="utf-8").read() if args.input else SAMPLE_POSTING
+
+    if args.offline:
+        estimates = {name: estimate_request(posting, fields) for name, fields in SUBSETS.items()}
+        baseline_tokens = estimates["all"]["request_tokens_estimate"]
+        print(f"{'subset':<28}{'fields':>7}{'request tok':>13}{'saved':>8}")
+        for name, estimate in estimates.items():
+            estimate["request_saving"] = 1 - estimate["request_tokens_estimate"] / baseline_tokens
+            print(f"{name:<28}{estimate['fields']:>7}{estimate['request_tokens_estimate']:>13}{estimate['request_saving']:>8.0%}")
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump({"offline": True, "results": estimates}, f, indent=2)
+        return 0
+
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        print("Error: set GEMINI_API_KEY to run this benchmark", file=sys.stderr)
+        return 2
+    extractor = JobExtractor(api_key=api_key, model_name=args.model)
+
+    results = {name: measure(extractor, posting, fields, args.runs) for name, fields in SUBSETS.items()}
+    baseline = results["all"]
+    print(f"{'subset':<28}{'fields':>7}{'latency':>10}{'saved':>8}{'prompt tok':>12}{'output tok':>12}{'saved':>8}")
+    for name, result in results.items():
+        result["latency_saving"] = 1 - result["latency_median_s"] / baseline["latency_median_s"]
+        baseline_tokens = baseline["prompt_tokens"] + baseline["output_tokens"]
+        result["token_saving"] = 1 - (result["prompt_tokens"] + result["output_tokens"]) / baseline_tokens
+        print(
+            f"{name:<28}{result['fields']:>7}{result['latency_median_s']:>9.2f}s{result['latency_saving']:>8.0%}"
+            f"{result['prompt_tokens']:>12.0f}{result['output_tokens']:>12.0f}{result['token_saving']:>8.0%}"
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"model": args.model, "runs": args.runs, "total_fields": len(ALL_FIELDS), "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""Measure extraction calls and output tokens avoided by --track-changes over repeated crawls.
+
+Usage:
+    python -m benchmarks.incremental_recrawl [--postings 2000] [--crawls 5] [--latency-ms 20]
+
+Each crawl re-reads the same postings (benchmarks.offline postings with
+a "Posted N days ago" line) through cli.run_extraction with a
+ChangeTracker and a FakeClient. Between crawls, by default 70% of
+postings change only that line, 20% get one section edited (salary,
+required experience or a new responsibility), 5% get a new title and 5%
+are replaced by new postings. Every crawl is compared with sending all
+postings again, as a run without --track-changes does.
+
+Also checks that a crawl requesting only some fields keeps the other
+stored fields; exits with status 1 if any were lost.
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.fake_client import FakeClient
+from benchmarks.offline import synthetic_job_info, synthetic_posting
+from src.cli import ProgressReporter, run_extraction
+from src.job_extractor import JobExtractor
+from src.models import JobInformation
+from src.metrics import MetricsHook
+from src.tracking import ChangeTracker
+
+
+class TokenCounter(MetricsHook):
+    """Sums the output tokens of every response."""
+
+    def __init__(self):
+        self.output_tokens = 0
+        self._lock = threading.Lock()
+
+    def tokens(self, model_name: str, prompt_tokens: int, output_tokens: int) -> None:
+        with self._lock:
+            self.output_tokens += output_tokens
+
+
+def edit(rng: random.Random, text: str) -> str:
+    """Change one section of a posting the way a re-crawl might find it changed."""
+    kind = rng.randrange(3)
+    if kind == 0:
+        return text.replace("- Salary: $", f"- Salary: ${rng.randrange(1, 9)}", 1)
+    if kind == 1:
+        return text.replace("+ years of experience", f"+ years ({rng.randrange(100)}) of experience", 1)
+    return text.replace("- Collaborate with product", f"- Own service #{rng.randrange(1000)}\n- Collaborate with product", 1)
+
+
+def mutate(rng: random.Random, postings: Dict[str, str], day: int, args: argparse.Namespace, next_id: List[int]) -> Dict[str, str]:
+    """The next crawl's postings: volatile lines updated, some sections edited, some postings replaced."""
+    crawled = {}
+    for posting_id, text in postings.items():
+        text = text.replace(f"Posted {day - 1} days ago", f"Posted {day} days ago", 1)
+        roll = rng.random()
+        if roll < args.replaced:
+            posting_id = str(next_id[0])
+            text = f"Posted {day} days ago\n{synthetic_posting(rng, next_id[0])}"
+            next_id[0] += 1
+        elif roll < args.replaced + args.retitled:
+            text = text.replace(" (req #", " (updated req #", 1)
+        elif roll < args.replaced + args.retitled + args.edited:
+            text = edit(rng, text)
+        crawled[posting_id] = text
+    return crawled
+
+
+def check_partial_fields(path: str) -> List[str]:
+    """Re-crawl a posting whose salary changed requesting only salary; returns the stored fields it lost."""
+    rng = random.Random(0)
+    text = synthetic_posting(rng, 0)
+    original = synthetic_job_info(rng, 0)
+    tracker = ChangeTracker(path)
+    try:
+        tracker.commit(tracker.plan("0", text), original)
+        plan = tracker.plan("0", text.replace("- Salary: $", "- Salary: $9", 1), ["salary"])
+        tracker.commit(plan, JobInformation(job_title="", salary="$999,000"))
+        stored = tracker.get("0")
+    finally:
+        tracker.close()
+    return [
+        name for name in ("job_title", "company_name", "skills", "years_of_experience")
+        if getattr(stored, name) != getattr(original, name)
+    ]
+
+
+def crawl(
+    postings: Dict[str, str], tracker: Optional[ChangeTracker], latency_ms: float, concurrency: int
+) -> Tuple[int, int, float]:
+    """Run one crawl through run_extraction; returns (API calls, output tokens, seconds)."""
+    client = FakeClient(latency_ms=latency_ms, seed=0)
+    counter = TokenCounter()
+    extractor = JobExtractor(api_key=None, client=client, metrics_hooks=[counter])
+    progress = ProgressReporter(interval=3600.0, stream=io.StringIO())
+    start = time.perf_counter()
+    asyncio.run(run_extraction(
+        extractor, iter(postings.items()), io.StringIO(), "jsonl", progress, concurrency, tracker=tracker,
+    ))
+    return client.calls, counter.output_tokens, time.perf_counter() - start
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Crawl the same postings repeatedly and report what change tracking avoided."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--postings", type=int, default=2000, help="Postings per crawl")
+    parser.add_argument("--crawls", type=int, default=5, help="Number of crawls, the first one from scratch")
+    parser.add_argument("--edited", type=float, default=0.20, help="Fraction of postings with one section edited per crawl")
+    parser.add_argument("--retitled", type=float, default=0.05, help="Fraction of postings whose opening section changes per crawl")
+    parser.add_argument("--replaced", type=float, default=0.05, help="Fraction of postings replaced by new ones per crawl")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Median simulated API latency")
+    parser.add_argument("--concurrency", type=int, default=32, help="Requests in flight")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    postings = {str(number): f"Posted 0 days ago\n{synthetic_posting(rng, number)}" for number in range(args.postings)}
+    next_id = [args.postings]
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        lost = check_partial_fields(os.path.join(directory, "partial.sqlite"))
+        path = os.path.join(directory, "tracking.sqlite")
+        print(f"{'crawl':>5}{'unchanged':>11}{'partial':>9}{'full':>6}{'new':>6}{'calls avoided':>15}"
+              f"{'fields avoided':>16}{'calls':>8}{'vs':>6}{'out tokens':>12}{'vs':>9}{'s':>7}{'vs':>7}")
+        for day in range(args.crawls):
+            if day:
+                postings = mutate(rng, postings, day, args, next_id)
+            tracker = ChangeTracker(path, model_name="gemini-2.5-flash")
+            calls, tokens, seconds = crawl(postings, tracker, args.latency_ms, args.concurrency)
+            stats = tracker.stats()
+            tracker.close()
+            full_calls, full_tokens, full_seconds = crawl(postings, None, args.latency_ms, args.concurrency)
+            result = dict(stats, crawl=day, calls=calls, output_tokens=tokens, seconds=seconds,
+                          baseline_calls=full_calls, baseline_output_tokens=full_tokens, baseline_seconds=full_seconds)
+            results.append(result)
+            print(
+                f"{day:>5}{stats['unchanged']:>11}{stats['partial']:>9}{stats['full']:>6}{stats['new']:>6}"
+                f"{stats['calls_avoided_ratio']:>15.1%}{stats['fields_avoided_ratio']:>16.1%}{calls:>8}{full_calls:>6}"
+                f"{tokens:>12}{full_tokens:>9}{seconds:>7.2f}{full_seconds:>7.2f}"
+            )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"postings": args.postings, "crawls": results}, f, indent=2)
+    if lost:
+        print(f"Partial re-crawl lost stored fields: {', '.join(lost)}", file=sys.stderr)
+        return 1
+    print("verification        partial re-crawl kept every stored field")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
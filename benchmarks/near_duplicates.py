@@ -0,0 +1,92 @@
+"""Measure near-duplicate index build and lookup latency on synthetic postings.
+
+Usage:
+    python -m benchmarks.near_duplicates [--postings 100000] [--index /tmp/index.sqlite]
+
+Indexes random postings, then looks up lightly edited copies (which should
+be found) and fresh postings (which should not). With --boilerplate N,
+every posting starts with the same N words, so many postings share LSH
+bands the way real postings sharing EEO statements or company blurbs do.
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from typing import List, Optional
+
+from src.dedup import NearDuplicateIndex
+from src.models import JobInformation
+
+
+VOCABULARY = [f"term{i}" for i in range(20000)]
+
+
+def random_posting(rng: random.Random, words: int, boilerplate: str = "") -> str:
+    """A synthetic posting of `words` random vocabulary words after a shared boilerplate block."""
+    return f"{boilerplate} {' '.join(rng.choices(VOCABULARY, k=words))}".lstrip()
+
+
+def edit(rng: random.Random, posting: str, changes: int) -> str:
+    """Replace `changes` random words, mimicking a lightly edited cross-post."""
+    words = posting.split()
+    for _ in range(changes):
+        words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+    return " ".join(words)
+
+
+def percentile(samples: List[float], quantile: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Build an index and report lookup latency, recall and false matches."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--postings", type=int, default=100000, help="Postings to index")
+    parser.add_argument("--words", type=int, default=400, help="Words per posting")
+    parser.add_argument("--queries", type=int, default=1000, help="Lookups of each kind")
+    parser.add_argument("--changes", type=int, default=4, help="Words changed in each near-duplicate query")
+    parser.add_argument("--boilerplate", type=int, default=0, help="Words of boilerplate shared by every posting")
+    parser.add_argument("--index", default=":memory:", help="Index database path (reused if it exists)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args(argv)
+    rng = random.Random(args.seed)
+    index = NearDuplicateIndex(args.index)
+    boilerplate = random_posting(random.Random(-1), args.boilerplate)
+
+    postings = []
+    start = time.perf_counter()
+    for number in range(args.postings):
+        posting = random_posting(rng, args.words, boilerplate)
+        index.add(posting, "benchmark", JobInformation(job_title=f"posting {number}"))
+        if number < args.queries:
+            postings.append(posting)
+    build_seconds = time.perf_counter() - start
+
+    found, latencies = 0, []
+    for number, posting in enumerate(postings):
+        query = edit(rng, posting, args.changes)
+        start = time.perf_counter()
+        match = index.find(query, "benchmark")
+        latencies.append(time.perf_counter() - start)
+        found += match is not None and match.job_title == f"posting {number}"
+
+    false_matches = 0
+    for _ in range(len(postings)):
+        query = random_posting(rng, args.words, boilerplate)
+        start = time.perf_counter()
+        false_matches += index.find(query, "benchmark") is not None
+        latencies.append(time.perf_counter() - start)
+
+    print(f"indexed             {len(index)} postings ({args.postings / build_seconds:.0f}/s)")
+    print(f"lookup latency      median {statistics.median(latencies) * 1e3:.3f} ms, p99 {percentile(latencies, 0.99) * 1e3:.3f} ms")
+    print(f"near-duplicates     {found}/{len(postings)} found ({args.changes} words changed)")
+    print(f"unrelated postings  {false_matches}/{len(postings)} falsely matched")
+    index.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,303 @@
+"""Offline performance suite: extraction paths against a fake client, plus output and validator microbenchmarks.
+
+Usage:
+    python -m benchmarks.offline [--postings 500] [--corpus 100000] [--output results.json]
+    python -m benchmarks.offline --latency-ms 200 --error-rate 0.02 --compare results.json
+
+The single, batch, cache-hit and streaming paths run a real JobExtractor
+whose client is benchmarks.fake_client.FakeClient, so they measure this
+code plus the simulated API latency. Peak memory is the tracemalloc peak
+of each path (for the microbenchmarks, of a second pass over the first
+--memory-sample items, so tracing does not distort their timings).
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from benchmarks.fake_client import FakeClient
+from src.cache import ExtractionCache
+from src.file_generator import format_output_text, generate_json_file
+from src.job_extractor import JobExtractor
+from src.models import JobInformation
+from utils.validators import validate_api_key, validate_job_description
+
+
+TITLES = ["Software Engineer", "Data Scientist", "Product Manager", "DevOps Engineer", "Designer", "Analyst"]
+LEVELS = ["Junior", "Mid-level", "Senior", "Staff", "Principal"]
+COMPANIES = ["Tech Corp", "DataWorks", "Acme", "Globex", "Initech", "Umbrella"]
+SKILLS = ["Python", "Java", "Go", "SQL", "AWS", "GCP", "Docker", "Kubernetes", "React", "Spark", "Terraform", "Rust"]
+BENEFITS = ["Health insurance", "401(k) matching", "Flexible PTO", "Remote stipend", "Equity", "Parental leave"]
+
+
+def synthetic_posting(rng: random.Random, number: int) -> str:
+    """A unique, realistically structured job posting."""
+    skills = rng.sample(SKILLS, 5)
+    low = rng.randrange(60, 200) * 1000
+    return f"""{rng.choice(LEVELS)} {rng.choice(TITLES)} (req #{number})
+
+{rng.choice(COMPANIES)} is hiring for its {rng.choice(["Platform", "Data", "Growth", "Infra"])} team.
+
+Requirements:
+- {rng.randrange(1, 10)}+ years of experience with {skills[0]} and {skills[1]}
+- Hands-on experience with {skills[2]} in production
+- Bachelor's degree in Computer Science or related field
+
+Responsibilities:
+- Build and operate services using {skills[3]}
+- Collaborate with product and design on the roadmap
+
+Nice to have: {skills[4]}
+
+Benefits:
+- {", ".join(rng.sample(BENEFITS, 3))}
+- Salary: ${low:,} - ${low + rng.randrange(10, 60) * 1000:,}
+
+Location: {rng.choice(["Remote", "New York, NY", "Berlin", "Hybrid - London"])}"""
+
+
+def synthetic_job_info(rng: random.Random, number: int) -> JobInformation:
+    """A JobInformation with every field populated, as from a full extraction."""
+    return JobInformation(
+        job_title=f"{rng.choice(LEVELS)} {rng.choice(TITLES)} #{number}",
+        seniority_level=rng.choice(LEVELS),
+        years_of_experience=f"{rng.randrange(1, 10)}+ years",
+        work_type=rng.choice(["Remote", "Hybrid", "On-site"]),
+        location=rng.choice(["Remote", "New York, NY", "Berlin"]),
+        salary=f"${rng.randrange(60, 200)},000",
+        required_criteria=[f"{rng.randrange(1, 10)}+ years with {skill}" for skill in rng.sample(SKILLS, 3)],
+        preferred_qualifications=[f"Experience with {rng.choice(SKILLS)}"],
+        scope_of_responsibilities=["Build and operate services", "Mentor engineers", "Own the roadmap"],
+        company_name=rng.choice(COMPANIES),
+        department="Engineering",
+        benefits=rng.sample(BENEFITS, 3),
+        skills=rng.sample(SKILLS, 6),
+        education_requirements="Bachelor's degree in Computer Science",
+        additional_info="Visa sponsorship available" if number % 2 else None,
+    )
+
+
+def percentile(samples: List[float], quantile: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+
+
+def summarize(latencies: List[float], elapsed: float, peak_bytes: int, **extra) -> Dict[str, float]:
+    """Throughput, latency percentiles (ms) and peak memory of one benchmark."""
+    return {
+        "count": len(latencies),
+        "throughput_per_s": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "latency_p50_ms": percentile(latencies, 0.50) * 1e3,
+        "latency_p95_ms": percentile(latencies, 0.95) * 1e3,
+        "latency_p99_ms": percentile(latencies, 0.99) * 1e3,
+        "peak_memory_mb": peak_bytes / 2**20,
+        **extra,
+    }
+
+
+def traced(run: Callable[[], Tuple[List[float], float, dict]]) -> Dict[str, float]:
+    """Run one extraction path under tracemalloc and summarize it."""
+    tracemalloc.start()
+    try:
+        latencies, elapsed, extra = run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return summarize(latencies, elapsed, peak, **extra)
+
+
+def make_extractor(args: argparse.Namespace, cache: Optional[ExtractionCache] = None) -> JobExtractor:
+    """A JobExtractor backed by a FakeClient configured from the command line."""
+    client = FakeClient(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        malformed_rate=args.malformed_rate,
+        seed=args.seed,
+    )
+    return JobExtractor(api_key=None, cache=cache, client=client)
+
+
+def bench_single(extractor: JobExtractor, postings: List[str]) -> Tuple[List[float], float, dict]:
+    """Sequential extract_information calls."""
+    latencies, failures = [], 0
+    started = time.perf_counter()
+    for posting in postings:
+        start = time.perf_counter()
+        failures += extractor.extract_information(posting) is None
+        latencies.append(time.perf_counter() - start)
+    return latencies, time.perf_counter() - started, {"failures": failures}
+
+
+def bench_batch(extractor: JobExtractor, postings: List[str], concurrency: int) -> Tuple[List[float], float, dict]:
+    """extract_many with bounded concurrency."""
+
+    async def run() -> Tuple[List[float], int]:
+        latencies, failures = [], 0
+        async for result in extractor.extract_many(postings, concurrency=concurrency):
+            latencies.append(result.elapsed)
+            failures += not result.ok
+        return latencies, failures
+
+    started = time.perf_counter()
+    latencies, failures = asyncio.run(run())
+    return latencies, time.perf_counter() - started, {"failures": failures, "concurrency": concurrency}
+
+
+def bench_stream(extractor: JobExtractor, postings: List[str]) -> Tuple[List[float], float, dict]:
+    """extract_information_stream, also recording the time to the first streamed field."""
+    latencies, first_fields, failures = [], [], 0
+    started = time.perf_counter()
+    for posting in postings:
+        start = time.perf_counter()
+        first = None
+        try:
+            for _ in extractor.extract_information_stream(posting):
+                if first is None:
+                    first = time.perf_counter() - start
+        except Exception:
+            failures += 1
+        latencies.append(time.perf_counter() - start)
+        first_fields.append(first if first is not None else latencies[-1])
+    return latencies, time.perf_counter() - started, {
+        "failures": failures,
+        "first_field_p50_ms": percentile(first_fields, 0.50) * 1e3,
+        "first_field_p95_ms": percentile(first_fields, 0.95) * 1e3,
+    }
+
+
+def bench_micro(items: Callable[[], Iterator], call: Callable, memory_sample: int) -> Dict[str, float]:
+    """Time `call` on every item, then trace peak memory over the first memory_sample items."""
+    latencies = []
+    for item in items():
+        start = time.perf_counter()
+        call(item)
+        latencies.append(time.perf_counter() - start)
+    elapsed = sum(latencies)
+
+    tracemalloc.start()
+    try:
+        for number, item in enumerate(items()):
+            if number >= memory_sample:
+                break
+            call(item)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return summarize(latencies, elapsed, peak)
+
+
+def compare(results: Dict[str, dict], baseline_path: str) -> None:
+    """Print throughput and p95 changes against an earlier results file."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    print(f"\nCompared with {baseline_path}:")
+    print(f"{'benchmark':<22}{'throughput':>12}{'p95':>10}")
+    for name, result in results.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        throughput = result["throughput_per_s"] / before["throughput_per_s"] - 1 if before["throughput_per_s"] else 0.0
+        p95 = result["latency_p95_ms"] / before["latency_p95_ms"] - 1 if before["latency_p95_ms"] else 0.0
+        print(f"{name:<22}{throughput:>+12.1%}{p95:>+10.1%}")
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Run every benchmark, print a table and optionally save or compare results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--postings", type=int, default=500, help="Postings per extraction path")
+    parser.add_argument("--corpus", type=int, default=100000, help="Items per microbenchmark")
+    parser.add_argument("--memory-sample", type=int, default=10000, help="Items traced for microbenchmark peak memory")
+    parser.add_argument("--concurrency", type=int, default=32, help="Requests in flight for the batch path")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Median simulated API latency")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Log-normal shape of the simulated latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of simulated calls failing with 429/503")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="Fraction of simulated responses truncated")
+    parser.add_argument("--only", action="append", help="Run only this benchmark (repeatable)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--compare", help="Print changes relative to an earlier --output file")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    postings = [synthetic_posting(rng, number) for number in range(args.postings)]
+    extraction_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    def job_infos() -> Iterator[JobInformation]:
+        local = random.Random(args.seed)
+        return (synthetic_job_info(local, number) for number in range(args.corpus))
+
+    def descriptions() -> Iterator[str]:
+        local = random.Random(args.seed)
+        return (synthetic_posting(local, number) for number in range(args.corpus))
+
+    def api_keys() -> Iterator[str]:
+        local = random.Random(args.seed)
+        alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-"
+        return ("".join(local.choices(alphabet, k=39)) for _ in range(args.corpus))
+
+    def cache_hit() -> Tuple[List[float], float, dict]:
+        extractor = make_extractor(args, ExtractionCache(":memory:", max_entries=None, max_bytes=None))
+        for posting in postings:
+            extractor.extract_information(posting)
+        calls = extractor.client.calls
+        latencies, elapsed, extra = bench_single(extractor, postings)
+        extra["api_calls"] = extractor.client.calls - calls
+        return latencies, elapsed, extra
+
+    benchmarks: Dict[str, Callable[[], Dict[str, float]]] = {
+        "single": lambda: traced(lambda: bench_single(make_extractor(args), postings)),
+        "batch": lambda: traced(lambda: bench_batch(make_extractor(args), postings, args.concurrency)),
+        "cache_hit": lambda: traced(cache_hit),
+        "streaming": lambda: traced(lambda: bench_stream(make_extractor(args), postings)),
+        "format_output_text": lambda: bench_micro(
+            job_infos, lambda info: format_output_text(info, extraction_date), args.memory_sample
+        ),
+        "generate_json_file": lambda: bench_micro(job_infos, generate_json_file, args.memory_sample),
+        "validate_description": lambda: bench_micro(
+            descriptions, validate_job_description, args.memory_sample
+        ),
+        "validate_api_key": lambda: bench_micro(api_keys, validate_api_key, args.memory_sample),
+    }
+    unknown = set(args.only or []) - set(benchmarks)
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+    results = {}
+    print(f"{'benchmark':<22}{'ops/s':>12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'peak MB':>9}")
+    for name, run in benchmarks.items():
+        if args.only and name not in args.only:
+            continue
+        result = results[name] = run()
+        print(
+            f"{name:<22}{result['throughput_per_s']:>12.1f}{result['latency_p50_ms']:>10.3f}"
+            f"{result['latency_p95_ms']:>10.3f}{result['latency_p99_ms']:>10.3f}{result['peak_memory_mb']:>9.1f}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "created": datetime.now().isoformat(timespec="seconds"),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "config": vars(args),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
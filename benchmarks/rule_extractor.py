@@ -0,0 +1,78 @@
+"""Measure throughput of the rule-based pre-extractor and check it on known tricky inputs.
+
+Usage:
+    python -m benchmarks.rule_extractor [--postings 20000]
+
+Runs RuleExtractor.extract over benchmarks.offline postings, then checks
+a fixed set of descriptions whose expected guesses are known (including
+numbers that are not experience requirements, such as "100 years ago" or
+a year); the exit code is 1 if any check fails.
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from typing import List, Optional, Tuple
+
+from benchmarks.offline import synthetic_posting
+from src.rule_extractor import RuleExtractor
+
+# (description, expected years_of_experience value or None if no guess should be made)
+YEARS_CHECKS: List[Tuple[str, Optional[str]]] = [
+    ("5+ years of experience with Python", "5+ years"),
+    ("Experience: 3-5 years in backend development", "3-5 years"),
+    ("Founded over 100 years ago, we value experience.", None),
+    ("Experience matters: since 2024 years of growth have followed.", None),
+    ("Experience with 2024 years of archives", None),
+]
+
+
+def check_years(extractor: RuleExtractor) -> List[str]:
+    """Run YEARS_CHECKS; returns a message per failed check."""
+    failures = []
+    for text, expected in YEARS_CHECKS:
+        guess = extractor.extract(text).get("years_of_experience")
+        found = guess.value if guess else None
+        if found != expected:
+            failures.append(f"{text!r}: expected {expected!r}, got {found!r}")
+    return failures
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Time extraction over synthetic postings and print check failures."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--postings", type=int, default=20000, help="Number of synthetic postings")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    postings = [synthetic_posting(rng, number) for number in range(args.postings)]
+    extractor = RuleExtractor()
+    start = time.perf_counter()
+    guesses = extractor.extract_many(postings)
+    elapsed = time.perf_counter() - start
+    confident = sum(1 for guess in guesses for field in guess.values() if field.confidence >= 0.8)
+
+    failures = check_years(extractor)
+    for failure in failures:
+        print(f"Check failed: {failure}", file=sys.stderr)
+    summary = {
+        "postings": args.postings,
+        "postings_per_second": args.postings / elapsed if elapsed > 0 else 0.0,
+        "confident_fields_per_posting": confident / args.postings if args.postings else 0.0,
+        "check_failures": len(failures),
+    }
+    print(f"postings            {args.postings}")
+    print(f"throughput          {summary['postings_per_second']:.0f} postings/s")
+    print(f"confident fields    {summary['confident_fields_per_posting']:.2f} per posting")
+    print(f"verification        {len(failures)} of {len(YEARS_CHECKS)} checks failed")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"summary": summary, "failures": failures}, f, indent=2)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""Time salary and experience normalization and vectorized analytics on a large corpus.
+
+Usage:
+    python -m benchmarks.salary_analytics [--records 1000000] [--baseline-records 100000]
+
+Builds a corpus file of synthetic results whose salary and experience
+values come in the mixed formats models return ("$120k - $150k",
+"€55,000 per year", "£25/hr", "5+ years", ...). JobFrame.from_corpus()
+parses each distinct string once and gathers per-record columns (the same
+build from in-memory models with JobFrame.from_records() is timed too); USD
+annual salary percentiles, a histogram and group-bys by seniority,
+location and skill are then timed. The baseline does the same group-bys
+the obvious way, with a Python loop that parses each record's salary and
+appends it to per-group lists, over --baseline-records in-memory models.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.offline import COMPANIES, LEVELS, SKILLS, TITLES
+from src.analytics import JobFrame
+from src.corpus import Corpus, CorpusWriter
+from src.models import JobInformation
+from src.normalize import parse_experience, parse_salary
+
+
+CITIES = [f"City {number}" for number in range(300)] + ["Remote", "New York, NY", "Berlin", "London", "remote"]
+SALARY_FORMATS = [
+    lambda rng, low, high: f"${low}k - ${high}k",
+    lambda rng, low, high: f"${low * 1000:,} - ${high * 1000:,} per year",
+    lambda rng, low, high: f"USD {low * 1000:,}",
+    lambda rng, low, high: f"€{low * 1000 // 1.2:,.0f} per year",
+    lambda rng, low, high: f"£{low * 1000 // 1.4:,.0f}-£{high * 1000 // 1.4:,.0f}",
+    lambda rng, low, high: f"${low // 2} per hour",
+    lambda rng, low, high: f"${low * 1000 // 12:,}/month",
+    lambda rng, low, high: "Competitive",
+]
+EXPERIENCE_FORMATS = ["{0}+ years", "{0}-{1} years", "at least {0} years", "{0} years of experience", "Entry level"]
+
+
+def synthetic_records(rng: random.Random, count: int) -> List[JobInformation]:
+    """Results with salary, experience and group fields in realistic mixed formats."""
+    records = []
+    for _ in range(count):
+        low = rng.randrange(50, 220)
+        years = rng.randrange(0, 12)
+        records.append(JobInformation.model_construct(
+            job_title=rng.choice(TITLES),
+            seniority_level=rng.choice(LEVELS),
+            years_of_experience=rng.choice(EXPERIENCE_FORMATS).format(years, years + rng.randrange(1, 4)),
+            work_type=rng.choice(["Remote", "Hybrid", "On-site"]),
+            location=rng.choice(CITIES),
+            salary=rng.choice(SALARY_FORMATS)(rng, low, low + rng.randrange(5, 60)),
+            required_criteria=[],
+            preferred_qualifications=[],
+            scope_of_responsibilities=[],
+            company_name=rng.choice(COMPANIES),
+            department=None,
+            benefits=[],
+            skills=rng.sample(SKILLS, rng.randrange(3, 8)),
+            education_requirements=None,
+            additional_info=None,
+        ))
+    return records
+
+
+def python_group_by(records: List[JobInformation], field: str) -> Dict[str, float]:
+    """Median USD annual salary per group with a per-record Python loop."""
+    groups: Dict[str, List[float]] = {}
+    for record in records:
+        salary = parse_salary(record.salary)
+        if salary is None or salary.currency != "USD" or salary.annual is None:
+            continue
+        values = getattr(record, field)
+        for value in values if isinstance(values, list) else [values]:
+            if value is not None:
+                groups.setdefault(" ".join(value.split()).casefold(), []).append(salary.annual)
+    return {value: float(np.median(annual)) for value, annual in groups.items()}
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Build a synthetic corpus and time frame construction, statistics and the Python baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1000000, help="Records in the corpus")
+    parser.add_argument("--baseline-records", type=int, default=100000, help="Records for the per-record Python loop")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    records = synthetic_records(rng, args.records)
+    results: Dict[str, float] = {"records": args.records}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "results.corpus")
+        with CorpusWriter(path) as writer:
+            for number, job_info in enumerate(records):
+                writer.write(str(number), job_info)
+        corpus = Corpus(path)
+        parse_salary.cache_clear()
+        parse_experience.cache_clear()
+        frame, results["frame_build_s"] = timed(JobFrame.from_corpus, corpus)
+        results["distinct_salaries"] = len(corpus.strings("salary")) - 1
+        parse_salary.cache_clear()
+        parse_experience.cache_clear()
+        _, results["frame_from_records_s"] = timed(JobFrame.from_records, records)
+        usd, results["mask_s"] = timed(frame.mask, currency="USD")
+        percentiles, results["percentiles_s"] = timed(frame.percentiles, "salary_annual", where=usd)
+        _, results["histogram_s"] = timed(frame.histogram, "salary_annual", bins=50, where=usd)
+        groups = {}
+        for field in ("seniority_level", "location", "skills"):
+            groups[field], results[f"group_by_{field}_s"] = timed(
+                frame.group_by, field, "salary_annual", q=(25, 50, 75), where=usd
+            )
+
+        baseline = records[:args.baseline_records]
+        parse_salary.cache_clear()
+        start = time.perf_counter()
+        for field in ("seniority_level", "location", "skills"):
+            python_group_by(baseline, field)
+        results["python_records_per_s"] = len(baseline) / (time.perf_counter() - start)
+        vectorized_seconds = sum(results[f"group_by_{field}_s"] for field in ("seniority_level", "location", "skills"))
+        results["vectorized_records_per_s"] = args.records / (results["frame_build_s"] + results["mask_s"] + vectorized_seconds)
+        del frame
+        corpus.close()
+
+    print(f"{args.records} records, {results['distinct_salaries']} distinct salary strings")
+    print(f"Frame built from corpus in {results['frame_build_s']:.2f} s, from records in {results['frame_from_records_s']:.2f} s")
+    print("USD annual salary: " + ", ".join(f"p{q:g} {value:,.0f}" for q, value in percentiles.items())
+          + f" ({results['percentiles_s'] * 1e3:.0f} ms; histogram {results['histogram_s'] * 1e3:.0f} ms)")
+    for field, stats in groups.items():
+        top = ", ".join(f"{group.value} {group.percentiles[50]:,.0f}" for group in stats[:3])
+        print(f"Median by {field}: {len(stats)} groups in {results[f'group_by_{field}_s'] * 1e3:.0f} ms ({top}, ...)")
+    print(
+        f"Three group-bys: {results['vectorized_records_per_s']:,.0f} records/s vectorized (including frame build) vs "
+        f"{results['python_records_per_s']:,.0f} records/s with a Python loop "
+        f"({results['vectorized_records_per_s'] / results['python_records_per_s']:.0f}x)"
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
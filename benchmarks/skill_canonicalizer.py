@@ -0,0 +1,153 @@
+"""Measure skill canonicalization throughput and compiled-trie startup time.
+
+Usage:
+    python -m benchmarks.skill_canonicalizer [--postings 20000] [--extra-aliases 50000]
+
+Descriptions are benchmarks.offline postings padded with company, benefits
+and legal prose to a realistic length of about 3 KB. "find" scans whole
+descriptions, "canonicalize" maps lists of extracted skill strings in mixed
+spellings. Startup compares compiling the trie with loading a saved copy,
+for the built-in dictionary and for one with --extra-aliases synthetic
+aliases added, to show that scanning cost does not grow with the
+dictionary.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.offline import synthetic_posting
+from src.skills import SKILL_ALIASES, SkillCanonicalizer
+
+
+FILLER = [
+    "About us: we are a fast-growing company building tools that help teams ship reliable software. "
+    "Our customers range from startups to large enterprises across healthcare, finance and retail.",
+    "You will work closely with engineering, product and design to plan, build and operate the services "
+    "that power our platform, and you will mentor other engineers on the team.",
+    "We offer competitive compensation, comprehensive health, dental and vision coverage, a generous "
+    "learning budget, flexible working hours and an annual company offsite.",
+    "We are an equal opportunity employer and value diversity. All qualified applicants will receive "
+    "consideration for employment without regard to race, color, religion, sex, sexual orientation, "
+    "gender identity, national origin, disability or veteran status.",
+    "If you need a reasonable accommodation during the application process, please let us know. "
+    "Please read our privacy notice to learn how we handle applicant data.",
+]
+
+
+def synthetic_descriptions(rng: random.Random, count: int, target_chars: int = 3000) -> List[str]:
+    """Postings padded with random filler paragraphs to about target_chars."""
+    descriptions = []
+    for number in range(count):
+        parts = [synthetic_posting(rng, number)]
+        length = len(parts[0])
+        while length < target_chars:
+            paragraph = rng.choice(FILLER)
+            parts.append(paragraph)
+            length += len(paragraph) + 2
+        descriptions.append("\n\n".join(parts))
+    return descriptions
+
+
+def extracted_skill_lists(rng: random.Random, count: int) -> List[List[str]]:
+    """Skill lists as a model might return them: aliases in mixed case plus unknown skills."""
+    spellings = [alias for aliases in SKILL_ALIASES.values() for alias in aliases] + list(SKILL_ALIASES)
+    unknown = ["Communication", "Stakeholder management", "Problem solving", "Mentoring"]
+    lists = []
+    for _ in range(count):
+        skills = [rng.choice(spellings) for _ in range(rng.randrange(4, 12))] + rng.sample(unknown, 2)
+        lists.append([skill.upper() if rng.random() < 0.2 else skill.title() for skill in skills])
+    return lists
+
+
+def large_dictionary(rng: random.Random, extra: int) -> Dict[str, List[str]]:
+    """The built-in dictionary plus `extra` synthetic one- to three-word aliases."""
+    aliases = {name: list(values) for name, values in SKILL_ALIASES.items()}
+    words = [f"w{number}" for number in range(max(extra // 4, 1))]
+    for number in range(extra):
+        name = f"Synthetic Skill {number // 3}"
+        aliases.setdefault(name, []).append(" ".join(rng.choice(words) for _ in range(rng.randrange(1, 4))))
+    return aliases
+
+
+def startup(aliases: Dict[str, List[str]], directory: str) -> Dict[str, float]:
+    """Compile time, saved size and load time of a dictionary's trie."""
+    start = time.perf_counter()
+    canonicalizer = SkillCanonicalizer(aliases)
+    compile_seconds = time.perf_counter() - start
+    path = os.path.join(directory, f"{canonicalizer.fingerprint}.json")
+    canonicalizer.save(path)
+    start = time.perf_counter()
+    SkillCanonicalizer.load(path)
+    load_seconds = time.perf_counter() - start
+    return {
+        "skills": len(canonicalizer),
+        "nodes": canonicalizer.num_nodes,
+        "compile_ms": compile_seconds * 1e3,
+        "load_ms": load_seconds * 1e3,
+        "file_kb": os.path.getsize(path) / 1024,
+    }
+
+
+def throughput(canonicalizer: SkillCanonicalizer, descriptions: List[str], skill_lists: List[List[str]]) -> Dict[str, float]:
+    """Descriptions scanned and skill lists canonicalized per second."""
+    start = time.perf_counter()
+    found = sum(len(canonicalizer.find(text)) for text in descriptions)
+    find_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    for skills in skill_lists:
+        canonicalizer.canonicalize(skills)
+    canonicalize_seconds = time.perf_counter() - start
+    return {
+        "find_postings_per_s": len(descriptions) / find_seconds,
+        "find_mb_per_s": sum(map(len, descriptions)) / find_seconds / 2**20,
+        "skills_per_posting": found / len(descriptions),
+        "canonicalize_lists_per_s": len(skill_lists) / canonicalize_seconds,
+    }
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Time startup and scanning for the built-in and a large dictionary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--postings", type=int, default=20000, help="Descriptions to scan")
+    parser.add_argument("--chars", type=int, default=3000, help="Approximate characters per description")
+    parser.add_argument("--extra-aliases", type=int, default=50000, help="Synthetic aliases added for the large dictionary")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    descriptions = synthetic_descriptions(rng, args.postings, args.chars)
+    skill_lists = extracted_skill_lists(rng, args.postings)
+    dictionaries = {"built-in": dict(SKILL_ALIASES), "large": large_dictionary(rng, args.extra_aliases)}
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, aliases in dictionaries.items():
+            results[name] = startup(aliases, directory)
+            results[name].update(throughput(SkillCanonicalizer(aliases), descriptions, skill_lists))
+
+    mean_chars = sum(map(len, descriptions)) / len(descriptions)
+    print(f"{args.postings} descriptions of {mean_chars:.0f} chars on average")
+    print(
+        f"{'dictionary':<12}{'skills':>8}{'nodes':>9}{'compile ms':>12}{'load ms':>9}{'KB':>8}"
+        f"{'find/s':>10}{'MB/s':>7}{'lists/s':>10}"
+    )
+    for name, result in results.items():
+        print(
+            f"{name:<12}{result['skills']:>8}{result['nodes']:>9}{result['compile_ms']:>12.1f}{result['load_ms']:>9.1f}"
+            f"{result['file_kb']:>8.0f}{result['find_postings_per_s']:>10.0f}{result['find_mb_per_s']:>7.1f}"
+            f"{result['canonicalize_lists_per_s']:>10.0f}"
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"postings": args.postings, "mean_chars": mean_chars, "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
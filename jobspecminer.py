@@ -0,0 +1,8 @@
+"""Command-line entry point for bulk JobSpecMiner extraction."""
+import sys
+
+from src.cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,386 @@
+"""Vectorized salary and experience analytics over a corpus of extraction results."""
+from dataclasses import dataclass
+from itertools import chain
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import LIST_FIELDS, JobInformation
+from .normalize import parse_experience, parse_salary
+from .search import normalize_facet_value
+
+
+NUMERIC_COLUMNS = (
+    "salary_min",
+    "salary_max",
+    "salary_annual_min",
+    "salary_annual_max",
+    "salary_annual",
+    "years_min",
+    "years_max",
+)
+GROUP_FIELDS = ("seniority_level", "work_type", "location", "company_name", "department", "skills")
+PERIODS = (None, "hour", "day", "week", "month", "year")
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90)
+
+
+@dataclass
+class GroupStats:
+    """Summary of one numeric column within one group."""
+
+    value: str
+    count: int
+    mean: float
+    percentiles: Dict[float, float]
+
+
+class _Encoded(NamedTuple):
+    """A dictionary-encoded field: codes index labels, code 0 is None; list fields add offsets."""
+
+    codes: np.ndarray
+    offsets: Optional[np.ndarray]
+    labels: Sequence[Optional[str]]
+
+
+def _check_column(name: str) -> str:
+    if name not in NUMERIC_COLUMNS:
+        raise ValueError(f"Unknown column {name!r}; expected one of {', '.join(NUMERIC_COLUMNS)}")
+    return name
+
+
+def _encode(values: Iterable, is_list: bool = False) -> _Encoded:
+    """Dictionary-encode one field's values (lists of values for list fields).
+
+    Distinct values are collected with dict.fromkeys and codes looked up with
+    map(), so the per-value work runs in C rather than in a Python loop.
+    """
+    values = list(values)
+    offsets = None
+    if is_list:
+        offsets = np.zeros(len(values) + 1, dtype=np.uint64)
+        np.cumsum(np.fromiter(map(len, values), dtype=np.uint64, count=len(values)), out=offsets[1:])
+        values = list(chain.from_iterable(values))
+    lookup: Dict[Optional[str], int] = dict.fromkeys([None, *dict.fromkeys(values)])
+    lookup.update(zip(lookup, range(len(lookup))))
+    codes = np.fromiter(map(lookup.__getitem__, values), dtype=np.uint32, count=len(values))
+    return _Encoded(codes, offsets, list(lookup))
+
+
+def _grouped_percentiles(
+    groups: np.ndarray, ranks: np.ndarray, distinct: np.ndarray, num_groups: int, q: Sequence[float]
+) -> Tuple[np.ndarray, np.ndarray, Dict[float, np.ndarray]]:
+    """Count, mean and percentiles of values per group.
+
+    Values arrive as ranks into `distinct`, their sorted distinct values,
+    which are few because every value comes from a parsed string. Ordering
+    by the key group * len(distinct) + rank puts each group's values in a
+    contiguous, ascending run, so every percentile of every group is a
+    lookup at a computed position, with the same linear interpolation as
+    np.percentile. When groups times distinct values is small the positions
+    are found in a cumulative histogram of the keys (O(n), no sort);
+    otherwise the keys are sorted once.
+
+    Returns:
+        Tuple of (counts, means, {q: percentile per group}); groups without
+        values get NaN
+    """
+    counts = np.bincount(groups, minlength=num_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.bincount(groups, weights=distinct[ranks], minlength=num_groups) / counts
+    width = len(distinct)
+    keys = groups.astype(np.int64) * width + ranks
+    if num_groups * width <= max(4 * len(keys), 1 << 20):
+        cumulative = np.cumsum(np.bincount(keys, minlength=num_groups * width))
+
+        def key_at(positions: np.ndarray) -> np.ndarray:
+            return np.searchsorted(cumulative, positions, side="right")
+    else:
+        ordered = np.sort(keys)
+
+        def key_at(positions: np.ndarray) -> np.ndarray:
+            return ordered[positions]
+
+    starts = np.cumsum(counts) - counts
+    present = np.flatnonzero(counts)
+    results = {}
+    for quantile in q:
+        position = starts[present] + (counts[present] - 1) * (quantile / 100)
+        low = np.floor(position).astype(np.int64)
+        high = np.minimum(low + 1, starts[present] + counts[present] - 1)
+        fraction = position - low
+        result = np.full(num_groups, np.nan)
+        result[present] = distinct[key_at(low) % width] * (1 - fraction) + distinct[key_at(high) % width] * fraction
+        results[quantile] = result
+    return counts, means, results
+
+
+class JobFrame:
+    """Numeric salary and experience columns of a set of results, for vectorized statistics.
+
+    Salary and experience strings repeat heavily across a corpus, so each
+    distinct string is parsed once and the per-record columns are gathered
+    from those parses with its integer codes. Percentiles, histograms and
+    group-bys then run as numpy operations over the columns, without a
+    Python loop over records. Build a frame with from_corpus() (reading
+    the codes a Corpus already stores) or from_records().
+    """
+
+    def __init__(self, size: int, salary: _Encoded, experience: _Encoded, keys: Callable[[str], _Encoded]):
+        """Parse the distinct salary and experience strings; use from_corpus() or from_records()."""
+        self._size = size
+        self._salary_codes = salary.codes
+        self._experience_codes = experience.codes
+        self._keys = keys
+        self._group_maps: Dict[str, Tuple[np.ndarray, List[str]]] = {}
+        self._rank_maps: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._columns: Dict[str, np.ndarray] = {}
+
+        currencies: Dict[Optional[str], int] = {None: 0}
+        per_code = {name: np.full(len(salary.labels), np.nan) for name in NUMERIC_COLUMNS[:5]}
+        currency_codes = np.zeros(len(salary.labels), dtype=np.uint8)
+        period_codes = np.zeros(len(salary.labels), dtype=np.uint8)
+        for code in range(1, len(salary.labels)):
+            parsed = parse_salary(salary.labels[code])
+            if parsed is None:
+                continue
+            for name, value in zip(
+                NUMERIC_COLUMNS[:5],
+                (parsed.min_amount, parsed.max_amount, parsed.annual_min, parsed.annual_max, parsed.annual),
+            ):
+                if value is not None:
+                    per_code[name][code] = value
+            currency_codes[code] = currencies.setdefault(parsed.currency, len(currencies))
+            period_codes[code] = PERIODS.index(parsed.period)
+        for name in NUMERIC_COLUMNS[5:]:
+            per_code[name] = np.full(len(experience.labels), np.nan)
+        for code in range(1, len(experience.labels)):
+            parsed = parse_experience(experience.labels[code])
+            if parsed is None:
+                continue
+            if parsed.min_years is not None:
+                per_code["years_min"][code] = parsed.min_years
+            if parsed.max_years is not None:
+                per_code["years_max"][code] = parsed.max_years
+        self._per_code = per_code
+        self._currency_labels = list(currencies)
+        self._currency_per_code = currency_codes
+        self._period_per_code = period_codes
+
+    @classmethod
+    def from_corpus(cls, corpus) -> "JobFrame":
+        """Build a frame over a Corpus, reusing its stored codes and dictionaries.
+
+        Args:
+            corpus: An open src.corpus.Corpus; it must stay open while the frame is used
+
+        Returns:
+            JobFrame that can group by any field of the corpus
+        """
+
+        def key(name: str) -> _Encoded:
+            codes, offsets = corpus.column(name)
+            return _Encoded(codes, offsets, corpus.strings(name))
+
+        return cls(len(corpus), key("salary"), key("years_of_experience"), key)
+
+    @classmethod
+    def from_records(cls, records: Iterable[JobInformation], group_fields: Sequence[str] = GROUP_FIELDS) -> "JobFrame":
+        """Build a frame from JobInformation objects.
+
+        Args:
+            records: Extraction results
+            group_fields: Fields group_by() will be able to use
+
+        Returns:
+            JobFrame
+        """
+        records = list(records)
+        encoded = {
+            name: _encode(map(attrgetter(name), records), name in LIST_FIELDS)
+            for name in ("salary", "years_of_experience", *group_fields)
+        }
+
+        def key(name: str) -> _Encoded:
+            if name not in encoded:
+                raise ValueError(f"Cannot group by {name}: build the frame with it in group_fields")
+            return encoded[name]
+
+        return cls(len(records), encoded["salary"], encoded["years_of_experience"], key)
+
+    def __len__(self) -> int:
+        """Number of records."""
+        return self._size
+
+    def column(self, name: str) -> np.ndarray:
+        """One numeric column, with one float per record and NaN where the value is missing.
+
+        Args:
+            name: One of NUMERIC_COLUMNS
+
+        Returns:
+            float64 array of length len(self)
+
+        Raises:
+            ValueError: If the column name is unknown
+        """
+        values = self._columns.get(_check_column(name))
+        if values is None:
+            codes = self._salary_codes if name.startswith("salary") else self._experience_codes
+            values = self._columns[name] = self._per_code[name][codes]
+        return values
+
+    def currencies(self) -> List[Tuple[str, int]]:
+        """Currencies of the parsed salaries and their record counts, most common first."""
+        counts = np.bincount(self._currency_per_code[self._salary_codes], minlength=len(self._currency_labels))
+        pairs = [(label, int(count)) for label, count in zip(self._currency_labels, counts) if label and count]
+        return sorted(pairs, key=lambda pair: -pair[1])
+
+    def mask(self, currency: Optional[str] = None, period: Optional[str] = None) -> np.ndarray:
+        """Boolean mask of records whose salary is in a currency and/or was stated per a period.
+
+        Salaries in different currencies should not be pooled, so pass
+        where=frame.mask(currency="USD") to the statistics methods.
+
+        Args:
+            currency: ISO code such as "USD", or None for any
+            period: One of "hour", "day", "week", "month", "year", or None for any
+
+        Returns:
+            Boolean array of length len(self)
+        """
+        selected = np.ones(len(self._salary_codes), dtype=bool)
+        if currency is not None:
+            if currency not in self._currency_labels:
+                return np.zeros(len(self._salary_codes), dtype=bool)
+            selected &= (self._currency_per_code == self._currency_labels.index(currency))[self._salary_codes]
+        if period is not None:
+            selected &= (self._period_per_code == PERIODS.index(period))[self._salary_codes]
+        return selected
+
+    def _values(self, column: str, where: Optional[np.ndarray]) -> np.ndarray:
+        values = self.column(column)
+        keep = ~np.isnan(values)
+        if where is not None:
+            keep &= where
+        return values[keep]
+
+    def percentiles(
+        self, column: str, q: Sequence[float] = DEFAULT_PERCENTILES, where: Optional[np.ndarray] = None
+    ) -> Dict[float, float]:
+        """Percentiles of a numeric column over the records that have a value.
+
+        Args:
+            column: One of NUMERIC_COLUMNS
+            q: Percentiles between 0 and 100
+            where: Optional boolean mask of records to include
+
+        Returns:
+            {percentile: value}; NaN values if no record has one
+        """
+        values = self._values(column, where)
+        if not len(values):
+            return {quantile: float("nan") for quantile in q}
+        return dict(zip(q, np.percentile(values, q).tolist()))
+
+    def histogram(
+        self,
+        column: str,
+        bins: int = 20,
+        value_range: Optional[Tuple[float, float]] = None,
+        where: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Histogram of a numeric column over the records that have a value.
+
+        Args:
+            column: One of NUMERIC_COLUMNS
+            bins: Number of equal-width bins
+            value_range: (low, high) bounds of the bins; default is the data's range
+            where: Optional boolean mask of records to include
+
+        Returns:
+            Tuple of (counts, bin_edges) as from np.histogram
+        """
+        return np.histogram(self._values(column, where), bins=bins, range=value_range)
+
+    def _ranks(self, column: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Sorted distinct values of a column and each code's rank among them (len(distinct) for NaN)."""
+        cached = self._rank_maps.get(column)
+        if cached is None:
+            per_code = self._per_code[_check_column(column)]
+            known = ~np.isnan(per_code)
+            distinct, inverse = np.unique(per_code[known], return_inverse=True)
+            ranks = np.full(len(per_code), len(distinct), dtype=np.int64)
+            ranks[known] = inverse
+            cached = self._rank_maps[column] = (distinct, ranks)
+        return cached
+
+    def _groups(self, field: str) -> Tuple[np.ndarray, List[str]]:
+        """Code -> group number for a field, merging values that differ only in case or spacing."""
+        cached = self._group_maps.get(field)
+        if cached is None:
+            labels = self._keys(field).labels
+            remap = np.zeros(len(labels), dtype=np.int64)
+            numbers: Dict[str, int] = {}
+            names: List[str] = [""]
+            for code in range(1, len(labels)):
+                normalized = normalize_facet_value(labels[code])
+                number = numbers.get(normalized)
+                if number is None:
+                    number = numbers[normalized] = len(names)
+                    names.append(labels[code])
+                remap[code] = number
+            cached = self._group_maps[field] = (remap, names)
+        return cached
+
+    def group_by(
+        self,
+        field: str,
+        column: str,
+        q: Sequence[float] = (50,),
+        where: Optional[np.ndarray] = None,
+        min_count: int = 1,
+        limit: Optional[int] = None,
+    ) -> List[GroupStats]:
+        """Statistics of a numeric column per value of a field.
+
+        For list fields such as skills, a record counts towards each of its
+        values. Values that differ only in case or spacing are one group.
+
+        Args:
+            field: JobInformation field to group by, e.g. "seniority_level", "location" or "skills"
+            column: One of NUMERIC_COLUMNS
+            q: Percentiles between 0 and 100 to compute per group
+            where: Optional boolean mask of records to include
+            min_count: Leave out groups with fewer values than this
+            limit: Return at most this many groups
+
+        Returns:
+            GroupStats, largest groups first
+        """
+        key = self._keys(field)
+        remap, names = self._groups(field)
+        distinct, ranks = self._ranks(column)
+        groups = remap[key.codes]
+        record_ranks = ranks[self._salary_codes if column.startswith("salary") else self._experience_codes]
+        if key.offsets is not None:
+            rows = np.repeat(np.arange(self._size), np.diff(key.offsets.astype(np.int64)))
+            record_ranks = record_ranks[rows]
+            keep = (record_ranks < len(distinct)) & (groups > 0)
+            if where is not None:
+                keep &= where[rows]
+        else:
+            keep = (record_ranks < len(distinct)) & (groups > 0)
+            if where is not None:
+                keep &= where
+        counts, means, percentiles = _grouped_percentiles(groups[keep], record_ranks[keep], distinct, len(names), q)
+        order = [number for number in np.argsort(-counts, kind="stable").tolist() if number and counts[number] >= min_count]
+        return [
+            GroupStats(
+                value=names[number],
+                count=int(counts[number]),
+                mean=float(means[number]),
+                percentiles={quantile: float(percentiles[quantile][number]) for quantile in q},
+            )
+            for number in order[:limit]
+        ]
@@ -0,0 +1,435 @@
+"""Extraction backends: a load-balanced pool of API keys and a local, offline backend.
+
+JobExtractor sends every request through a client object exposing
+models.generate_content, models.generate_content_stream and
+aio.models.generate_content (the subset of genai.Client it uses). Both
+classes here implement that interface, so either can be passed as
+JobExtractor(client=...).
+"""
+import asyncio
+import json
+import math
+import re
+import threading
+import time
+from collections import deque
+from types import SimpleNamespace
+from typing import Any, Callable, Deque, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
+
+from .batch import OUTPUT_TOKEN_ESTIMATE, estimate_tokens
+from .models import ALL_FIELDS
+from .rule_extractor import RuleExtractor
+
+
+STRATEGIES = ("least_loaded", "quota_aware")
+THROTTLE_CODES = {429}
+REVOKED_CODES = {401, 403}
+
+
+def _error_code(error: BaseException) -> Optional[int]:
+    """HTTP status of an API error, recognizing quota errors without a numeric code."""
+    code = getattr(error, "code", None)
+    if isinstance(code, int):
+        return code
+    return 429 if "RESOURCE_EXHAUSTED" in str(error) else None
+
+
+class PoolMember:
+    """One client (usually one API key) in a ClientPool, with its quotas and health state."""
+
+    def __init__(
+        self,
+        client: Any,
+        name: str,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        weight: float = 1.0,
+    ):
+        """Create a member.
+
+        Args:
+            client: genai.Client (or anything with the same interface)
+            name: Label used in stats; never the API key itself
+            requests_per_minute: Request quota of this key, or None for no limit
+            tokens_per_minute: Token quota of this key, or None for no limit
+            weight: Relative capacity used by least-loaded scheduling
+        """
+        self.client = client
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.weight = weight
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.throttles = 0
+        self.consecutive_throttles = 0
+        self.throttled_until = 0.0
+        self.disabled = False
+        # [start time, tokens] of the requests sent within the last minute
+        self._window: Deque[List[float]] = deque()
+
+    def _prune(self, now: float) -> None:
+        """Forget requests older than a minute."""
+        while self._window and self._window[0][0] <= now - 60.0:
+            self._window.popleft()
+
+    def state(self, now: float) -> str:
+        """Health state: "ok", "throttled" or "disabled"."""
+        if self.disabled:
+            return "disabled"
+        return "throttled" if now < self.throttled_until else "ok"
+
+    def headroom(self, now: float) -> float:
+        """Remaining share (0-1) of the tighter of the two quotas in the current minute."""
+        self._prune(now)
+        shares = [1.0]
+        if self.requests_per_minute:
+            shares.append(1 - len(self._window) / self.requests_per_minute)
+        if self.tokens_per_minute:
+            shares.append(1 - sum(tokens for _, tokens in self._window) / self.tokens_per_minute)
+        return max(0.0, min(shares))
+
+    def wait_time(self, now: float, tokens: float) -> float:
+        """Seconds until a request of `tokens` fits this member's quotas (inf if disabled)."""
+        if self.disabled:
+            return math.inf
+        self._prune(now)
+        wait = max(0.0, self.throttled_until - now)
+        if self.requests_per_minute and len(self._window) >= self.requests_per_minute:
+            # A fractional quota (e.g. a key's rpm split across queue workers) allows its ceiling
+            oldest = self._window[len(self._window) - math.ceil(self.requests_per_minute)][0]
+            wait = max(wait, oldest + 60.0 - now)
+        if self.tokens_per_minute:
+            # Requests larger than the quota are clamped so they cannot wait forever
+            excess = sum(t for _, t in self._window) + min(tokens, self.tokens_per_minute) - self.tokens_per_minute
+            for start, used in self._window:
+                if excess <= 0:
+                    break
+                excess -= used
+                wait = max(wait, start + 60.0 - now)
+        return wait
+
+
+class _PoolModels:
+    """Synchronous models namespace (pool.models)."""
+
+    def __init__(self, pool: "ClientPool"):
+        self._pool = pool
+
+    def generate_content(self, model: str, contents: Any, config: Any) -> Any:
+        """Send the request through the chosen member, moving to another if its key is throttled."""
+        while True:
+            member, entry = self._pool._acquire(contents)
+            try:
+                response = member.client.models.generate_content(model=model, contents=contents, config=config)
+            except Exception as e:
+                if self._pool._release(member, entry, error=e):
+                    continue
+                raise
+            self._pool._release(member, entry, usage=getattr(response, "usage_metadata", None))
+            return response
+
+    def generate_content_stream(self, model: str, contents: Any, config: Any) -> Iterator[Any]:
+        """Stream through the chosen member; a stream is never moved once started."""
+        member, entry = self._pool._acquire(contents)
+        usage, error = None, None
+        try:
+            for chunk in member.client.models.generate_content_stream(model=model, contents=contents, config=config):
+                usage = getattr(chunk, "usage_metadata", None) or usage
+                yield chunk
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self._pool._release(member, entry, usage=usage, error=error)
+
+
+class _AsyncPoolModels:
+    """Asynchronous models namespace (pool.aio.models)."""
+
+    def __init__(self, pool: "ClientPool"):
+        self._pool = pool
+
+    async def generate_content(self, model: str, contents: Any, config: Any) -> Any:
+        """Asynchronously send the request, moving to another member if its key is throttled."""
+        while True:
+            member, entry = await self._pool._acquire_async(contents)
+            try:
+                response = await member.client.aio.models.generate_content(model=model, contents=contents, config=config)
+            except Exception as e:
+                if self._pool._release(member, entry, error=e):
+                    continue
+                raise
+            self._pool._release(member, entry, usage=getattr(response, "usage_metadata", None))
+            return response
+
+
+class ClientPool:
+    """Spreads requests over several clients (API keys), each with its own quotas and health.
+
+    Every request goes to an available member chosen by `strategy`:
+    "least_loaded" picks the fewest requests in flight (relative to the
+    member's weight), "quota_aware" the most remaining per-minute quota.
+    When a member hits its own quota the request goes elsewhere, and when
+    every member is at quota the caller waits for the first to free up.
+
+    A member answering 429 is taken out of rotation for `throttle_cooldown`
+    seconds (doubling on consecutive throttles, up to `max_cooldown`) and
+    the request is re-sent to another member. A member answering 401/403
+    (revoked or invalid key) is removed for good. Other errors are raised
+    to the caller, e.g. the retry layer in resilience.
+    """
+
+    def __init__(
+        self,
+        members: Sequence[PoolMember],
+        strategy: str = "least_loaded",
+        throttle_cooldown: float = 30.0,
+        max_cooldown: float = 600.0,
+    ):
+        """Create the pool.
+
+        Args:
+            members: Pool members; at least one is required
+            strategy: "least_loaded" or "quota_aware"
+            throttle_cooldown: Seconds a member rests after its first 429
+            max_cooldown: Upper bound of the doubling cooldown
+
+        Raises:
+            ValueError: If there are no members or the strategy is unknown
+        """
+        if not members:
+            raise ValueError("A client pool needs at least one member")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy {strategy!r}; choose from {', '.join(STRATEGIES)}")
+        self.members = list(members)
+        self.strategy = strategy
+        self.throttle_cooldown = throttle_cooldown
+        self.max_cooldown = max_cooldown
+        self.models = _PoolModels(self)
+        self.aio = SimpleNamespace(models=_AsyncPoolModels(self))
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_api_keys(
+        cls,
+        api_keys: Sequence[str],
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        strategy: str = "least_loaded",
+        **kwargs,
+    ) -> "ClientPool":
+        """Create a pool with one genai.Client per API key, all with the same quotas.
+
+        Args:
+            api_keys: Gemini API keys
+            requests_per_minute: Request quota of each key, or None for no limit
+            tokens_per_minute: Token quota of each key, or None for no limit
+            strategy: "least_loaded" or "quota_aware"
+            **kwargs: Further ClientPool arguments
+
+        Returns:
+            ClientPool over the keys
+        """
+        # Imported lazily: google.genai is slow to import and only needed here
+        from google import genai
+
+        members = [
+            PoolMember(genai.Client(api_key=key), f"key{number} (...{key[-4:]})", requests_per_minute, tokens_per_minute)
+            for number, key in enumerate(api_keys, 1)
+        ]
+        return cls(members, strategy=strategy, **kwargs)
+
+    def _choose(self, now: float, tokens: float) -> Tuple[Optional[PoolMember], float]:
+        """Pick the best available member, or return how long to wait for one."""
+        available = [member for member in self.members if member.wait_time(now, tokens) == 0.0]
+        if not available:
+            wait = min(member.wait_time(now, tokens) for member in self.members)
+            if math.isinf(wait):
+                raise RuntimeError("Every client in the pool is disabled (invalid or revoked API keys)")
+            return None, wait
+        if self.strategy == "quota_aware":
+            return max(available, key=lambda m: (m.headroom(now), -m.in_flight / m.weight)), 0.0
+        return min(available, key=lambda m: (m.in_flight / m.weight, m.requests)), 0.0
+
+    def _try_acquire(self, contents: Any) -> Tuple[Optional[PoolMember], Optional[List[float]], float]:
+        """Reserve a member for one request.
+
+        Returns:
+            (member, its quota window entry, 0.0), or (None, None, seconds to wait)
+        """
+        tokens = estimate_tokens(str(contents)) + OUTPUT_TOKEN_ESTIMATE
+        with self._lock:
+            now = time.monotonic()
+            member, wait = self._choose(now, tokens)
+            if member is None:
+                return None, None, wait
+            entry = [now, float(tokens)]
+            member._window.append(entry)
+            member.in_flight += 1
+            member.requests += 1
+            return member, entry, 0.0
+
+    def _acquire(self, contents: Any) -> Tuple[PoolMember, List[float]]:
+        """Reserve a member, sleeping while every member is at quota or throttled."""
+        while True:
+            member, entry, wait = self._try_acquire(contents)
+            if member is not None:
+                return member, entry
+            time.sleep(wait)
+
+    async def _acquire_async(self, contents: Any) -> Tuple[PoolMember, List[float]]:
+        """Reserve a member without blocking the event loop while waiting."""
+        while True:
+            member, entry, wait = self._try_acquire(contents)
+            if member is not None:
+                return member, entry
+            await asyncio.sleep(wait)
+
+    def _release(
+        self,
+        member: PoolMember,
+        entry: List[float],
+        usage: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> bool:
+        """Record the outcome of a request.
+
+        Returns:
+            True if the request should be re-sent to another member
+        """
+        with self._lock:
+            member.in_flight -= 1
+            now = time.monotonic()
+            if usage is not None:
+                # Replace the estimate with the billed tokens
+                entry[1] = float((usage.prompt_token_count or 0) + (usage.candidates_token_count or 0))
+            if error is None:
+                member.consecutive_throttles = 0
+                return False
+            code = _error_code(error)
+            if code in THROTTLE_CODES:
+                member.throttles += 1
+                member.consecutive_throttles += 1
+                cooldown = self.throttle_cooldown * 2 ** (member.consecutive_throttles - 1)
+                member.throttled_until = now + min(self.max_cooldown, cooldown)
+            elif code in REVOKED_CODES:
+                member.disabled = True
+            else:
+                member.failures += 1
+                return False
+            # Only worth re-sending if another member is healthy right now
+            return any(other.state(now) == "ok" for other in self.members if other is not member)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Return per-member counters and state.
+
+        Returns:
+            One dictionary per member with name, state, in_flight, requests,
+            throttles, failures and headroom
+        """
+        with self._lock:
+            now = time.monotonic()
+            return [
+                {
+                    "name": member.name,
+                    "state": member.state(now),
+                    "in_flight": member.in_flight,
+                    "requests": member.requests,
+                    "throttles": member.throttles,
+                    "failures": member.failures,
+                    "headroom": member.headroom(now),
+                }
+                for member in self.members
+            ]
+
+
+# The description sits between the "Job Description:" header and the closing instruction
+_DESCRIPTION_RE = re.compile(
+    r"Job Description(?: Section)?:\n(.*)\n\n(?:If a field is not mentioned|Extract all relevant information)",
+    re.DOTALL,
+)
+
+
+def rule_engine(job_description: str, fields: FrozenSet[str]) -> Dict[str, Any]:
+    """Answer a request with RuleExtractor and take the first line as the job title.
+
+    Args:
+        job_description: Job description text
+        fields: Requested field names
+
+    Returns:
+        Field values for the requested fields that could be found
+    """
+    data: Dict[str, Any] = {
+        name: guess.value for name, guess in RuleExtractor().extract(job_description).items() if name in fields
+    }
+    if "job_title" in fields:
+        first_line = next((line.strip() for line in job_description.splitlines() if line.strip()), "")
+        data["job_title"] = first_line[:120]
+    return data
+
+
+class _LocalModels:
+    """Synchronous models namespace (backend.models)."""
+
+    def __init__(self, backend: "LocalBackend"):
+        self._backend = backend
+
+    def generate_content(self, model: str, contents: Any, config: Any) -> SimpleNamespace:
+        """Answer the request locally."""
+        return self._backend._answer(contents, config)
+
+    def generate_content_stream(self, model: str, contents: Any, config: Any) -> Iterator[SimpleNamespace]:
+        """Answer the request locally as a single streamed piece."""
+        yield self._backend._answer(contents, config)
+
+
+class _AsyncLocalModels:
+    """Asynchronous models namespace (backend.aio.models)."""
+
+    def __init__(self, backend: "LocalBackend"):
+        self._backend = backend
+
+    async def generate_content(self, model: str, contents: Any, config: Any) -> SimpleNamespace:
+        """Answer the request locally."""
+        return self._backend._answer(contents, config)
+
+
+class LocalBackend:
+    """Offline backend answering extraction requests with a local engine instead of an API.
+
+    The default engine is rule_engine (pattern-matched salary, experience,
+    work type, location and skills); any callable taking (description,
+    fields) and returning field values can be used instead, e.g. a mock for
+    tests. Only single-posting requests are supported, so packed requests
+    fall back to one request per posting.
+    """
+
+    def __init__(self, engine: Optional[Callable[[str, FrozenSet[str]], Dict[str, Any]]] = None):
+        """Create the backend.
+
+        Args:
+            engine: Callable answering (description, fields); defaults to rule_engine
+        """
+        self.engine = engine or rule_engine
+        self.requests = 0
+        self.models = _LocalModels(self)
+        self.aio = SimpleNamespace(models=_AsyncLocalModels(self))
+
+    def _answer(self, contents: Any, config: Any) -> SimpleNamespace:
+        """Run the engine on the description in a prompt and encode its answer like a model response."""
+        properties = config.get("response_json_schema", {}).get("properties", {})
+        fields = frozenset(properties) & ALL_FIELDS
+        if not fields:
+            raise ValueError("LocalBackend only answers single-posting extraction requests")
+        match = _DESCRIPTION_RE.search(contents)
+        job_description = match.group(1) if match else contents
+        data = self.engine(job_description, fields)
+        if "job_title" in fields:
+            data.setdefault("job_title", "")
+        self.requests += 1
+        text = json.dumps({name: value for name, value in data.items() if name in fields})
+        usage = SimpleNamespace(prompt_token_count=estimate_tokens(contents), candidates_token_count=estimate_tokens(text))
+        return SimpleNamespace(text=text, usage_metadata=usage)
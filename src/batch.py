@@ -0,0 +1,204 @@
+"""Asynchronous bounded-concurrency batch extraction."""
+import asyncio
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterable, Optional, Set, Tuple, Union
+
+from .models import JobInformation, normalize_fields
+
+
+# Rough allowance for the structured JSON a single extraction produces
+OUTPUT_TOKEN_ESTIMATE = 1024
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheaply estimate the token count of a prompt (about 4 characters per token).
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Estimated number of tokens
+    """
+    return len(text) // 4 + 1
+
+
+@dataclass
+class BatchResult:
+    """Outcome of extracting a single job description within a batch."""
+
+    index: int
+    job_info: Optional[JobInformation] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the extraction succeeded."""
+        return self.job_info is not None
+
+
+class TokenBucket:
+    """Async token bucket refilled continuously at a per-minute rate."""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        """Create a full bucket.
+
+        Args:
+            rate_per_minute: Tokens added per minute
+            capacity: Maximum burst size (defaults to one minute of tokens)
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until `amount` tokens are available, then take them.
+
+        Waiters are served in arrival order. Requests larger than the bucket
+        capacity are clamped so they cannot block forever.
+
+        Args:
+            amount: Number of tokens to take
+        """
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+
+class RateLimiter:
+    """Combined requests-per-minute and tokens-per-minute limiter."""
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ):
+        """Create the limiter; a None quota is not enforced.
+
+        Args:
+            requests_per_minute: Request quota (RPM)
+            tokens_per_minute: Token quota (TPM)
+        """
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait for quota for one request consuming `tokens` tokens.
+
+        Args:
+            tokens: Estimated tokens for the request
+        """
+        if self.requests is not None:
+            await self.requests.acquire(1)
+        if self.tokens is not None:
+            await self.tokens.acquire(tokens)
+
+
+# Quota of the batch the current task belongs to, taken by every request it sends
+_current_limiter: ContextVar[Optional[RateLimiter]] = ContextVar("current_limiter", default=None)
+
+
+def set_rate_limiter(limiter: Optional[RateLimiter]) -> None:
+    """Make every request the current task sends from now on take quota from `limiter`.
+
+    Only the current task (and tasks it creates afterwards) are affected, as
+    each asyncio task runs in its own copy of the context.
+
+    Args:
+        limiter: Quota of the batch the task belongs to, or None for no limit
+    """
+    _current_limiter.set(limiter)
+
+
+async def acquire_quota(prompt: str) -> None:
+    """Wait for the batch's request and token quota before sending a request, if in a batch.
+
+    Called by JobExtractor for every request it actually sends (including
+    chunk, follow-up, retried and hedged requests), so postings answered
+    from the cache or near-duplicate index never wait for or use quota.
+
+    Args:
+        prompt: Prompt text of the request, for the token estimate
+    """
+    limiter = _current_limiter.get()
+    if limiter is not None:
+        await limiter.acquire(estimate_tokens(prompt) + OUTPUT_TOKEN_ESTIMATE)
+
+
+async def extract_many(
+    extractor,
+    job_descriptions: Iterable[Union[str, Tuple[str, Iterable[str]]]],
+    concurrency: int = 8,
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None,
+    fields: Optional[Iterable[str]] = None,
+) -> AsyncIterator[BatchResult]:
+    """Extract many job descriptions concurrently, yielding results as they complete.
+
+    The input iterable is consumed lazily so only a bounded window of
+    descriptions is held in memory. Failures are captured on the
+    corresponding BatchResult instead of aborting the batch. The request and
+    token quotas apply to requests actually sent (see acquire_quota).
+
+    Args:
+        extractor: JobExtractor (anything with extract_information_async)
+        job_descriptions: Iterable of raw job description texts, or of (text, fields)
+                          pairs to request a different field subset for that description
+        concurrency: Maximum number of requests in flight
+        requests_per_minute: Optional request quota to stay under
+        tokens_per_minute: Optional token quota to stay under
+        fields: Names of the JobInformation fields to extract (default: all)
+
+    Yields:
+        BatchResult objects in completion order, tagged with their input index
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+    requested = normalize_fields(fields)
+
+    async def run_one(index: int, item: Union[str, Tuple[str, Iterable[str]]]) -> BatchResult:
+        job_description, item_fields = (item[0], normalize_fields(item[1])) if isinstance(item, tuple) else (item, requested)
+        set_rate_limiter(limiter)
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                job_info = await extractor.extract_information_async(job_description, fields=item_fields)
+                return BatchResult(index, job_info=job_info, elapsed=time.perf_counter() - start)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                return BatchResult(index, error=error, elapsed=time.perf_counter() - start)
+
+    source = iter(enumerate(job_descriptions))
+    pending: Set[asyncio.Task] = set()
+    exhausted = False
+    try:
+        while True:
+            # Keep one extra window queued so the semaphore never idles
+            while not exhausted and len(pending) < concurrency * 2:
+                try:
+                    index, item = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(run_one(index, item)))
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,312 @@
+"""Background bulk extraction of uploaded CSV/JSONL/ZIP files for the web app."""
+import asyncio
+import io
+import os
+import re
+import threading
+import time
+import uuid
+import zipfile
+from contextlib import closing
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from utils.validators import validate_job_description
+
+from .cli import detect_format, read_postings, write_result
+from .job_queue import DONE, FAILED, JobQueue, run_worker
+from .models import JobInformation
+
+
+BULK_DIR = os.path.join(".cache", "bulk")
+UPLOAD_FORMATS = ("csv", "jsonl", "zip")
+_BATCH_ID_RE = re.compile(r"[0-9a-f]{12}")
+
+T = TypeVar("T")
+
+
+def read_upload(
+    name: str,
+    stream: BinaryIO,
+    text_field: str = "description",
+    id_field: str = "id",
+) -> Iterator[Tuple[str, str]]:
+    """Stream (posting_id, description) pairs from an uploaded file.
+
+    CSV and JSONL files are read like CLI input. A ZIP archive may hold any
+    mix of CSV and JSONL files, whose records are prefixed with the member
+    name to keep IDs unique, and plain-text files, each one posting whose ID
+    is the member name.
+
+    Args:
+        name: Uploaded file name, used to detect the format
+        stream: Open binary stream with the file contents
+        text_field: Name of the field holding the description text
+        id_field: Name of the field holding the posting ID
+
+    Yields:
+        Tuples of (posting_id, description)
+    """
+    if os.path.splitext(name)[1].lower() != ".zip":
+        text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        yield from read_postings(text, detect_format(name, "jsonl"), text_field, id_field)
+        return
+    with zipfile.ZipFile(stream) as archive:
+        for member in archive.infolist():
+            basename = os.path.basename(member.filename)
+            if member.is_dir() or basename.startswith(".") or member.filename.startswith("__MACOSX/"):
+                continue
+            member_format = detect_format(member.filename, "txt")
+            with archive.open(member) as raw:
+                if member_format == "txt":
+                    yield member.filename, raw.read().decode("utf-8", errors="replace")
+                    continue
+                text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+                for posting_id, description in read_postings(text, member_format, text_field, id_field):
+                    yield f"{member.filename}:{posting_id}", description
+
+
+@dataclass
+class BulkProgress:
+    """Snapshot of a bulk batch for the progress display."""
+
+    counts: Dict[str, int]
+    running: bool
+    elapsed: float
+    throughput: float
+    error: Optional[str] = None
+
+    @property
+    def total(self) -> int:
+        """Number of postings in the batch."""
+        return sum(self.counts.values())
+
+    @property
+    def finished(self) -> int:
+        """Number of postings that completed or failed."""
+        return self.counts[DONE] + self.counts[FAILED]
+
+
+class BulkJob:
+    """One uploaded batch, drained by a background thread.
+
+    The postings live in a JobQueue database of their own, so progress and
+    results are read from disk by whichever session asks for them and
+    survive both page reloads and server restarts. Extraction runs on a
+    daemon thread with its own event loop and worker pool, so it never
+    blocks a Streamlit script thread and keeps going when the session that
+    started it disconnects.
+    """
+
+    def __init__(self, batch_id: str, path: str):
+        """Attach to a batch database.
+
+        Args:
+            batch_id: Batch ID (also the database file name)
+            path: Path of the batch's JobQueue database
+        """
+        self.batch_id = batch_id
+        self.path = path
+        self.error: Optional[str] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._finished_at_start = 0
+        self._lock = threading.Lock()
+        # Connection shared by the sessions reading progress and results (see _read)
+        self._reader: Optional[JobQueue] = None
+        self._read_lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker thread is still draining the batch."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _queue(self) -> JobQueue:
+        """Open a connection for the calling thread (SQLite connections are per thread)."""
+        return JobQueue(self.path)
+
+    def _read(self, read: Callable[[JobQueue], T]) -> T:
+        """Run read(queue) on the batch's shared reader connection, opened on first use.
+
+        Streamlit reruns a script on varying threads, so the connection is
+        opened without SQLite's same-thread check and used by one thread at a time.
+        """
+        with self._read_lock:
+            if self._reader is None:
+                self._reader = JobQueue(self.path, check_same_thread=False)
+            return read(self._reader)
+
+    def start(
+        self,
+        make_extractor: Callable[[], object],
+        workers: int = 4,
+        concurrency: int = 8,
+        fields: Optional[Iterable[str]] = None,
+    ) -> bool:
+        """Start draining the batch in the background, unless it is already running.
+
+        Postings left in flight by an earlier run (e.g. before a server
+        restart) are released first, so starting again resumes the batch.
+
+        Args:
+            make_extractor: Called on the worker thread to get the JobExtractor to use
+            workers: Number of queue workers sharing the thread's event loop
+            concurrency: Postings leased and extracted at a time per worker
+            fields: Names of the JobInformation fields to extract (default: all)
+
+        Returns:
+            True if a worker thread was started
+        """
+        with self._lock:
+            if self.running:
+                return False
+            self.error = None
+            self._started_at = time.time()
+            self._finished_at = None
+            self._read(lambda queue: queue.release())
+            counts = self._read(lambda queue: queue.counts())
+            self._finished_at_start = counts[DONE] + counts[FAILED]
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(make_extractor, workers, concurrency, fields),
+                name=f"bulk-{self.batch_id}",
+                daemon=True,
+            )
+            self._thread.start()
+            return True
+
+    def _run(self, make_extractor: Callable[[], object], workers: int, concurrency: int, fields) -> None:
+        """Worker thread body: run the worker pool on a private event loop."""
+        try:
+            extractor = make_extractor()
+            with closing(self._queue()) as queue:
+                asyncio.run(self._drain(queue, extractor, workers, concurrency, fields))
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self.error = str(e)
+        finally:
+            self._finished_at = time.time()
+
+    async def _drain(self, queue: JobQueue, extractor, workers: int, concurrency: int, fields) -> None:
+        """Run `workers` queue workers until the batch is drained or stopped."""
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
+        await asyncio.gather(*(
+            run_worker(queue, extractor, f"bulk-{self.batch_id}-{n}", concurrency, fields=fields)
+            for n in range(1, workers + 1)
+        ))
+
+    def stop(self) -> None:
+        """Cancel the worker pool; in-flight postings return to pending."""
+        loop, task = self._loop, self._task
+        if self.running and loop is not None and task is not None:
+            loop.call_soon_threadsafe(task.cancel)
+
+    def progress(self) -> BulkProgress:
+        """Read the current counts and throughput since the last start."""
+        counts = self._read(lambda queue: queue.counts())
+        elapsed = 0.0
+        if self._started_at is not None:
+            elapsed = (self._finished_at or time.time()) - self._started_at
+        progress = BulkProgress(counts=counts, running=self.running, elapsed=elapsed, throughput=0.0, error=self.error)
+        if elapsed > 0:
+            progress.throughput = (progress.finished - self._finished_at_start) / elapsed
+        return progress
+
+    def results(self, limit: Optional[int] = None, offset: int = 0) -> List[Tuple[str, JobInformation]]:
+        """Read one page of completed results, in posting ID order.
+
+        Args:
+            limit: Page size, or None for all results
+            offset: Number of results to skip
+
+        Returns:
+            List of (posting_id, JobInformation) pairs
+        """
+        return self._read(lambda queue: list(queue.results(limit=limit, offset=offset)))
+
+    def failures(self) -> List[Tuple[str, int, str]]:
+        """List failed postings as (posting_id, attempts, reason)."""
+        return self._read(lambda queue: list(queue.failures()))
+
+    def export(self, output_format: str = "jsonl") -> str:
+        """Render every completed result as one combined download.
+
+        Args:
+            output_format: "jsonl" or "txt"
+
+        Returns:
+            File contents
+        """
+        output = io.StringIO()
+        for posting_id, job_info in self._read(lambda queue: list(queue.results())):
+            write_result(output, output_format, posting_id, job_info)
+        return output.getvalue()
+
+
+class BulkManager:
+    """Process-wide registry of bulk batches, so any session can reconnect by ID."""
+
+    def __init__(self, directory: str = BULK_DIR):
+        """Create a registry.
+
+        Args:
+            directory: Directory holding one queue database per batch
+        """
+        self.directory = directory
+        self._jobs: Dict[str, BulkJob] = {}
+        self._lock = threading.Lock()
+
+    def create(self, postings: Iterable[Tuple[str, str]]) -> Tuple[BulkJob, int, int]:
+        """Queue uploaded postings as a new batch.
+
+        Descriptions too short to extract are skipped, as in the CLI.
+
+        Args:
+            postings: Iterable of (posting_id, description) pairs
+
+        Returns:
+            Tuple of (batch, number queued, number skipped)
+        """
+        batch_id = uuid.uuid4().hex[:12]
+        job = BulkJob(batch_id, os.path.join(self.directory, f"{batch_id}.sqlite"))
+        skipped = 0
+
+        def valid() -> Iterator[Tuple[str, str]]:
+            nonlocal skipped
+            for posting_id, description in postings:
+                if validate_job_description(description):
+                    yield posting_id, description
+                else:
+                    skipped += 1
+
+        with closing(job._queue()) as queue:
+            added = queue.enqueue(valid())
+        with self._lock:
+            self._jobs[batch_id] = job
+        return job, added, skipped
+
+    def get(self, batch_id: str) -> Optional[BulkJob]:
+        """Reconnect to a batch by ID, including ones started before a server restart.
+
+        Args:
+            batch_id: ID returned when the batch was created
+
+        Returns:
+            The batch, or None if the ID is malformed or unknown
+        """
+        if not _BATCH_ID_RE.fullmatch(batch_id or ""):
+            return None
+        with self._lock:
+            job = self._jobs.get(batch_id)
+            if job is None:
+                path = os.path.join(self.directory, f"{batch_id}.sqlite")
+                if not os.path.exists(path):
+                    return None
+                job = self._jobs[batch_id] = BulkJob(batch_id, path)
+            return job
+
@@ -0,0 +1,285 @@
+"""Persistent on-disk cache for extraction results."""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from .models import ALL_FIELDS, JobInformation
+
+
+DEFAULT_CACHE_PATH = os.path.join(".cache", "extractions.sqlite")
+
+# Puts between recounts of the table; the running totals used for eviction
+# are updated in between, and recounting picks up writes of other processes
+RECOUNT_INTERVAL = 1000
+
+
+def normalize_description(job_description: str) -> str:
+    """Normalize a job description so trivially different reposts share a key.
+
+    Args:
+        job_description: Raw job description text
+
+    Returns:
+        Unicode-normalized text with whitespace collapsed
+    """
+    text = unicodedata.normalize("NFKC", job_description)
+    return " ".join(text.split())
+
+
+def schema_fingerprint() -> str:
+    """Fingerprint the current JobInformation JSON schema.
+
+    Any change to the fields or descriptions in models.py yields a new
+    fingerprint, which invalidates every previously cached entry.
+
+    Returns:
+        Short hex digest of the schema
+    """
+    schema = json.dumps(JobInformation.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode("utf-8")).hexdigest()[:16]
+
+
+def cache_key(
+    job_description: str,
+    model_name: str,
+    fingerprint: str,
+    fields: Optional[FrozenSet[str]] = None,
+    variant: str = "",
+) -> str:
+    """Build the content-addressed key for a description/model/schema triple.
+
+    Args:
+        job_description: Raw job description text
+        model_name: Name of the Gemini model used for extraction
+        fingerprint: Schema fingerprint from schema_fingerprint()
+        fields: Requested field subset, or None for a full extraction
+        variant: Extractor settings that change results (see JobExtractor.cache_variant)
+
+    Returns:
+        Hex digest identifying the cache entry
+    """
+    subset = ",".join(sorted(fields)) if fields is not None and fields != ALL_FIELDS else ""
+    parts = [model_name, fingerprint, subset, normalize_description(job_description)]
+    if variant:
+        parts.insert(3, variant)
+    material = "\0".join(parts)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ExtractionCache:
+    """SQLite-backed LRU cache of validated JobInformation results."""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        max_entries: Optional[int] = 10000,
+        max_bytes: Optional[int] = 100 * 1024 * 1024,
+        ttl_seconds: Optional[float] = 30 * 24 * 3600,
+    ):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file path (":memory:" for a process-local cache)
+            max_entries: Maximum number of entries kept, or None for no limit
+            max_bytes: Maximum total payload size in bytes, or None for no limit
+            ttl_seconds: Entry lifetime in seconds, or None to never expire
+        """
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.fingerprint = schema_fingerprint()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS extractions (
+                key TEXT PRIMARY KEY,
+                model_name TEXT NOT NULL,
+                schema TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_extractions_accessed ON extractions (accessed_at)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_extractions_created ON extractions (created_at)"
+        )
+        # Entries written under an older schema can never be hit again
+        with self._lock:
+            self._conn.execute("DELETE FROM extractions WHERE schema != ?", (self.fingerprint,))
+            self._puts = 0
+            self._entries, self._bytes = self._count()
+
+    def _count(self) -> Tuple[int, int]:
+        """Number of entries and total payload bytes, counted from the table."""
+        return self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM extractions"
+        ).fetchone()
+
+    def get(
+        self,
+        job_description: str,
+        model_name: str,
+        fields: Optional[FrozenSet[str]] = None,
+        variant: str = "",
+    ) -> Optional[JobInformation]:
+        """Look up a cached extraction.
+
+        Args:
+            job_description: Raw job description text
+            model_name: Name of the Gemini model used for extraction
+            fields: Requested field subset, or None for a full extraction
+            variant: Extractor settings that change results (see JobExtractor.cache_variant)
+
+        Returns:
+            Cached JobInformation, or None on a miss or expired entry
+        """
+        key = cache_key(job_description, model_name, self.fingerprint, fields, variant)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM extractions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            payload, created_at = row
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM extractions WHERE key = ?", (key,))
+                self._entries -= 1
+                self._bytes -= len(payload)
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE extractions SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return JobInformation.model_validate_json(payload)
+
+    def put(
+        self,
+        job_description: str,
+        model_name: str,
+        job_info: JobInformation,
+        fields: Optional[FrozenSet[str]] = None,
+        variant: str = "",
+    ) -> None:
+        """Store a validated extraction and evict entries over the limits.
+
+        Args:
+            job_description: Raw job description text
+            model_name: Name of the Gemini model used for extraction
+            job_info: Validated extraction result
+            fields: Requested field subset, or None for a full extraction
+            variant: Extractor settings that change results (see JobExtractor.cache_variant)
+        """
+        key = cache_key(job_description, model_name, self.fingerprint, fields, variant)
+        payload = job_info.model_dump_json()
+        now = time.time()
+        with self._lock:
+            replaced = self._conn.execute("SELECT size FROM extractions WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                """INSERT OR REPLACE INTO extractions
+                   (key, model_name, schema, payload, size, created_at, accessed_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (key, model_name, self.fingerprint, payload, len(payload), now, now),
+            )
+            if replaced is None:
+                self._entries += 1
+                self._bytes += len(payload)
+            else:
+                self._bytes += len(payload) - replaced[0]
+            self._puts += 1
+            if self._puts % RECOUNT_INTERVAL == 0:
+                self._entries, self._bytes = self._count()
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then least recently used ones over the limits.
+
+        Uses the running totals, so a put that stays within the limits only
+        costs an index lookup for expired entries rather than a table scan.
+        """
+        if self.ttl_seconds is not None:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM extractions WHERE created_at < ?",
+                (now - self.ttl_seconds,),
+            ).fetchone()
+            if count:
+                self._conn.execute("DELETE FROM extractions WHERE created_at < ?", (now - self.ttl_seconds,))
+                self._entries -= count
+                self._bytes -= total
+                self.evictions += count
+        if self.max_entries is not None and self._entries > self.max_entries:
+            rows = self._conn.execute(
+                "SELECT key, size FROM extractions ORDER BY accessed_at LIMIT ?",
+                (self._entries - self.max_entries,),
+            ).fetchall()
+            self._drop(rows)
+        if self.max_bytes is not None and self._bytes > self.max_bytes:
+            cursor = self._conn.execute("SELECT key, size FROM extractions ORDER BY accessed_at")
+            excess = self._bytes - self.max_bytes
+            rows = []
+            for key, size in cursor:
+                if excess <= 0:
+                    break
+                rows.append((key, size))
+                excess -= size
+            cursor.close()
+            self._drop(rows)
+
+    def _drop(self, rows: List[Tuple[str, int]]) -> None:
+        """Delete (key, size) entries and update the running totals."""
+        self._conn.executemany("DELETE FROM extractions WHERE key = ?", [(key,) for key, _ in rows])
+        self._entries -= len(rows)
+        self._bytes -= sum(size for _, size in rows)
+        self.evictions += len(rows)
+
+    def clear(self) -> None:
+        """Remove every cached entry and reset the counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM extractions")
+            self.hits = self.misses = self.evictions = 0
+            self._entries = self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss counters and current cache size.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, evictions, entries and bytes
+        """
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM extractions"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": total,
+        }
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,181 @@
+"""Split oversized job descriptions into section chunks and merge their extractions."""
+import re
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Tuple
+
+from .models import ALL_FIELDS
+
+
+CHUNK_PROMPT = """The following is one section of a longer job description. Extract only the information listed below, and only from this section.
+
+Extract:
+{field_list}
+
+Job Description Section:
+{job_description}
+
+If a field is not mentioned in this section, use null for optional string fields, an empty array for list fields, or an empty string for the job title."""
+
+
+# Section heading keywords -> fields that section can contribute to
+SECTION_FIELDS: Dict[str, FrozenSet[str]] = {
+    "requirements": frozenset({
+        "required_criteria", "preferred_qualifications", "skills", "education_requirements",
+        "years_of_experience", "seniority_level",
+    }),
+    "responsibilities": frozenset({"scope_of_responsibilities", "skills"}),
+    "benefits": frozenset({"benefits", "salary", "work_type", "location"}),
+    "company": frozenset({"company_name", "department", "additional_info", "location", "work_type"}),
+}
+_SECTION_PATTERNS = [
+    (kind, re.compile(pattern, re.IGNORECASE))
+    for kind, pattern in [
+        ("requirements", r"requirement|qualification|must[- ]have|nice[- ]to[- ]have|what you (?:need|bring|have)|who you are|skills|education|experience"),
+        ("responsibilities", r"responsibilit|duties|what you(?:'ll| will) do|the role|day[- ]to[- ]day|your impact"),
+        ("benefits", r"benefit|perks|compensation|salary|what we offer|why join|pay"),
+        ("company", r"about (?:us|the company|the team)|who we are|our (?:company|mission|team)"),
+    ]
+]
+_HEADING_RE = re.compile(r"^(?:#+\s*)?[^.!?]{2,80}:?$")
+
+
+class Chunk(NamedTuple):
+    """A piece of a long description and the fields requested from it."""
+
+    text: str
+    fields: FrozenSet[str]
+
+
+def _section_kind(heading: str) -> str:
+    """Classify a heading line, or return "" if it is not a known section."""
+    for kind, pattern in _SECTION_PATTERNS:
+        if pattern.search(heading):
+            return kind
+    return ""
+
+
+def split_sections(text: str) -> List[str]:
+    """Split a description into sections starting at heading lines.
+
+    A heading is a short line without sentence punctuation that either ends
+    in a colon or names a known section (requirements, benefits, ...).
+
+    Args:
+        text: Job description text
+
+    Returns:
+        Sections in order; the first holds everything before the first heading
+    """
+    sections: List[List[str]] = [[]]
+    for line in text.splitlines():
+        stripped = line.strip()
+        if (
+            stripped
+            and _HEADING_RE.match(stripped)
+            and (stripped.endswith(":") or (len(stripped.split()) <= 6 and _section_kind(stripped)))
+            and sections[-1]
+        ):
+            sections.append([])
+        sections[-1].append(line)
+    return ["\n".join(lines).strip() for lines in sections if "".join(lines).strip()]
+
+
+def labeled_sections(text: str) -> List[Tuple[str, str]]:
+    """Split a description into sections and classify each by its heading.
+
+    Args:
+        text: Job description text
+
+    Returns:
+        (kind, section) pairs in order, kind being a SECTION_FIELDS key, or ""
+        for the opening section and sections with unrecognized headings
+    """
+    return [
+        ("" if number == 0 else _section_kind(section.split("\n", 1)[0]), section)
+        for number, section in enumerate(split_sections(text))
+    ]
+
+
+def _split_oversized(section: str, chunk_chars: int) -> List[str]:
+    """Cut a section longer than chunk_chars at line boundaries (or hard, for huge lines)."""
+    pieces, current, size = [], [], 0
+    for line in section.splitlines():
+        while len(line) > chunk_chars:
+            pieces.append(line[:chunk_chars])
+            line = line[chunk_chars:]
+        if current and size + len(line) + 1 > chunk_chars:
+            pieces.append("\n".join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line) + 1
+    if current:
+        pieces.append("\n".join(current))
+    return pieces
+
+
+def plan_chunks(text: str, fields: FrozenSet[str] = ALL_FIELDS, chunk_chars: int = 4000) -> List[Chunk]:
+    """Group the sections of a long description into chunks of about chunk_chars.
+
+    The first chunk (the opening of the posting, which usually names the
+    title, company and location) is asked for every requested field. Later
+    chunks made only of recognized sections are asked just for the fields
+    those sections can contain; anything unrecognized is asked for all.
+
+    Args:
+        text: Job description text
+        fields: Requested field names
+        chunk_chars: Target maximum characters per chunk
+
+    Returns:
+        Chunks in document order; chunks with no requested fields are dropped
+    """
+    groups: List[List[str]] = []
+    kinds: List[set] = []
+    size = chunk_chars + 1
+    for kind, section in labeled_sections(text):
+        for piece in _split_oversized(section, chunk_chars):
+            if size + len(piece) > chunk_chars:
+                groups.append([])
+                kinds.append(set())
+                size = 0
+            groups[-1].append(piece)
+            kinds[-1].add(kind)
+            size += len(piece) + 2
+
+    chunks = []
+    for number, (group, group_kinds) in enumerate(zip(groups, kinds)):
+        if number == 0 or "" in group_kinds:
+            wanted = fields
+        else:
+            wanted = fields & frozenset().union(*(SECTION_FIELDS[kind] for kind in group_kinds))
+        if wanted:
+            chunks.append(Chunk("\n\n".join(group), wanted))
+    return chunks
+
+
+def merge_partials(partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge per-chunk extractions in document order.
+
+    Scalar fields take the first non-empty value; list fields are
+    concatenated with case-insensitive duplicates removed.
+
+    Args:
+        partials: Field dictionaries extracted from each chunk
+
+    Returns:
+        Merged field dictionary
+    """
+    merged: Dict[str, Any] = {}
+    seen: Dict[str, set] = {}
+    for partial in partials:
+        for name, value in partial.items():
+            if isinstance(value, list):
+                items = merged.setdefault(name, [])
+                keys = seen.setdefault(name, set())
+                for item in value:
+                    key = " ".join(str(item).lower().split())
+                    if key and key not in keys:
+                        keys.add(key)
+                        items.append(item)
+            elif value not in (None, "") and merged.get(name) in (None, ""):
+                merged[name] = value
+    return merged
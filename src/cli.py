@@ -0,0 +1,821 @@
+"""Headless command-line interface for bulk job description extraction.
+
+Usage:
+    python jobspecminer.py postings.jsonl -o results.jsonl
+    python jobspecminer.py postings.jsonl -o results.parquet
+    cat postings.csv | python jobspecminer.py --input-format csv --output-format txt
+"""
+import argparse
+import asyncio
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, TextIO, Tuple, Union
+
+from .export import COLUMNAR_FORMATS, CSVResultWriter, ResultWriter, open_result_writer
+from .file_generator import format_output_text, generate_json_file
+from utils.validators import validate_job_description
+
+
+INPUT_FORMATS = ("jsonl", "csv")
+OUTPUT_FORMATS = ("jsonl", "txt", "csv") + COLUMNAR_FORMATS
+
+
+def read_postings(
+    stream: TextIO,
+    input_format: str,
+    text_field: str = "description",
+    id_field: str = "id",
+    on_skip: Optional[Callable[[], None]] = None,
+) -> Iterator[Tuple[str, str]]:
+    """Stream (posting_id, description) pairs from JSONL or CSV input.
+
+    Records without an ID are numbered by their position in the input.
+    Malformed JSON lines, records that are not objects and descriptions
+    that are not text are reported to stderr and skipped.
+
+    Args:
+        stream: Open text stream to read from
+        input_format: "jsonl" or "csv"
+        text_field: Name of the field holding the description text
+        id_field: Name of the field holding the posting ID
+        on_skip: Called once for every skipped record
+
+    Yields:
+        Tuples of (posting_id, description)
+    """
+    def skip(message: str) -> None:
+        print(f"Skipping {message}", file=sys.stderr)
+        if on_skip is not None:
+            on_skip()
+
+    if input_format == "csv":
+        records = csv.DictReader(stream)
+    else:
+        records = (line for line in stream if line.strip())
+    for position, record in enumerate(records, 1):
+        if input_format != "csv":
+            try:
+                record = json.loads(record)
+            except json.JSONDecodeError as e:
+                skip(f"record {position}: invalid JSON ({e})")
+                continue
+            if not isinstance(record, dict):
+                skip(f"record {position}: not a JSON object")
+                continue
+        posting_id = record.get(id_field)
+        posting_id = str(posting_id if posting_id not in (None, "") else position)
+        description = record.get(text_field) or ""
+        if not isinstance(description, str):
+            skip(f"posting {posting_id}: {text_field} is not text")
+            continue
+        yield posting_id, description
+
+
+def detect_format(path: str, default: str) -> str:
+    """Guess a file format from its extension.
+
+    Args:
+        path: File path ("-" for stdin/stdout)
+        default: Format used when the extension is not recognized
+
+    Returns:
+        Format name
+    """
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension == "json":
+        extension = "jsonl"
+    if extension == "text":
+        extension = "txt"
+    if extension == "feather":
+        extension = "arrow"
+    return extension if extension in INPUT_FORMATS + OUTPUT_FORMATS else default
+
+
+class ProgressReporter:
+    """Periodically reports progress, throughput and failures to stderr."""
+
+    def __init__(self, stream: TextIO = sys.stderr, interval: float = 2.0):
+        """Create a reporter.
+
+        Args:
+            stream: Where progress lines are written
+            interval: Minimum number of seconds between progress lines
+        """
+        self.stream = stream
+        self.interval = interval
+        self.started = time.perf_counter()
+        self.last_report = self.started
+        self.succeeded = 0
+        self.failed = 0
+        self.skipped = 0
+
+    @property
+    def processed(self) -> int:
+        """Total number of postings handled so far."""
+        return self.succeeded + self.failed + self.skipped
+
+    def record(self, outcome: str) -> None:
+        """Count one posting outcome ("succeeded", "failed" or "skipped")."""
+        setattr(self, outcome, getattr(self, outcome) + 1)
+        now = time.perf_counter()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self.report()
+
+    def report(self, final: bool = False) -> None:
+        """Write a progress line."""
+        elapsed = time.perf_counter() - self.started
+        rate = self.processed / elapsed if elapsed > 0 else 0.0
+        label = "Done" if final else "Progress"
+        print(
+            f"{label}: {self.processed} processed | {self.succeeded} succeeded | "
+            f"{self.failed} failed | {self.skipped} skipped | "
+            f"{rate:.2f} postings/s | {elapsed:.1f}s elapsed",
+            file=self.stream,
+        )
+
+
+def open_output(path: str, output_format: str, row_group_size: int = 10000):
+    """Open the output for a run.
+
+    Args:
+        path: Output file path ("-" for stdout)
+        output_format: One of OUTPUT_FORMATS
+        row_group_size: Records per row group for the csv, parquet, arrow and corpus formats
+
+    Returns:
+        A text stream for jsonl/txt, otherwise a streaming ResultWriter
+
+    Raises:
+        ValueError: If a parquet, arrow or corpus output is not a file
+        ImportError: If pyarrow is needed but not installed
+    """
+    if output_format in COLUMNAR_FORMATS:
+        if path == "-":
+            raise ValueError(f"{output_format} output needs a file path (-o)")
+        return open_result_writer(path, output_format, row_group_size)
+    if output_format == "csv":
+        if path == "-":
+            return CSVResultWriter(sys.stdout, row_group_size, close_output=False)
+        return open_result_writer(path, output_format, row_group_size)
+    return sys.stdout if path == "-" else open(path, "w", encoding="utf-8")
+
+
+def write_result(output, output_format: str, posting_id: str, job_info) -> None:
+    """Write a single extraction result in the requested format.
+
+    Args:
+        output: Open text stream, or a ResultWriter for the csv/parquet/arrow/corpus formats
+        output_format: "jsonl", "txt", "csv", "parquet", "arrow" or "corpus"
+        posting_id: ID of the posting the result belongs to
+        job_info: Extracted JobInformation
+    """
+    if isinstance(output, ResultWriter):
+        output.write(posting_id, job_info)
+        return
+    if output_format == "txt":
+        extraction_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        output.write(f"Posting ID: {posting_id}\n")
+        output.write(format_output_text(job_info, extraction_date))
+        output.write("\n\n")
+    else:
+        output.write(
+            f'{{"id": {json.dumps(posting_id)}, "job_information": {generate_json_file(job_info, indent=None)}}}\n'
+        )
+    output.flush()
+
+
+async def run_extraction(
+    extractor,
+    postings: Iterator[Tuple[str, str]],
+    output,
+    output_format: str,
+    progress: ProgressReporter,
+    concurrency: int,
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None,
+    fields: Optional[List[str]] = None,
+    tracker=None,
+) -> None:
+    """Stream postings through the extractor and write results as they complete.
+
+    Args:
+        extractor: Configured JobExtractor
+        postings: Iterator of (posting_id, description) pairs
+        output: Open text stream or ResultWriter for results
+        output_format: One of OUTPUT_FORMATS
+        progress: Progress reporter to update
+        concurrency: Maximum number of requests in flight
+        requests_per_minute: Optional request quota to stay under
+        tokens_per_minute: Optional token quota to stay under
+        fields: Names of the JobInformation fields to extract (default: all)
+        tracker: Optional ChangeTracker; unchanged postings reuse their stored
+                 record and changed ones have only their affected fields re-extracted
+    """
+    # IDs (and change plans) of postings currently in flight, keyed by their batch index
+    in_flight: Dict[int, str] = {}
+    plans: Dict[int, Any] = {}
+
+    def descriptions() -> Iterator[Union[str, Tuple[str, FrozenSet[str]]]]:
+        index = 0
+        for posting_id, description in postings:
+            if not validate_job_description(description):
+                print(f"Skipping posting {posting_id}: description too short", file=sys.stderr)
+                progress.record("skipped")
+                continue
+            plan = tracker.plan(posting_id, description, fields) if tracker is not None else None
+            if plan is not None and plan.unchanged:
+                write_result(output, output_format, posting_id, plan.record)
+                progress.record("succeeded")
+                continue
+            in_flight[index] = posting_id
+            if plan is not None:
+                plans[index] = plan
+            index += 1
+            yield (description, plan.fields) if plan is not None else description
+
+    async for result in extractor.extract_many(
+        descriptions(),
+        concurrency=concurrency,
+        requests_per_minute=requests_per_minute,
+        tokens_per_minute=tokens_per_minute,
+        fields=fields,
+    ):
+        posting_id = in_flight.pop(result.index)
+        plan = plans.pop(result.index, None)
+        if result.ok:
+            job_info = tracker.commit(plan, result.job_info) if plan is not None else result.job_info
+            write_result(output, output_format, posting_id, job_info)
+            progress.record("succeeded")
+        else:
+            print(f"Failed posting {posting_id}: {result.error}", file=sys.stderr)
+            progress.record("failed")
+
+
+def report_compaction(stats: Dict[str, float]) -> None:
+    """Print the input-token savings of --compact to stderr."""
+    print(
+        f"Compaction: {stats['saved_tokens']} of {stats['original_tokens']} input tokens saved "
+        f"({stats['savings_ratio']:.1%}) over {stats['postings']} postings, "
+        f"{stats['boilerplate_paragraphs']} boilerplate paragraphs learned",
+        file=sys.stderr,
+    )
+
+
+def report_packing(stats: Dict[str, int]) -> None:
+    """Print how many postings --pack answered with shared requests to stderr."""
+    print(
+        f"Packing: {stats['packed_postings']} postings answered by {stats['packed_requests']} packed requests, "
+        f"{stats['fallbacks']} re-extracted alone",
+        file=sys.stderr,
+    )
+
+
+def report_recovery(stats: Dict[str, float]) -> None:
+    """Print how many responses needed repair or a follow-up request to stderr."""
+    print(
+        f"Repairs: {stats['repaired']} of {stats['responses']} responses repaired ({stats['repair_rate']:.1%}), "
+        f"{stats['recalled']} needed a follow-up request for {stats['fields_recalled']} fields "
+        f"({stats['recall_rate']:.1%}), {stats['failed']} unrecoverable",
+        file=sys.stderr,
+    )
+
+
+def report_tracking(stats: Dict[str, float]) -> None:
+    """Print how many extraction calls --track-changes avoided in this crawl to stderr."""
+    print(
+        f"Changes: {stats['unchanged']} of {stats['postings']} postings unchanged, {stats['partial']} partially "
+        f"and {stats['full']} fully re-extracted, {stats['new']} new | calls avoided {stats['calls_avoided_ratio']:.1%}, "
+        f"fields avoided {stats['fields_avoided_ratio']:.1%}",
+        file=sys.stderr,
+    )
+
+
+def open_metrics(metrics_path: Optional[str], metrics_log: Optional[str]) -> Tuple[list, object, Optional[TextIO]]:
+    """Create the metrics hooks requested with --metrics and --metrics-log.
+
+    Args:
+        metrics_path: Prometheus text file written when the run ends, or None
+        metrics_log: JSONL file every stage timing and token report is appended to, or None
+
+    Returns:
+        Tuple of (hooks, PrometheusMetrics or None, open log stream or None)
+    """
+    from .metrics import JSONLLogger, PrometheusMetrics
+
+    hooks = []
+    prometheus = PrometheusMetrics() if metrics_path else None
+    if prometheus is not None:
+        hooks.append(prometheus)
+    # Line-buffered append mode so concurrent worker processes interleave whole lines
+    log_stream = open(metrics_log, "a", buffering=1, encoding="utf-8") if metrics_log else None
+    if log_stream is not None:
+        hooks.append(JSONLLogger(log_stream))
+    return hooks, prometheus, log_stream
+
+
+def close_metrics(prometheus, metrics_path: Optional[str], log_stream: Optional[TextIO]) -> None:
+    """Write the Prometheus metrics file and close the JSONL log opened by open_metrics."""
+    if prometheus is not None:
+        try:
+            prometheus.write(metrics_path)
+        except OSError as e:
+            print(f"Error writing metrics to {metrics_path}: {e}", file=sys.stderr)
+    if log_stream is not None:
+        log_stream.close()
+
+
+def worker_metrics_path(metrics_path: Optional[str], worker_number: int) -> Optional[str]:
+    """Per-worker metrics file, e.g. metrics.prom -> metrics.worker2.prom."""
+    if not metrics_path:
+        return None
+    root, extension = os.path.splitext(metrics_path)
+    return f"{root}.worker{worker_number}{extension}"
+
+
+def build_client(
+    api_key: Optional[str],
+    backend: str = "gemini",
+    key_strategy: str = "least_loaded",
+    key_rpm: Optional[float] = None,
+    key_tpm: Optional[float] = None,
+):
+    """Create the client requests are sent through.
+
+    Args:
+        api_key: Gemini API key, or several separated by commas to pool them
+        backend: "gemini" for the API or "local" for the offline rule-based backend
+        key_strategy: Scheduling across pooled keys ("least_loaded" or "quota_aware")
+        key_rpm: Requests-per-minute quota of each pooled key
+        key_tpm: Tokens-per-minute quota of each pooled key
+
+    Returns:
+        LocalBackend, ClientPool, or None to let JobExtractor create a single genai.Client
+    """
+    from .backends import ClientPool, LocalBackend
+
+    if backend == "local":
+        return LocalBackend()
+    keys = [key.strip() for key in (api_key or "").split(",") if key.strip()]
+    if len(keys) > 1 or key_rpm or key_tpm:
+        return ClientPool.from_api_keys(keys, key_rpm, key_tpm, strategy=key_strategy)
+    return None
+
+
+def report_pool(client) -> None:
+    """Print per-key request and throttle counts to stderr if the client is a ClientPool."""
+    from .backends import ClientPool
+
+    if not isinstance(client, ClientPool):
+        return
+    for member in client.stats():
+        print(
+            f"API {member['name']}: {member['requests']} requests, {member['throttles']} throttled, "
+            f"{member['failures']} failed, {member['state']}",
+            file=sys.stderr,
+        )
+
+
+def build_extractor(
+    api_key: str,
+    model_name: str,
+    cache_path: Optional[str],
+    fallback_models: List[str],
+    max_attempts: int,
+    pre_extract: bool = False,
+    compact: bool = False,
+    dedup_path: Optional[str] = None,
+    dedup_threshold: float = 0.8,
+    metrics_hooks: Optional[list] = None,
+    client=None,
+    canonical_skills: bool = False,
+    skill_aliases: Optional[str] = None,
+    pack: int = 1,
+):
+    """Create a JobExtractor wrapped in the retry/hedging/fallback layer.
+
+    Args:
+        api_key: Gemini API key
+        model_name: Primary Gemini model
+        cache_path: Extraction cache database path, or None for no cache
+        fallback_models: Models tried after the primary one fails
+        max_attempts: Attempts per model on retryable errors
+        pre_extract: Fill confidently pattern-matched fields locally instead of asking the model
+        compact: Strip whitespace noise, repeated lines and learned boilerplate before sending
+        dedup_path: Near-duplicate index database path, or None to not reuse similar postings
+        dedup_threshold: Minimum estimated similarity for reusing a near-duplicate's result
+        metrics_hooks: Hooks receiving per-stage timings and token usage
+        client: Client to send requests through (see build_client), or None for a genai.Client
+        canonical_skills: Replace extracted skills by canonical names from the skill dictionary
+        skill_aliases: JSON file of extra skill aliases (implies canonical_skills)
+        pack: Short postings sent per request; above 1 the extractor is wrapped in a PackedExtractor
+
+    Returns:
+        ResilientExtractor (or PackedExtractor) ready for extract_many
+    """
+    from .cache import ExtractionCache
+    from .dedup import NearDuplicateIndex
+    from .job_extractor import JobExtractor
+    from .packing import PackedExtractor
+    from .preprocess import Preprocessor
+    from .resilience import ResilientExtractor, RetryPolicy
+    from .rule_extractor import RuleExtractor
+    from .skills import load_canonicalizer
+
+    cache = ExtractionCache(cache_path) if cache_path else None
+    extractor = JobExtractor(
+        api_key=api_key,
+        model_name=model_name,
+        cache=cache,
+        pre_extractor=RuleExtractor() if pre_extract else None,
+        preprocessor=Preprocessor() if compact else None,
+        dedup_index=NearDuplicateIndex(dedup_path, threshold=dedup_threshold) if dedup_path else None,
+        metrics_hooks=metrics_hooks,
+        client=client,
+        skill_canonicalizer=load_canonicalizer(skill_aliases) if canonical_skills or skill_aliases else None,
+    )
+    resilient = ResilientExtractor(
+        extractor,
+        fallback_models=fallback_models,
+        retry_policy=RetryPolicy(max_attempts=max_attempts),
+    )
+    if pack > 1:
+        return PackedExtractor(resilient, max_pack_size=pack)
+    return resilient
+
+
+def _queue_worker(
+    queue_path: str,
+    lease_seconds: float,
+    api_key: str,
+    model_name: str,
+    cache_path: Optional[str],
+    fallback_models: List[str],
+    max_attempts: int,
+    pre_extract: bool,
+    compact: bool,
+    dedup_path: Optional[str],
+    dedup_threshold: float,
+    metrics_path: Optional[str],
+    metrics_log: Optional[str],
+    backend: str,
+    key_strategy: str,
+    key_rpm: Optional[float],
+    key_tpm: Optional[float],
+    concurrency: int,
+    requests_per_minute: Optional[float],
+    tokens_per_minute: Optional[float],
+    fields: Optional[List[str]],
+    canonical_skills: bool,
+    skill_aliases: Optional[str],
+    pack: int,
+) -> None:
+    """Worker process entry point: drain the queue until no pending postings remain."""
+    from .job_queue import JobQueue, run_worker
+
+    job_queue = JobQueue(queue_path, lease_seconds=lease_seconds)
+    hooks, prometheus, log_stream = open_metrics(metrics_path, metrics_log)
+    client = build_client(api_key, backend, key_strategy, key_rpm, key_tpm)
+    extractor = build_extractor(
+        api_key, model_name, cache_path, fallback_models, max_attempts, pre_extract, compact,
+        dedup_path, dedup_threshold, hooks, client, canonical_skills, skill_aliases, pack,
+    )
+    try:
+        asyncio.run(
+            run_worker(
+                job_queue,
+                extractor,
+                concurrency=concurrency,
+                requests_per_minute=requests_per_minute,
+                tokens_per_minute=tokens_per_minute,
+                fields=fields,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        job_queue.close()
+        extractor.close()
+        report_recovery(extractor.extractor.recovery_stats.stats())
+        if compact:
+            report_compaction(extractor.extractor.preprocessor.stats())
+        if pack > 1:
+            report_packing(extractor.stats())
+        report_pool(client)
+        close_metrics(prometheus, metrics_path, log_stream)
+
+
+def run_queue(
+    args: argparse.Namespace,
+    postings: Optional[Iterator[Tuple[str, str]]],
+    output,
+    output_format: str,
+) -> int:
+    """Run extraction through the durable job queue and export its results.
+
+    New postings are enqueued, worker processes drain the queue, and every
+    completed result in the queue (including those from earlier runs) is
+    written to the output.
+
+    Args:
+        args: Parsed command-line arguments
+        postings: Iterator of (posting_id, description) pairs to enqueue, or None to only resume
+        output: Open text stream or ResultWriter for results
+        output_format: One of OUTPUT_FORMATS
+
+    Returns:
+        Process exit code: 0 if no posting is left failed, 1 otherwise
+    """
+    from .job_queue import DONE, FAILED, IN_FLIGHT, PENDING, JobQueue
+
+    job_queue = JobQueue(args.queue, lease_seconds=args.lease_seconds)
+    try:
+        if postings is not None:
+            skipped = 0
+
+            def valid_postings() -> Iterator[Tuple[str, str]]:
+                nonlocal skipped
+                for posting_id, description in postings:
+                    if validate_job_description(description):
+                        yield posting_id, description
+                    else:
+                        skipped += 1
+
+            added = job_queue.enqueue(valid_postings())
+            print(f"Queued {added} new postings ({skipped} skipped as too short)", file=sys.stderr)
+        if args.retry_failed:
+            print(f"Requeued {job_queue.retry_failed()} failed postings", file=sys.stderr)
+
+        counts = job_queue.counts()
+        if counts[PENDING]:
+            workers = [
+                multiprocessing.Process(
+                    target=_queue_worker,
+                    args=(
+                        args.queue,
+                        args.lease_seconds,
+                        args.api_key,
+                        args.model,
+                        args.cache,
+                        args.fallback_model,
+                        args.max_attempts,
+                        args.pre_extract,
+                        args.compact,
+                        args.dedup,
+                        args.dedup_threshold,
+                        worker_metrics_path(args.metrics, number),
+                        args.metrics_log,
+                        args.backend,
+                        args.key_strategy,
+                        args.key_rpm / args.workers if args.key_rpm else None,
+                        args.key_tpm / args.workers if args.key_tpm else None,
+                        args.concurrency,
+                        args.rpm / args.workers if args.rpm else None,
+                        args.tpm / args.workers if args.tpm else None,
+                        args.fields,
+                        args.canonical_skills,
+                        args.skill_aliases,
+                        args.pack,
+                    ),
+                )
+                for number in range(1, args.workers + 1)
+            ]
+            for worker in workers:
+                worker.start()
+            started = time.perf_counter()
+            initially_done = counts[DONE]
+            try:
+                while any(worker.is_alive() for worker in workers):
+                    for worker in workers:
+                        worker.join(timeout=args.progress_interval / len(workers))
+                    counts = job_queue.counts()
+                    elapsed = time.perf_counter() - started
+                    rate = (counts[DONE] - initially_done) / elapsed if elapsed > 0 else 0.0
+                    print(
+                        f"Progress: {counts[DONE]} done | {counts[FAILED]} failed | "
+                        f"{counts[PENDING]} pending | {counts[IN_FLIGHT]} in flight | "
+                        f"{rate:.2f} postings/s | {elapsed:.1f}s elapsed",
+                        file=sys.stderr,
+                    )
+            except KeyboardInterrupt:
+                # Workers receive the same signal and release their leases
+                for worker in workers:
+                    worker.join()
+                print("Interrupted; rerun with the same --queue to resume", file=sys.stderr)
+
+        for posting_id, job_info in job_queue.results():
+            write_result(output, output_format, posting_id, job_info)
+        for posting_id, attempts, reason in job_queue.failures():
+            print(f"Failed posting {posting_id} after {attempts} attempt(s): {reason}", file=sys.stderr)
+
+        counts = job_queue.counts()
+        print(
+            f"Done: {counts[DONE]} done | {counts[FAILED]} failed | "
+            f"{counts[PENDING]} pending | {counts[IN_FLIGHT]} in flight",
+            file=sys.stderr,
+        )
+        return 0 if counts[FAILED] == 0 else 1
+    finally:
+        job_queue.close()
+
+
+def parse_fields(value: str) -> List[str]:
+    """Parse and validate a comma-separated --fields value."""
+    from .models import normalize_fields
+
+    fields = [name.strip() for name in value.split(",") if name.strip()]
+    try:
+        normalize_fields(fields)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return fields
+
+
+def positive_int(value: str) -> int:
+    """Parse an integer option that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="jobspecminer",
+        description="Extract structured information from job descriptions in bulk.",
+    )
+    parser.add_argument("input", nargs="?", default="-", help="Input JSONL/CSV file (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="Output file (default: stdout)")
+    parser.add_argument("--input-format", choices=INPUT_FORMATS, help="Input format (default: from extension, else jsonl)")
+    parser.add_argument("--output-format", choices=OUTPUT_FORMATS, help="Output format (default: from extension, else jsonl)")
+    parser.add_argument("--row-group-size", type=int, default=10000, help="Results buffered per write for csv/parquet/arrow/corpus output")
+    parser.add_argument("--text-field", default="description", help="Field holding the job description")
+    parser.add_argument("--id-field", default="id", help="Field holding the posting ID")
+    parser.add_argument("--api-key", default=os.environ.get("GEMINI_API_KEY"), help="Gemini API key, or several comma-separated keys to pool (default: $GEMINI_API_KEY)")
+    parser.add_argument("--backend", choices=("gemini", "local"), default="gemini", help="Send requests to the Gemini API, or answer them offline with the rule-based extractor")
+    parser.add_argument("--key-strategy", choices=("least_loaded", "quota_aware"), default="least_loaded", help="How requests are spread over pooled API keys")
+    parser.add_argument("--key-rpm", type=float, help="Requests-per-minute quota of each pooled API key")
+    parser.add_argument("--key-tpm", type=float, help="Tokens-per-minute quota of each pooled API key")
+    parser.add_argument("--model", default="gemini-2.5-flash", help="Gemini model name")
+    parser.add_argument("--fallback-model", action="append", default=[], help="Model to fall back to when the primary fails (repeatable)")
+    parser.add_argument("--max-attempts", type=int, default=4, help="Attempts per model on retryable errors (429/5xx/timeouts)")
+    parser.add_argument("--fields", type=parse_fields, help="Comma-separated JobInformation fields to extract (default: all)")
+    parser.add_argument("--pre-extract", action="store_true", help="Fill salary/experience/work type/location locally when pattern matching is confident")
+    parser.add_argument("--canonical-skills", action="store_true", help="Map extracted skills to canonical names (\"JS\", \"ECMAScript\" -> \"JavaScript\") and drop duplicates")
+    parser.add_argument("--skill-aliases", help="JSON file of extra skill aliases, {\"Canonical name\": [\"alias\", ...]} (implies --canonical-skills)")
+    parser.add_argument("--compact", action="store_true", help="Strip whitespace noise, repeated lines and boilerplate learned from the input before sending")
+    parser.add_argument("--pack", type=positive_int, default=1, help="Send up to N short postings per request (1: one posting per request)")
+    parser.add_argument("--concurrency", type=positive_int, default=4, help="Maximum requests in flight")
+    parser.add_argument("--rpm", type=float, help="Requests-per-minute quota")
+    parser.add_argument("--tpm", type=float, help="Tokens-per-minute quota")
+    parser.add_argument("--cache", help="Path of an extraction cache database to use")
+    parser.add_argument("--dedup", help="Reuse results of near-duplicate postings, indexed in this SQLite database")
+    parser.add_argument("--dedup-threshold", type=float, default=0.8, help="Minimum estimated similarity (0-1) for --dedup reuse")
+    parser.add_argument("--track-changes", help="Track postings by ID in this SQLite database; re-crawled postings are re-extracted only for the fields of sections that changed")
+    parser.add_argument("--metrics", help="Write per-stage latency histograms and token counters to this file (Prometheus text format) when done")
+    parser.add_argument("--metrics-log", help="Append every stage timing, error and token report to this JSONL file")
+    parser.add_argument("--queue", help="Run through a durable, resumable job queue stored at this SQLite path")
+    parser.add_argument("--workers", type=positive_int, default=1, help="Worker processes pulling from --queue")
+    parser.add_argument("--retry-failed", action="store_true", help="Requeue postings that failed in earlier --queue runs")
+    parser.add_argument("--lease-seconds", type=float, default=600.0, help="Seconds before an unfinished --queue lease is reclaimed")
+    parser.add_argument("--progress-interval", type=float, default=2.0, help="Seconds between progress reports")
+    return parser
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Run the command-line interface.
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+
+    Returns:
+        Process exit code: 0 if every posting succeeded, 1 otherwise
+    """
+    args = build_parser().parse_args(argv)
+    input_format = args.input_format or detect_format(args.input, "jsonl")
+    output_format = args.output_format or detect_format(args.output, "jsonl")
+
+    if not args.api_key and args.backend != "local":
+        print("Error: a Gemini API key is required (--api-key or $GEMINI_API_KEY)", file=sys.stderr)
+        return 2
+
+    if args.queue and args.track_changes:
+        print("Error: --track-changes cannot be combined with --queue", file=sys.stderr)
+        return 2
+
+    if args.skill_aliases:
+        from .skills import load_aliases
+
+        try:
+            load_aliases(args.skill_aliases)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+
+    # The input is opened first so that a bad input path does not truncate an existing output
+    try:
+        input_stream = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    except OSError as e:
+        print(f"Error: cannot read input: {e}", file=sys.stderr)
+        return 2
+    try:
+        output_stream = open_output(args.output, output_format, args.row_group_size)
+    except (OSError, ValueError, ImportError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        return 2
+
+    if args.queue:
+        try:
+            # Resuming an existing queue does not need any input
+            resume_only = input_stream is sys.stdin and sys.stdin.isatty()
+            postings = None if resume_only else read_postings(input_stream, input_format, args.text_field, args.id_field)
+            return run_queue(args, postings, output_stream, output_format)
+        finally:
+            if input_stream is not sys.stdin:
+                input_stream.close()
+            if output_stream is not sys.stdout:
+                output_stream.close()
+
+    progress = ProgressReporter(interval=args.progress_interval)
+    extractor = tracker = None
+    prometheus = log_stream = None
+    try:
+        postings = read_postings(
+            input_stream, input_format, args.text_field, args.id_field, on_skip=lambda: progress.record("skipped")
+        )
+        first = next(postings, None)
+        if first is None:
+            return 0
+
+        # Built only once there is work to do so that --help and empty inputs start instantly
+        hooks, prometheus, log_stream = open_metrics(args.metrics, args.metrics_log)
+        extractor = build_extractor(
+            args.api_key, args.model, args.cache, args.fallback_model, args.max_attempts, args.pre_extract,
+            args.compact, args.dedup, args.dedup_threshold, hooks,
+            build_client(args.api_key, args.backend, args.key_strategy, args.key_rpm, args.key_tpm),
+            args.canonical_skills, args.skill_aliases, args.pack,
+        )
+
+        if args.track_changes:
+            from .tracking import ChangeTracker
+
+            tracker = ChangeTracker(args.track_changes, model_name=args.model)
+
+        def all_postings() -> Iterator[Tuple[str, str]]:
+            yield first
+            yield from postings
+
+        asyncio.run(
+            run_extraction(
+                extractor,
+                all_postings(),
+                output_stream,
+                output_format,
+                progress,
+                concurrency=args.concurrency,
+                requests_per_minute=args.rpm,
+                tokens_per_minute=args.tpm,
+                fields=args.fields,
+                tracker=tracker,
+            )
+        )
+    except KeyboardInterrupt:
+        print("Interrupted", file=sys.stderr)
+    finally:
+        progress.report(final=True)
+        if extractor is not None:
+            report_recovery(extractor.extractor.recovery_stats.stats())
+        if extractor is not None and extractor.extractor.preprocessor is not None:
+            report_compaction(extractor.extractor.preprocessor.stats())
+        if extractor is not None and args.pack > 1:
+            report_packing(extractor.stats())
+        if extractor is not None and extractor.extractor.dedup_index is not None:
+            stats = extractor.extractor.dedup_index.stats()
+            print(f"Near-duplicates: {stats['hits']} results reused, {stats['entries']} postings indexed", file=sys.stderr)
+        if tracker is not None:
+            report_tracking(tracker.stats())
+            tracker.close()
+        if extractor is not None:
+            report_pool(extractor.extractor.client)
+            extractor.close()
+        close_metrics(prometheus, args.metrics, log_stream)
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+    return 0 if progress.failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,339 @@
+"""Compact, memory-mappable columnar store for a corpus of extraction results."""
+import json
+import mmap
+import os
+import struct
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .export import FIELD_NAMES, ID_COLUMN, ResultWriter
+from .models import LIST_FIELDS, JobInformation
+
+
+MAGIC = b"JSMCORP\x01"
+_FORMAT_VERSION = 1
+_ALIGNMENT = 8
+# Magic, then the little-endian length of the JSON header that follows
+_PREAMBLE = struct.Struct("<8sQ")
+
+
+def _code_dtype(size: int) -> np.dtype:
+    """Narrowest unsigned dtype that can hold integers below `size`."""
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if size <= np.iinfo(dtype).max + 1:
+            return np.dtype(dtype)
+    return np.dtype(np.uint64)
+
+
+class CorpusWriter(ResultWriter):
+    """Writes results to a corpus file readable with Corpus.
+
+    Every field is dictionary-encoded: each distinct string is stored once
+    per field and records hold small integer codes, as narrow as the number
+    of distinct values allows, so repeated values such as "Remote",
+    "Senior" or common skills cost one or two bytes per record. List fields
+    become an offsets array plus one flat codes array. Codes and
+    dictionaries are kept in compact arrays until close(), which writes the
+    file in one go.
+    """
+
+    def __init__(self, path: str, row_group_size: int = 10000):
+        """Start a corpus file.
+
+        Args:
+            path: Output file path; written atomically on close()
+            row_group_size: Records buffered before they are encoded
+        """
+        super().__init__(row_group_size)
+        self.path = path
+        self._id_data = bytearray()
+        self._id_offsets = array("Q", [0])
+        # Per field: value -> code, with code 0 reserved for None
+        self._lookups: Dict[str, Dict[Optional[str], int]] = {name: {None: 0} for name in FIELD_NAMES}
+        self._codes: Dict[str, array] = {name: array("I") for name in FIELD_NAMES}
+        self._offsets: Dict[str, array] = {name: array("Q", [0]) for name in FIELD_NAMES if name in LIST_FIELDS}
+
+    def _write_group(self, columns: Dict[str, List], rows: int) -> None:
+        for posting_id in columns[ID_COLUMN]:
+            self._id_data += posting_id.encode("utf-8")
+            self._id_offsets.append(len(self._id_data))
+        for name in FIELD_NAMES:
+            lookup, codes = self._lookups[name], self._codes[name]
+            if name in LIST_FIELDS:
+                offsets = self._offsets[name]
+                values = [value for values in columns[name] for value in values]
+                for values_of_row in columns[name]:
+                    offsets.append(offsets[-1] + len(values_of_row))
+            else:
+                values = columns[name]
+            for value in values:
+                code = lookup.get(value)
+                if code is None:
+                    code = lookup[value] = len(lookup)
+                codes.append(code)
+
+    def _close(self) -> None:
+        arrays: Dict[str, np.ndarray] = {
+            f"{ID_COLUMN}.offsets": np.frombuffer(self._id_offsets, dtype=np.uint64).astype(
+                _code_dtype(len(self._id_data) + 1)
+            ),
+            f"{ID_COLUMN}.data": np.frombuffer(bytes(self._id_data), dtype=np.uint8),
+        }
+        for name in FIELD_NAMES:
+            strings = [value.encode("utf-8") if value is not None else b"" for value in self._lookups[name]]
+            string_offsets = np.zeros(len(strings) + 1, dtype=np.uint64)
+            np.cumsum([len(value) for value in strings], out=string_offsets[1:])
+            arrays[f"{name}.strings.offsets"] = string_offsets.astype(_code_dtype(int(string_offsets[-1]) + 1))
+            arrays[f"{name}.strings.data"] = np.frombuffer(b"".join(strings), dtype=np.uint8)
+            arrays[f"{name}.codes"] = np.frombuffer(self._codes[name], dtype=np.uint32).astype(
+                _code_dtype(len(strings))
+            )
+            if name in LIST_FIELDS:
+                offsets = np.frombuffer(self._offsets[name], dtype=np.uint64)
+                arrays[f"{name}.offsets"] = offsets.astype(_code_dtype(int(offsets[-1]) + 1))
+        _write_arrays(self.path, self.rows_written, arrays)
+
+
+def _write_arrays(path: str, records: int, arrays: Dict[str, np.ndarray]) -> None:
+    """Write named arrays after a JSON header, each aligned for zero-copy mapping."""
+    layout, position = {}, 0
+    for name, values in arrays.items():
+        layout[name] = {"offset": position, "dtype": values.dtype.str, "length": len(values)}
+        position += -(-values.nbytes // _ALIGNMENT) * _ALIGNMENT
+    header = json.dumps({
+        "version": _FORMAT_VERSION,
+        "records": records,
+        "fields": {name: "list" if name in LIST_FIELDS else "scalar" for name in FIELD_NAMES},
+        "arrays": layout,
+    }).encode("utf-8")
+    header += b" " * (-(_PREAMBLE.size + len(header)) % _ALIGNMENT)
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, len(header)))
+        f.write(header)
+        for values in arrays.values():
+            f.write(values.tobytes())
+            f.write(b"\0" * (-values.nbytes % _ALIGNMENT))
+    os.replace(temporary, path)
+
+
+class _Strings:
+    """Stored strings, decoded on access; field dictionaries keep each decoded value to share it."""
+
+    def __init__(self, offsets: np.ndarray, data: memoryview, cache: bool = True):
+        self._offsets = offsets
+        self._data = data
+        self._decoded: Optional[List[Optional[str]]] = [None] * (len(offsets) - 1) if cache else None
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, code: int) -> str:
+        decoded = self._decoded
+        if decoded is not None and decoded[code] is not None:
+            return decoded[code]
+        value = str(self._data[int(self._offsets[code]):int(self._offsets[code + 1])], "utf-8")
+        if decoded is not None:
+            decoded[code] = value
+        return value
+
+
+class Corpus:
+    """Read-only view of a corpus file, memory-mapped rather than loaded.
+
+    Opening maps the file and wraps its arrays without copying them, so it
+    takes milliseconds however large the corpus is, and pages are read
+    from disk only when touched. Records are materialized into
+    JobInformation objects only when accessed, and their strings come from
+    shared per-field dictionaries, so equal values are one object.
+    column() and value_counts() work on the integer codes directly for
+    analytics that never need whole records.
+    """
+
+    def __init__(self, path: str):
+        """Map a corpus file written by CorpusWriter.
+
+        Args:
+            path: Corpus file path
+
+        Raises:
+            ValueError: If the file is not a corpus or has an unsupported version
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, header_length = _PREAMBLE.unpack_from(self._mmap)
+        except struct.error:
+            magic, header_length = b"", 0
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a corpus file")
+        header = json.loads(self._mmap[_PREAMBLE.size:_PREAMBLE.size + header_length])
+        if header.get("version") != _FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"Unsupported corpus version in {path}: {header.get('version')}")
+        self._records = header["records"]
+        self._fields: Dict[str, str] = header["fields"]
+        self._layout: Dict[str, Dict] = header["arrays"]
+        self._data_start = _PREAMBLE.size + header_length
+        self._view = memoryview(self._mmap)
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._strings: Dict[str, _Strings] = {}
+        self._ids: Optional[_Strings] = None
+        self._rows: Optional[Dict[str, int]] = None
+
+    def _array(self, name: str) -> np.ndarray:
+        """One stored array, as a zero-copy view of the mapped file."""
+        values = self._arrays.get(name)
+        if values is None:
+            spec = self._layout[name]
+            values = self._arrays[name] = np.frombuffer(
+                self._view, dtype=np.dtype(spec["dtype"]), count=spec["length"], offset=self._data_start + spec["offset"]
+            )
+        return values
+
+    def _blob(self, name: str) -> memoryview:
+        """One stored byte array, as a memoryview of the mapped file."""
+        spec = self._layout[name]
+        start = self._data_start + spec["offset"]
+        return self._view[start:start + spec["length"]]
+
+    def strings(self, name: str) -> _Strings:
+        """The dictionary of a field: code -> string (code 0 stands for None)."""
+        strings = self._strings.get(name)
+        if strings is None:
+            strings = self._strings[name] = _Strings(self._array(f"{name}.strings.offsets"), self._blob(f"{name}.strings.data"))
+        return strings
+
+    def __len__(self) -> int:
+        """Number of records."""
+        return self._records
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the corpus file in bytes."""
+        return len(self._mmap)
+
+    def posting_id(self, row: int) -> str:
+        """Posting ID of a record."""
+        if self._ids is None:
+            self._ids = _Strings(self._array(f"{ID_COLUMN}.offsets"), self._blob(f"{ID_COLUMN}.data"), cache=False)
+        return self._ids[row]
+
+    def row_of(self, posting_id: str) -> Optional[int]:
+        """Row number of a posting ID (builds an ID index on first use), or None."""
+        if self._rows is None:
+            self._rows = {self.posting_id(row): row for row in range(self._records)}
+        return self._rows.get(posting_id)
+
+    def value(self, row: int, name: str):
+        """One field of one record without materializing the record.
+
+        Args:
+            row: Record number
+            name: JobInformation field name
+
+        Returns:
+            The field value (a list of strings for list fields)
+        """
+        strings = self.strings(name)
+        codes = self._array(f"{name}.codes")
+        if self._fields[name] == "list":
+            offsets = self._array(f"{name}.offsets")
+            return [strings[code] for code in codes[offsets[row]:offsets[row + 1]].tolist()]
+        code = int(codes[row])
+        return strings[code] if code else None
+
+    def __getitem__(self, row: int) -> JobInformation:
+        """Materialize one record.
+
+        Args:
+            row: Record number (negative numbers count from the end)
+
+        Returns:
+            JobInformation built without re-validation (it was validated when extracted)
+
+        Raises:
+            IndexError: If the row is out of range
+        """
+        if row < 0:
+            row += self._records
+        if not 0 <= row < self._records:
+            raise IndexError(f"Corpus row {row} out of range")
+        return JobInformation.model_construct(**{name: self.value(row, name) for name in FIELD_NAMES})
+
+    def get(self, posting_id: str) -> Optional[JobInformation]:
+        """Materialize the record of a posting ID, or return None if it is not stored."""
+        row = self.row_of(posting_id)
+        return self[row] if row is not None else None
+
+    def __iter__(self) -> Iterator[Tuple[str, JobInformation]]:
+        """Yield (posting_id, JobInformation) pairs in write order, one record at a time."""
+        for row in range(self._records):
+            yield self.posting_id(row), self[row]
+
+    def column(self, name: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """A field's raw codes, for vectorized analytics.
+
+        Args:
+            name: JobInformation field name
+
+        Returns:
+            Tuple of (codes, offsets). Scalar fields have one code per record
+            and offsets None; list fields have the codes of every item, with
+            record i's items at codes[offsets[i]:offsets[i + 1]]. Decode codes
+            with strings(name).
+        """
+        offsets = self._array(f"{name}.offsets") if self._fields[name] == "list" else None
+        return self._array(f"{name}.codes"), offsets
+
+    def value_counts(self, name: str, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Most common values of a field (each item counts for list fields), ignoring None.
+
+        Args:
+            name: JobInformation field name
+            limit: Number of values to return, or None for all
+
+        Returns:
+            (value, count) pairs, most frequent first
+        """
+        strings = self.strings(name)
+        counts = np.bincount(self.column(name)[0], minlength=len(strings))
+        counts[0] = 0
+        order = np.argsort(-counts, kind="stable")[:limit]
+        return [(strings[int(code)], int(counts[code])) for code in order if counts[code]]
+
+    def stats(self) -> Dict[str, float]:
+        """Storage breakdown: records, file size, bytes per record and bytes per field."""
+        per_field = {
+            name: sum(spec["length"] * np.dtype(spec["dtype"]).itemsize
+                      for array_name, spec in self._layout.items() if array_name.split(".", 1)[0] == name)
+            for name in [ID_COLUMN] + FIELD_NAMES
+        }
+        return {
+            "records": self._records,
+            "file_bytes": self.nbytes,
+            "bytes_per_record": self.nbytes / self._records if self._records else 0.0,
+            "field_bytes": per_field,
+        }
+
+    def close(self) -> None:
+        """Unmap the file (arrays returned by column() must no longer be used)."""
+        self._arrays.clear()
+        self._strings.clear()
+        self._ids = None
+        try:
+            self._view.release()
+            self._mmap.close()
+        except BufferError:
+            # Arrays handed out by column() still reference the mapping; it closes when they are freed
+            pass
+
+    def __enter__(self) -> "Corpus":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,293 @@
+"""Near-duplicate posting detection with MinHash signatures and an LSH index."""
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+from .cache import normalize_description, schema_fingerprint
+from .models import ALL_FIELDS, JobInformation, expand_subset
+
+
+DEFAULT_DEDUP_PATH = os.path.join(".cache", "near_duplicates.sqlite")
+
+_WORD_RE = re.compile(r"\w+")
+_EMPTY = np.uint64(0xFFFFFFFF)
+# Odd 64-bit multipliers combining the word hashes of a shingle
+_SHINGLE_MULTIPLIERS = np.array(
+    [
+        0x9E3779B97F4A7C15,
+        0xC2B2AE3D27D4EB4F,
+        0x165667B19E3779F9,
+        0x27D4EB2F165667C5,
+        0xFF51AFD7ED558CCD,
+        0xC4CEB9FE1A85EC53,
+        0x94D049BB133111EB,
+        0xBF58476D1CE4E5B9,
+    ],
+    dtype=np.uint64,
+)
+
+
+def minhash_signature(text: str, num_hashes: int = 128, shingle_size: int = 5) -> np.ndarray:
+    """Compute a MinHash signature over the word shingles of a description.
+
+    Uses one-permutation hashing: every shingle is hashed once, the hash
+    picks one of `num_hashes` bins and each bin keeps its minimum. Empty
+    bins are filled from the next non-empty bin (rotation densification),
+    so short texts still get comparable signatures. The fraction of equal
+    positions in two signatures estimates the Jaccard similarity of their
+    shingle sets.
+
+    Args:
+        text: Job description text (normalized internally)
+        num_hashes: Signature length; must be a power of two
+        shingle_size: Number of consecutive words per shingle
+
+    Returns:
+        uint32 array of length num_hashes
+    """
+    words = _WORD_RE.findall(normalize_description(text).lower())
+    word_hashes = np.fromiter(
+        map(zlib.crc32, (word.encode("utf-8") for word in words)), dtype=np.uint64, count=len(words)
+    )
+    size = max(1, min(shingle_size, len(words)))
+    count = len(words) - size + 1
+    hashes = np.zeros(max(count, 0), dtype=np.uint64)
+    for offset in range(size):
+        hashes += word_hashes[offset:offset + count] * _SHINGLE_MULTIPLIERS[offset]
+    # Final avalanche so both bin and value bits are well mixed
+    hashes ^= hashes >> np.uint64(31)
+    hashes *= np.uint64(0xBF58476D1CE4E5B9)
+    hashes ^= hashes >> np.uint64(29)
+
+    signature = np.full(num_hashes, _EMPTY, dtype=np.uint64)
+    np.minimum.at(signature, (hashes & np.uint64(num_hashes - 1)).astype(np.intp), hashes >> np.uint64(32))
+    filled = np.flatnonzero(signature != _EMPTY)
+    if 0 < len(filled) < num_hashes:
+        positions = np.arange(num_hashes)
+        source = filled[np.searchsorted(filled, positions) % len(filled)]
+        distance = (source - positions) % num_hashes
+        signature = (signature[source] + distance.astype(np.uint64) * np.uint64(0x9E3779B1)) & _EMPTY
+    return signature.astype(np.uint32)
+
+
+def estimate_similarity(first: np.ndarray, second: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    return float(np.count_nonzero(first == second)) / len(first)
+
+
+class NearDuplicateIndex:
+    """Persistent LSH index from MinHash signatures to extracted JobInformation.
+
+    Signatures are cut into `bands` bands of equal width; two postings
+    become candidates when any band matches exactly, and candidates are
+    accepted when their estimated Jaccard similarity reaches `threshold`.
+    Candidates are ranked by the number of bands they share and only the
+    top `max_candidates` are compared. Band buckets live in an indexed
+    SQLite table, so a lookup is one index probe per band plus the rows of
+    the matching buckets, and the index can be grown incrementally and
+    shared between processes.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_DEDUP_PATH,
+        threshold: float = 0.8,
+        num_hashes: int = 128,
+        bands: int = 16,
+        shingle_size: int = 5,
+        max_candidates: int = 50,
+    ):
+        """Open (or create) the index database.
+
+        Args:
+            path: SQLite database file path (":memory:" for a process-local index)
+            threshold: Minimum estimated Jaccard similarity to reuse a result
+            num_hashes: MinHash signature length (a power of two divisible by bands)
+            bands: Number of LSH bands; more bands find less similar candidates
+            shingle_size: Number of consecutive words per shingle
+            max_candidates: Candidates compared per lookup (those sharing the most bands)
+        """
+        if num_hashes & (num_hashes - 1) or num_hashes % bands:
+            raise ValueError("num_hashes must be a power of two divisible by bands")
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.threshold = threshold
+        self.num_hashes = num_hashes
+        self.bands = bands
+        self.shingle_size = shingle_size
+        self.max_candidates = max_candidates
+        self.fingerprint = schema_fingerprint()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=60.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS documents (
+                doc_id INTEGER PRIMARY KEY,
+                model_name TEXT NOT NULL,
+                schema TEXT NOT NULL,
+                signature BLOB NOT NULL,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS buckets (
+                bucket INTEGER NOT NULL,
+                doc_id INTEGER NOT NULL,
+                PRIMARY KEY (bucket, doc_id)
+            ) WITHOUT ROWID"""
+        )
+        # Results extracted under an older schema can never be reused
+        with self._lock:
+            stale = "SELECT doc_id FROM documents WHERE schema != ?"
+            self._conn.execute(f"DELETE FROM buckets WHERE doc_id IN ({stale})", (self.fingerprint,))
+            self._conn.execute("DELETE FROM documents WHERE schema != ?", (self.fingerprint,))
+
+    def signature(self, job_description: str) -> np.ndarray:
+        """MinHash signature of a description with this index's parameters."""
+        return minhash_signature(job_description, self.num_hashes, self.shingle_size)
+
+    def _buckets(self, signature: np.ndarray) -> List[int]:
+        """LSH bucket keys of a signature, one per band (the band number is part of the key)."""
+        return [
+            int.from_bytes(
+                hashlib.blake2b(rows.tobytes(), digest_size=8, salt=band.to_bytes(16, "big")).digest(),
+                "big",
+                signed=True,
+            )
+            for band, rows in enumerate(signature.reshape(self.bands, -1))
+        ]
+
+    def find(
+        self,
+        job_description: str,
+        model_name: str,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> Optional[JobInformation]:
+        """Find the extraction of the most similar indexed posting.
+
+        Args:
+            job_description: Raw job description text
+            model_name: Only results extracted by this model are reused
+            fields: Requested field subset, or None for a full extraction
+
+        Returns:
+            Stored JobInformation (restricted to `fields`), or None if no
+            indexed posting reaches the similarity threshold
+        """
+        match = self.find_similar(job_description, model_name)
+        if match is None:
+            return None
+        job_info = match[1]
+        if fields is not None and fields != ALL_FIELDS:
+            return expand_subset(job_info.model_dump(include=set(fields)))
+        return job_info
+
+    def find_similar(self, job_description: str, model_name: str) -> Optional[Tuple[float, JobInformation]]:
+        """Find the most similar indexed posting above the threshold.
+
+        Args:
+            job_description: Raw job description text
+            model_name: Only results extracted by this model are considered
+
+        Returns:
+            (estimated similarity, JobInformation), or None if there is no match
+        """
+        signature = self.signature(job_description)
+        buckets = self._buckets(signature)
+        placeholders = ",".join("?" * len(buckets))
+        with self._lock:
+            # Candidates sharing the most bands are the most similar ones, so they are
+            # compared first when more than max_candidates share a band (e.g. boilerplate)
+            rows = self._conn.execute(
+                f"""SELECT documents.doc_id, documents.signature
+                    FROM (SELECT doc_id, COUNT(*) AS shared FROM buckets
+                          WHERE bucket IN ({placeholders}) GROUP BY doc_id) AS candidates
+                    JOIN documents ON documents.doc_id = candidates.doc_id
+                    WHERE documents.model_name = ?
+                    ORDER BY candidates.shared DESC
+                    LIMIT ?""",
+                (*buckets, model_name, self.max_candidates),
+            ).fetchall()
+            best_id, best_similarity = None, self.threshold
+            for doc_id, stored in rows:
+                similarity = estimate_similarity(signature, np.frombuffer(stored, dtype=np.uint32))
+                if similarity >= best_similarity:
+                    best_id, best_similarity = doc_id, similarity
+            if best_id is None:
+                self.misses += 1
+                return None
+            payload = self._conn.execute(
+                "SELECT payload FROM documents WHERE doc_id = ?", (best_id,)
+            ).fetchone()[0]
+            self.hits += 1
+        return best_similarity, JobInformation.model_validate_json(payload)
+
+    def add(self, job_description: str, model_name: str, job_info: JobInformation) -> int:
+        """Index a posting together with its full extraction.
+
+        Args:
+            job_description: Raw job description text
+            model_name: Name of the model the result was extracted with
+            job_info: Validated extraction result covering all fields
+
+        Returns:
+            ID of the new index entry
+        """
+        signature = self.signature(job_description)
+        buckets = self._buckets(signature)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = self._conn.execute(
+                    """INSERT INTO documents (model_name, schema, signature, payload, created_at)
+                       VALUES (?, ?, ?, ?, ?)""",
+                    (model_name, self.fingerprint, signature.tobytes(), job_info.model_dump_json(), time.time()),
+                )
+                doc_id = cursor.lastrowid
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO buckets (bucket, doc_id) VALUES (?, ?)",
+                    [(bucket, doc_id) for bucket in buckets],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return doc_id
+
+    def __len__(self) -> int:
+        """Number of indexed postings."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def stats(self) -> Dict[str, float]:
+        """Return lookup counters and index size.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate and entries
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self),
+        }
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,234 @@
+"""Streaming columnar writers (Parquet, Arrow IPC, flat CSV) for extraction results."""
+import csv
+from typing import Any, Dict, List, Optional, TextIO
+
+from .models import LIST_FIELDS, JobInformation
+
+
+COLUMNAR_FORMATS = ("parquet", "arrow", "corpus")
+ID_COLUMN = "posting_id"
+FIELD_NAMES = list(JobInformation.model_fields)
+
+
+def arrow_schema():
+    """Arrow schema of an exported result: the posting ID, then one column per field.
+
+    List fields such as skills become list<string> columns; every other
+    field is a nullable string.
+    """
+    import pyarrow as pa
+
+    return pa.schema(
+        [pa.field(ID_COLUMN, pa.string(), nullable=False)]
+        + [
+            pa.field(name, pa.list_(pa.string()) if name in LIST_FIELDS else pa.string())
+            for name in FIELD_NAMES
+        ]
+    )
+
+
+def _require_pyarrow():
+    """Import pyarrow, with an install hint when it is missing."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("Parquet and Arrow export need pyarrow: pip install pyarrow") from e
+    return pyarrow
+
+
+class ResultWriter:
+    """Base class for writers that append results one row group at a time.
+
+    Records are buffered column by column and handed to `_write_group`
+    every `row_group_size` rows, so memory stays bounded by one row group
+    however many results are written. Use as a context manager, or call
+    close() to flush the last partial group.
+    """
+
+    def __init__(self, row_group_size: int = 10000):
+        """Create a writer.
+
+        Args:
+            row_group_size: Records buffered before each write
+        """
+        if row_group_size < 1:
+            raise ValueError("row_group_size must be at least 1")
+        self.row_group_size = row_group_size
+        self.rows_written = 0
+        self._columns: Dict[str, List[Any]] = self._empty_columns()
+        self._buffered = 0
+
+    @staticmethod
+    def _empty_columns() -> Dict[str, List[Any]]:
+        """One empty list per output column."""
+        return {name: [] for name in [ID_COLUMN] + FIELD_NAMES}
+
+    def write(self, posting_id: str, job_info: JobInformation) -> None:
+        """Append one result, writing a row group when the buffer is full.
+
+        Args:
+            posting_id: ID of the posting the result belongs to
+            job_info: Extracted JobInformation
+        """
+        values = job_info.__dict__
+        columns = self._columns
+        columns[ID_COLUMN].append(posting_id)
+        for name in FIELD_NAMES:
+            columns[name].append(values[name])
+        self._buffered += 1
+        if self._buffered >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered records, if any, as one row group."""
+        if not self._buffered:
+            return
+        self._write_group(self._columns, self._buffered)
+        self.rows_written += self._buffered
+        self._columns = self._empty_columns()
+        self._buffered = 0
+
+    def close(self) -> None:
+        """Flush the last row group and finalize the output."""
+        self.flush()
+        self._close()
+
+    def _write_group(self, columns: Dict[str, List[Any]], rows: int) -> None:
+        """Write one row group of buffered columns."""
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        """Finalize the output after the last flush."""
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ParquetResultWriter(ResultWriter):
+    """Writes results to a Parquet file, one Parquet row group per buffered group."""
+
+    def __init__(self, path: str, row_group_size: int = 10000, compression: str = "zstd"):
+        """Open a Parquet file for writing.
+
+        Args:
+            path: Output file path
+            row_group_size: Records per row group
+            compression: Parquet codec ("zstd", "snappy", "gzip" or "none")
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        pa = _require_pyarrow()
+        import pyarrow.parquet as pq
+
+        super().__init__(row_group_size)
+        self._pa = pa
+        self._schema = arrow_schema()
+        self._writer = pq.ParquetWriter(path, self._schema, compression=compression)
+
+    def _write_group(self, columns: Dict[str, List[Any]], rows: int) -> None:
+        self._writer.write_batch(self._pa.RecordBatch.from_pydict(columns, schema=self._schema))
+
+    def _close(self) -> None:
+        self._writer.close()
+
+
+class ArrowResultWriter(ResultWriter):
+    """Writes results to an Arrow IPC file (Feather v2), one record batch per buffered group."""
+
+    def __init__(self, path: str, row_group_size: int = 10000, compression: Optional[str] = "zstd"):
+        """Open an Arrow IPC file for writing.
+
+        Args:
+            path: Output file path
+            row_group_size: Records per record batch
+            compression: Buffer codec ("zstd", "lz4" or None)
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        pa = _require_pyarrow()
+
+        super().__init__(row_group_size)
+        self._pa = pa
+        self._schema = arrow_schema()
+        self._sink = pa.OSFile(path, "wb")
+        self._writer = pa.ipc.new_file(
+            self._sink, self._schema, options=pa.ipc.IpcWriteOptions(compression=compression)
+        )
+
+    def _write_group(self, columns: Dict[str, List[Any]], rows: int) -> None:
+        self._writer.write_batch(self._pa.RecordBatch.from_pydict(columns, schema=self._schema))
+
+    def _close(self) -> None:
+        self._writer.close()
+        self._sink.close()
+
+
+class CSVResultWriter(ResultWriter):
+    """Writes results as flat CSV, joining list fields into one cell."""
+
+    def __init__(
+        self,
+        output: TextIO,
+        row_group_size: int = 10000,
+        list_separator: str = "; ",
+        close_output: bool = True,
+    ):
+        """Start a CSV file with a header row.
+
+        Args:
+            output: Text stream opened with newline=""
+            row_group_size: Records buffered before each write
+            list_separator: Separator between the items of a list field
+            close_output: Close `output` when the writer is closed
+        """
+        super().__init__(row_group_size)
+        self.list_separator = list_separator
+        self._output = output
+        self._close_output = close_output
+        self._writer = csv.writer(output)
+        self._writer.writerow([ID_COLUMN] + FIELD_NAMES)
+
+    def _write_group(self, columns: Dict[str, List[Any]], rows: int) -> None:
+        separator = self.list_separator
+        cells = [
+            [separator.join(value) for value in values] if name in LIST_FIELDS else values
+            for name, values in columns.items()
+        ]
+        self._writer.writerows(zip(*cells))
+        self._output.flush()
+
+    def _close(self) -> None:
+        if self._close_output:
+            self._output.close()
+
+
+def open_result_writer(path: str, output_format: str, row_group_size: int = 10000) -> ResultWriter:
+    """Open a streaming writer for a file path.
+
+    Args:
+        path: Output file path
+        output_format: "parquet", "arrow", "corpus" or "csv"
+        row_group_size: Records per row group
+
+    Returns:
+        A ResultWriter; close it to finish the file
+
+    Raises:
+        ValueError: If the format is not a streaming export format
+    """
+    if output_format == "parquet":
+        return ParquetResultWriter(path, row_group_size)
+    if output_format == "arrow":
+        return ArrowResultWriter(path, row_group_size)
+    if output_format == "corpus":
+        from .corpus import CorpusWriter
+
+        return CorpusWriter(path, row_group_size)
+    if output_format == "csv":
+        return CSVResultWriter(open(path, "w", newline="", encoding="utf-8"), row_group_size)
+    raise ValueError(f"Unsupported export format: {output_format}")
@@ -1,5 +1,7 @@
 """File generation utilities for job extraction results."""
 from datetime import datetime
+from typing import Optional
+
 from .models import JobInformation
 
 
@@ -115,13 +117,14 @@ def generate_txt_file(job_info: JobInformation) -> str:
     return format_output_text(job_info, extraction_date)
 
 
-def generate_json_file(job_info: JobInformation) -> str:
+def generate_json_file(job_info: JobInformation, indent: Optional[int] = 2) -> str:
     """Generate JSON file content.
     
     Args:
         job_info: Extracted job information
+        indent: Indentation level, or None for a single line (e.g. JSONL output)
         
     Returns:
         JSON string with indentation
     """
-    return job_info.model_dump_json(indent=2, exclude_none=True)
+    return job_info.model_dump_json(indent=indent, exclude_none=True)
@@ -1,38 +1,38 @@
 """Main application for extracting job information using Gemini API."""
+import asyncio
+import contextlib
+import contextvars
 import sys
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
-from google import genai
 from pydantic import ValidationError
 
-from .models import JobInformation
+from .batch import BatchResult, acquire_quota, extract_many
+from .cache import ExtractionCache
+from .chunking import CHUNK_PROMPT, Chunk, merge_partials, plan_chunks
+from .dedup import NearDuplicateIndex
+from .metrics import Instrumentation, MetricsHook
+from .models import (
+    ALL_FIELDS,
+    JobInformation,
+    describe_fields,
+    expand_subset,
+    job_information_schema,
+    job_information_subset,
+    normalize_fields,
+)
+from .partial_json import ParseEvent, PartialJSONParser
+from .preprocess import Preprocessor
+from .repair import RecoveryStats, recover
+from .rule_extractor import RuleExtractor
+from .skills import SkillCanonicalizer
 
 
-class JobExtractor:
-    """Extracts structured information from job descriptions using Gemini API."""
-    
-    def __init__(self, api_key: str, model_name: str = "gemini-2.5-flash"):
-        """Initialize the job extractor with Gemini API.
-        
-        Args:
-            api_key: Gemini API key
-            model_name: Name of the Gemini model to use (e.g., gemini-2.5-flash, gemini-2.0-flash)
-                       Must support structured outputs
-        """
-        self.client = genai.Client(api_key=api_key)
-        self.model_name = model_name
-        
-    def extract_information(self, job_description: str) -> Optional[JobInformation]:
-        """Extract structured information from a job description using Gemini structured outputs.
-        
-        Args:
-            job_description: Raw job description text
-            
-        Returns:
-            JobInformation object with extracted data, or None if extraction fails
-        """
-        prompt = f"""Analyze the following job description and extract all relevant structured information.
+EXTRACTION_PROMPT = """Analyze the following job description and extract all relevant structured information.
 
 Extract information about:
 - Job title, company name, and department
@@ -52,28 +52,155 @@ Job Description:
 
 Extract all relevant information. If a field is not mentioned in the job description, use null for optional string fields or an empty array for list fields."""
 
-        try:
-            # Use structured outputs with Pydantic schema
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config={
-                    "response_mime_type": "application/json",
-                    "response_json_schema": JobInformation.model_json_schema(),
-                },
-            )
+
+SUBSET_PROMPT = """Analyze the following job description and extract only the information listed below.
+
+Extract:
+{field_list}
+
+Job Description:
+{job_description}
+
+If a field is not mentioned in the job description, use null for optional string fields or an empty array for list fields."""
+
+
+# Shared no-op stage context used when no metrics hooks are installed
+_UNTIMED = contextlib.nullcontext()
+
+
+class RequestScope:
+    """Counts the requests one extraction sends, and can stop it from sending more."""
+    
+    def __init__(self):
+        self.sent = 0
+        self.cancelled = False
+    
+    def cancel(self) -> None:
+        """Make the extraction's next sync request raise CancelledError.
+        
+        A request already waiting for its response cannot be interrupted;
+        this stops the chunk and follow-up requests that would come after it.
+        """
+        self.cancelled = True
+
+
+_request_scope: ContextVar[Optional[RequestScope]] = ContextVar("request_scope", default=None)
+
+
+@contextlib.contextmanager
+def request_scope(scope: Optional[RequestScope] = None) -> Iterator[RequestScope]:
+    """Run extractions in a RequestScope, including the chunk threads and tasks they start.
+    
+    Args:
+        scope: Scope to use (a new one by default)
+        
+    Yields:
+        The scope, whose sent count tells whether a request reached the network
+    """
+    scope = scope or RequestScope()
+    token = _request_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _request_scope.reset(token)
+
+
+class JobExtractor:
+    """Extracts structured information from job descriptions using Gemini API."""
+    
+    def __init__(
+        self,
+        api_key: Optional[str],
+        model_name: str = "gemini-2.5-flash",
+        cache: Optional[ExtractionCache] = None,
+        pre_extractor: Optional[RuleExtractor] = None,
+        min_rule_confidence: float = 0.85,
+        preprocessor: Optional[Preprocessor] = None,
+        dedup_index: Optional[NearDuplicateIndex] = None,
+        long_posting_chars: Optional[int] = 12000,
+        chunk_chars: int = 4000,
+        chunk_workers: int = 8,
+        metrics_hooks: Optional[Iterable[MetricsHook]] = None,
+        client: Optional[Any] = None,
+        skill_canonicalizer: Optional[SkillCanonicalizer] = None,
+    ):
+        """Initialize the job extractor with Gemini API.
+        
+        Args:
+            api_key: Gemini API key (unused when client is given)
+            model_name: Name of the Gemini model to use (e.g., gemini-2.5-flash, gemini-2.0-flash)
+                       Must support structured outputs
+            cache: Optional extraction cache consulted before calling the API
+            pre_extractor: Optional rule-based extractor; fields it finds with at least
+                           min_rule_confidence are filled locally and not requested from the model
+            min_rule_confidence: Confidence needed to trust a locally extracted field
+            preprocessor: Optional compactor applied to descriptions before they are sent
+            dedup_index: Optional near-duplicate index; results of sufficiently similar,
+                         already extracted postings are reused instead of calling the API
+            long_posting_chars: Descriptions longer than this are split into section chunks
+                                extracted concurrently (None to always send them whole)
+            chunk_chars: Target maximum characters per chunk
+            chunk_workers: Threads shared by the chunk requests of all synchronous
+                           extractions, bounding them however many postings are in flight
+            metrics_hooks: Optional hooks receiving per-stage timings (lookup, pre_extract,
+                           compact, prompt, schema, request, validate, recover) and the
+                           token usage of every response
+            client: Object to use instead of a genai.Client (anything exposing the same
+                    models.generate_content, models.generate_content_stream and
+                    aio.models.generate_content methods), e.g. an offline stand-in
+            skill_canonicalizer: Optional canonicalizer; extracted skills are replaced by
+                                 their canonical names ("JS" -> "JavaScript") and deduplicated
+        """
+        if client is None:
+            # Imported lazily: google.genai is slow to import and only needed here
+            from google import genai
+            client = genai.Client(api_key=api_key)
+        
+        self.client = client
+        self.model_name = model_name
+        self.cache = cache
+        self.pre_extractor = pre_extractor
+        self.min_rule_confidence = min_rule_confidence
+        self.preprocessor = preprocessor
+        self.dedup_index = dedup_index
+        self.long_posting_chars = long_posting_chars
+        self.chunk_chars = chunk_chars
+        self.chunk_workers = chunk_workers
+        # Created on the first chunked posting, then shared by all of them
+        self._chunk_pool: Optional[ThreadPoolExecutor] = None
+        self._chunk_pool_lock = threading.Lock()
+        self.skill_canonicalizer = skill_canonicalizer
+        self.recovery_stats = RecoveryStats()
+        hooks = list(metrics_hooks or [])
+        self.instrumentation = Instrumentation(hooks) if hooks else None
+        
+    def extract_information(
+        self,
+        job_description: str,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Optional[JobInformation]:
+        """Extract structured information from a job description using Gemini structured outputs.
+        
+        Args:
+            job_description: Raw job description text
+            fields: Names of the JobInformation fields to extract (default: all). Only
+                    these are requested from the model; the rest keep their defaults.
             
-            # Validate and parse the structured response
-            job_info = JobInformation.model_validate_json(response.text)
+        Returns:
+            JobInformation object with extracted data, or None if extraction fails
+        """
+        requested = normalize_fields(fields)
+        known = self._lookup(job_description, requested)
+        if known is not None:
+            return known
+        
+        try:
+            job_info = self.generate(job_description, fields=requested)
+            self._remember(job_description, requested, job_info)
             return job_info
             
         except ValidationError as e:
             print(f"Error validating extracted data: {e}", file=sys.stderr)
-            try:
-                if hasattr(response, 'text'):
-                    print(f"Response was: {response.text[:500]}", file=sys.stderr)
-            except NameError:
-                pass  # response not defined yet
             return None
         except Exception as e:
             print(f"Error extracting information: {e}", file=sys.stderr)
@@ -81,6 +208,531 @@ Extract all relevant information. If a field is not mentioned in the job descrip
                 print(f"Underlying error: {e.__cause__}", file=sys.stderr)
             return None
     
+    async def extract_information_async(
+        self,
+        job_description: str,
+        fields: Optional[Iterable[str]] = None,
+    ) -> JobInformation:
+        """Asynchronously extract structured information from a job description.
+        
+        Unlike extract_information, failures are raised rather than printed so
+        that batch callers can record them per item.
+        
+        Args:
+            job_description: Raw job description text
+            fields: Names of the JobInformation fields to extract (default: all)
+            
+        Returns:
+            JobInformation object with extracted data
+            
+        Raises:
+            ValidationError: If the response does not match the JobInformation schema
+            Exception: Any error raised by the Gemini client
+        """
+        requested = normalize_fields(fields)
+        known = self._lookup(job_description, requested)
+        if known is not None:
+            return known
+        
+        job_info = await self.generate_async(job_description, fields=requested)
+        self._remember(job_description, requested, job_info)
+        return job_info
+    
+    def generate(
+        self,
+        job_description: str,
+        model_name: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> JobInformation:
+        """Send a single extraction request, without caching or error handling.
+        
+        No request is sent at all when the pre-extractor already covers every
+        requested field. Long descriptions are split into section chunks that
+        are extracted concurrently and merged.
+        
+        Args:
+            job_description: Raw job description text
+            model_name: Model to use instead of self.model_name
+            fields: Names of the JobInformation fields to extract (default: all)
+            
+        Returns:
+            JobInformation object validated from the structured response
+            
+        Raises:
+            ValidationError: If the response does not match the JobInformation schema
+            Exception: Any error raised by the Gemini client
+        """
+        return self._canonical(self._generate(job_description, model_name, fields))
+    
+    def _generate(
+        self,
+        job_description: str,
+        model_name: Optional[str],
+        fields: Optional[Iterable[str]],
+    ) -> JobInformation:
+        """Body of generate(), before skill canonicalization."""
+        local, remaining = self._plan(job_description, fields)
+        if not remaining:
+            return expand_subset(local)
+        text, chunks = self._prepare(job_description, remaining)
+        if chunks:
+            return self._extract_chunks(chunks, model_name, local)
+        # Use structured outputs with Pydantic schema
+        response = self._send(self._request(text, remaining, model_name))
+        # Validate and parse the structured response, repairing it if needed
+        try:
+            with self._stage("validate"):
+                return self._parse(response.text, remaining, local, self.recovery_stats)
+        except ValidationError:
+            with self._stage("recover"):
+                return self._recover(response.text, text, remaining, local, model_name)
+    
+    async def generate_async(
+        self,
+        job_description: str,
+        model_name: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> JobInformation:
+        """Asynchronously send a single extraction request, without caching or error handling.
+        
+        Args:
+            job_description: Raw job description text
+            model_name: Model to use instead of self.model_name
+            fields: Names of the JobInformation fields to extract (default: all)
+            
+        Returns:
+            JobInformation object validated from the structured response
+            
+        Raises:
+            ValidationError: If the response does not match the JobInformation schema
+            Exception: Any error raised by the Gemini client
+        """
+        return self._canonical(await self._generate_async(job_description, model_name, fields))
+    
+    async def _generate_async(
+        self,
+        job_description: str,
+        model_name: Optional[str],
+        fields: Optional[Iterable[str]],
+    ) -> JobInformation:
+        """Body of generate_async(), before skill canonicalization."""
+        local, remaining = self._plan(job_description, fields)
+        if not remaining:
+            return expand_subset(local)
+        text, chunks = self._prepare(job_description, remaining)
+        if chunks:
+            partials = await asyncio.gather(*(self._extract_chunk_async(chunk, model_name) for chunk in chunks))
+            return self._merge(partials, local)
+        response = await self._send_async(self._request(text, remaining, model_name))
+        try:
+            with self._stage("validate"):
+                return self._parse(response.text, remaining, local, self.recovery_stats)
+        except ValidationError:
+            with self._stage("recover"):
+                return await self._recover_async(response.text, text, remaining, local, model_name)
+    
+    def extract_information_stream(
+        self,
+        job_description: str,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Iterator[ParseEvent]:
+        """Stream an extraction, yielding fields as soon as they are complete.
+        
+        Uses the streaming generate-content API and an incremental JSON parser,
+        so callers can render the title, company, individual skills and so on
+        long before the full response has arrived. The final event has kind
+        "complete" and carries the JobInformation validated from the full text.
+        
+        Args:
+            job_description: Raw job description text
+            fields: Names of the JobInformation fields to extract (default: all)
+            
+        Yields:
+            ParseEvent objects ("item", "field", then one "complete")
+            
+        Raises:
+            ValidationError: If the full response does not match the JobInformation schema
+            Exception: Any error raised by the Gemini client
+        """
+        requested = normalize_fields(fields)
+        known = self._lookup(job_description, requested)
+        if known is not None:
+            for name, value in known.model_dump(include=set(requested)).items():
+                yield ParseEvent("field", name, value)
+            yield ParseEvent("complete", None, known)
+            return
+        
+        # Locally extracted fields are available before the request is even sent
+        local, remaining = self._plan(job_description, requested)
+        for name, value in local.items():
+            yield ParseEvent("field", name, value)
+        
+        text, chunks = self._prepare(job_description, remaining) if remaining else ("", [])
+        if chunks:
+            # Chunked extractions are merged before any field can be trusted
+            job_info = self._extract_chunks(chunks, None, local)
+            for name, value in job_info.model_dump(include=set(remaining)).items():
+                yield ParseEvent("field", name, value)
+        elif remaining:
+            parser = PartialJSONParser()
+            request = self._request(text, remaining, None)
+            usage = None
+            # The request stage spans the whole stream, including time spent by the consumer
+            with self._stage("request"):
+                for chunk in self.client.models.generate_content_stream(**request):
+                    usage = chunk.usage_metadata or usage
+                    if chunk.text:
+                        yield from parser.feed(chunk.text)
+            if self.instrumentation is not None:
+                self.instrumentation.tokens(request["model"], usage)
+            try:
+                with self._stage("validate"):
+                    job_info = self._parse(parser.text, remaining, local, self.recovery_stats)
+            except ValidationError:
+                with self._stage("recover"):
+                    job_info = self._recover(parser.text, text, remaining, local, None)
+        else:
+            job_info = expand_subset(local)
+        
+        job_info = self._canonical(job_info)
+        self._remember(job_description, requested, job_info)
+        yield ParseEvent("complete", None, job_info)
+    
+    def extract_many(
+        self,
+        job_descriptions: Iterable[str],
+        concurrency: int = 8,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> AsyncIterator[BatchResult]:
+        """Extract many job descriptions concurrently, yielding results as they complete.
+        
+        See batch.extract_many for details.
+        
+        Args:
+            job_descriptions: Iterable of raw job description texts (consumed lazily)
+            concurrency: Maximum number of requests in flight
+            requests_per_minute: Optional request quota to stay under
+            tokens_per_minute: Optional token quota to stay under
+            fields: Names of the JobInformation fields to extract (default: all)
+            
+        Returns:
+            Async iterator of BatchResult objects in completion order
+        """
+        return extract_many(
+            self,
+            job_descriptions,
+            concurrency=concurrency,
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+            fields=fields,
+        )
+    
+    def _lookup(
+        self,
+        job_description: str,
+        fields: FrozenSet[str],
+        model_name: Optional[str] = None,
+    ) -> Optional[JobInformation]:
+        """Return a cached or near-duplicate result, if any, without calling the API."""
+        model_name = model_name or self.model_name
+        with self._stage("lookup"):
+            if self.cache is not None:
+                cached = self.cache.get(job_description, model_name, fields, self.cache_variant)
+                if cached is not None:
+                    return self._canonical(cached)
+            if self.dedup_index is not None:
+                duplicate = self.dedup_index.find(job_description, model_name, fields)
+                if duplicate is not None:
+                    duplicate = self._canonical(duplicate)
+                    if self.cache is not None:
+                        self.cache.put(job_description, model_name, duplicate, fields, self.cache_variant)
+                    return duplicate
+        return None
+    
+    def _remember(
+        self,
+        job_description: str,
+        fields: FrozenSet[str],
+        job_info: JobInformation,
+        model_name: Optional[str] = None,
+    ) -> None:
+        """Store a fresh result in the cache and, for full extractions, the near-duplicate index."""
+        model_name = model_name or self.model_name
+        if self.cache is not None:
+            self.cache.put(job_description, model_name, job_info, fields, self.cache_variant)
+        if self.dedup_index is not None and fields == ALL_FIELDS:
+            self.dedup_index.add(job_description, model_name, job_info)
+    
+    @property
+    def cache_variant(self) -> str:
+        """Settings that change extraction results, so results made under others are not reused.
+        
+        Returns:
+            Pre-extraction, compaction and skill canonicalization settings ("" when all are off)
+        """
+        parts = []
+        if self.pre_extractor is not None:
+            parts.append(f"pre_extract={self.min_rule_confidence:g}")
+        if self.preprocessor is not None:
+            parts.append("compact")
+        if self.skill_canonicalizer is not None:
+            parts.append(f"skills={self.skill_canonicalizer.fingerprint}")
+        return ";".join(parts)
+    
+    def _canonical(self, job_info: JobInformation) -> JobInformation:
+        """Canonicalize a result's skills when a skill canonicalizer is set."""
+        if self.skill_canonicalizer is None:
+            return job_info
+        return self.skill_canonicalizer.apply(job_info)
+    
+    def compact_description(self, job_description: str) -> str:
+        """Apply the preprocessor, if any, to the text that will be sent to the model.
+        
+        Caching and rule-based pre-extraction always see the original text.
+        
+        Args:
+            job_description: Raw job description text
+            
+        Returns:
+            Compacted description, or the original when no preprocessor is set
+        """
+        if self.preprocessor is None:
+            return job_description
+        return self.preprocessor.compact(job_description).text
+    
+    def _stage(self, name: str):
+        """Context manager timing one extraction stage (a shared no-op without hooks)."""
+        if self.instrumentation is None:
+            return _UNTIMED
+        return self.instrumentation.stage(name)
+    
+    def _prepare(self, job_description: str, fields: FrozenSet[str]) -> Tuple[str, List[Chunk]]:
+        """Compact a description and plan its chunks (empty to send it whole)."""
+        with self._stage("compact"):
+            text = self.compact_description(job_description)
+            return text, self._chunks(text, fields)
+    
+    def _request(self, text: str, fields: FrozenSet[str], model_name: Optional[str]) -> Dict[str, Any]:
+        """Keyword arguments of the generate-content request for `fields` of a description."""
+        with self._stage("prompt"):
+            contents = self._build_prompt(text, fields)
+        with self._stage("schema"):
+            config = self._generation_config(fields)
+        return {"model": model_name or self.model_name, "contents": contents, "config": config}
+    
+    def _send(self, request: Dict[str, Any]):
+        """Send a generate-content request, timing it and reporting its token usage."""
+        scope = _request_scope.get()
+        if scope is not None:
+            if scope.cancelled:
+                raise CancelledError()
+            scope.sent += 1
+        with self._stage("request"):
+            response = self.client.models.generate_content(**request)
+        if self.instrumentation is not None:
+            self.instrumentation.tokens(request["model"], response.usage_metadata)
+        return response
+    
+    async def _send_async(self, request: Dict[str, Any]):
+        """Asynchronously send a generate-content request, timing it and reporting its token usage.
+        
+        Within extract_many, the request first waits for the batch's rate-limit quota.
+        """
+        await acquire_quota(request["contents"])
+        scope = _request_scope.get()
+        if scope is not None:
+            scope.sent += 1
+        with self._stage("request"):
+            response = await self.client.aio.models.generate_content(**request)
+        if self.instrumentation is not None:
+            self.instrumentation.tokens(request["model"], response.usage_metadata)
+        return response
+    
+    def _build_prompt(self, job_description: str, fields: FrozenSet[str] = ALL_FIELDS) -> str:
+        """Build the extraction prompt, listing only the requested fields for subsets."""
+        if fields == ALL_FIELDS:
+            return EXTRACTION_PROMPT.format(job_description=job_description)
+        return SUBSET_PROMPT.format(field_list=describe_fields(fields), job_description=job_description)
+    
+    def _generation_config(self, fields: FrozenSet[str] = ALL_FIELDS) -> dict:
+        """Build the structured-output request config for the requested fields."""
+        return {
+            "response_mime_type": "application/json",
+            "response_json_schema": job_information_schema(fields),
+        }
+    
+    def _plan(
+        self,
+        job_description: str,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Tuple[Dict[str, Any], FrozenSet[str]]:
+        """Split the requested fields into locally extracted values and fields left for the model."""
+        requested = normalize_fields(fields)
+        if self.pre_extractor is None:
+            return {}, requested
+        with self._stage("pre_extract"):
+            local = {
+                name: guess.value
+                for name, guess in self.pre_extractor.extract(job_description).items()
+                if name in requested and guess.confidence >= self.min_rule_confidence
+            }
+        return local, requested - frozenset(local)
+    
+    def _chunks(self, text: str, fields: FrozenSet[str]) -> List[Chunk]:
+        """Section chunks for an oversized description, or an empty list to send it whole."""
+        if self.long_posting_chars is None or len(text) <= self.long_posting_chars:
+            return []
+        chunks = plan_chunks(text, fields, self.chunk_chars)
+        return chunks if len(chunks) > 1 else []
+    
+    def _chunk_request(self, chunk: Chunk, model_name: Optional[str]) -> Dict[str, Any]:
+        """Keyword arguments of the generate-content request for one chunk."""
+        with self._stage("prompt"):
+            contents = CHUNK_PROMPT.format(field_list=describe_fields(chunk.fields), job_description=chunk.text)
+        with self._stage("schema"):
+            config = self._generation_config(chunk.fields)
+        return {"model": model_name or self.model_name, "contents": contents, "config": config}
+    
+    def _extract_chunk(self, chunk: Chunk, model_name: Optional[str]) -> Dict[str, Any]:
+        """Extract the requested fields from one chunk."""
+        response = self._send(self._chunk_request(chunk, model_name))
+        return self._parse_chunk(response.text, chunk.fields)
+    
+    async def _extract_chunk_async(self, chunk: Chunk, model_name: Optional[str]) -> Dict[str, Any]:
+        """Asynchronously extract the requested fields from one chunk."""
+        response = await self._send_async(self._chunk_request(chunk, model_name))
+        return self._parse_chunk(response.text, chunk.fields)
+    
+    def _extract_chunks(
+        self,
+        chunks: List[Chunk],
+        model_name: Optional[str],
+        local: Dict[str, Any],
+    ) -> JobInformation:
+        """Extract all chunks concurrently (latency of the slowest one) and merge them."""
+        # Each chunk runs in a copy of the caller's context, so it shares the caller's request scope
+        contexts = [contextvars.copy_context() for _ in chunks]
+        partials = list(self._chunk_executor().map(
+            lambda context, chunk: context.run(self._extract_chunk, chunk, model_name), contexts, chunks
+        ))
+        return self._merge(partials, local)
+    
+    def _chunk_executor(self) -> ThreadPoolExecutor:
+        """The thread pool shared by chunk requests, created on first use."""
+        with self._chunk_pool_lock:
+            if self._chunk_pool is None:
+                self._chunk_pool = ThreadPoolExecutor(max_workers=self.chunk_workers, thread_name_prefix="chunk")
+            return self._chunk_pool
+    
+    def close(self) -> None:
+        """Shut down the chunk request threads, if any were started."""
+        with self._chunk_pool_lock:
+            if self._chunk_pool is not None:
+                self._chunk_pool.shutdown(wait=False, cancel_futures=True)
+                self._chunk_pool = None
+    
+    @staticmethod
+    def _merge(partials: List[Dict[str, Any]], local: Dict[str, Any]) -> JobInformation:
+        """Merge chunk extractions in document order and fill in locally extracted values."""
+        data = merge_partials(partials)
+        data.update(local)
+        return expand_subset(data)
+    
+    def _parse_chunk(self, text: str, fields: FrozenSet[str]) -> Dict[str, Any]:
+        """Validate a chunk response, keeping whatever is salvageable when it is malformed.
+        
+        Missing fields are not requested again: other chunks usually cover them.
+        """
+        try:
+            with self._stage("validate"):
+                data = job_information_subset(fields).model_validate_json(text).model_dump()
+        except ValidationError:
+            self.recovery_stats.record(repaired=True)
+            with self._stage("recover"):
+                return recover(text, fields).data
+        self.recovery_stats.record()
+        return data
+    
+    def _recover(
+        self,
+        response_text: str,
+        job_description: str,
+        fields: FrozenSet[str],
+        local: Dict[str, Any],
+        model_name: Optional[str],
+    ) -> JobInformation:
+        """Salvage a response that failed validation, re-requesting only the fields it lost."""
+        data, needed = self._salvage(response_text, fields)
+        retry = self._send(self._request(job_description, needed, model_name)) if needed else None
+        return self._recovered(data, needed, retry, local)
+    
+    async def _recover_async(
+        self,
+        response_text: str,
+        job_description: str,
+        fields: FrozenSet[str],
+        local: Dict[str, Any],
+        model_name: Optional[str],
+    ) -> JobInformation:
+        """Asynchronous variant of _recover()."""
+        data, needed = self._salvage(response_text, fields)
+        retry = await self._send_async(self._request(job_description, needed, model_name)) if needed else None
+        return self._recovered(data, needed, retry, local)
+    
+    def _recovered(
+        self,
+        data: Dict[str, Any],
+        needed: FrozenSet[str],
+        retry: Optional[Any],
+        local: Dict[str, Any],
+    ) -> JobInformation:
+        """Complete salvaged values with the follow-up response, if any, and locally extracted values.
+        
+        Unlike chunk merging, list entries are kept as the model returned them.
+        """
+        if retry is not None:
+            data.update(self._parse_recalled(retry.text, needed))
+        data.update(local)
+        return expand_subset(data)
+    
+    def _salvage(self, text: str, fields: FrozenSet[str]) -> Tuple[Dict[str, Any], FrozenSet[str]]:
+        """Repair a response that failed validation.
+        
+        Returns:
+            Salvaged field values and the fields that must be requested again
+        """
+        recovery = recover(text, fields)
+        self.recovery_stats.record(repaired=True, recalled=recovery.needed)
+        return recovery.data, recovery.needed
+    
+    def _parse_recalled(self, text: str, fields: FrozenSet[str]) -> Dict[str, Any]:
+        """Strictly validate the response to a follow-up request for missing fields."""
+        try:
+            return job_information_subset(fields).model_validate_json(text).model_dump()
+        except ValidationError:
+            self.recovery_stats.record_failure()
+            raise
+    
+    @staticmethod
+    def _parse(
+        text: str,
+        fields: FrozenSet[str],
+        local: Dict[str, Any],
+        stats: Optional[RecoveryStats] = None,
+    ) -> JobInformation:
+        """Validate a model response for `fields` and fill in locally extracted values."""
+        if fields == ALL_FIELDS:
+            job_info = JobInformation.model_validate_json(text)
+        else:
+            data = job_information_subset(fields).model_validate_json(text).model_dump()
+            data.update(local)
+            job_info = expand_subset(data)
+        if stats is not None:
+            stats.record()
+        return job_info
+    
     def format_output(self, job_info: JobInformation, extraction_date: str) -> str:
         """Format extracted information as a well-formatted text file.
         
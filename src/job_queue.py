@@ -0,0 +1,321 @@
+"""Durable, resumable SQLite-backed work queue for large extraction runs."""
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .models import JobInformation
+
+
+PENDING = "pending"
+IN_FLIGHT = "in_flight"
+DONE = "done"
+FAILED = "failed"
+STATES = (PENDING, IN_FLIGHT, DONE, FAILED)
+
+
+def default_worker_id() -> str:
+    """Build a worker ID that is unique across hosts and processes."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class JobQueue:
+    """Per-posting work queue with leases, checkpointed results and retries.
+
+    Every posting moves through pending -> in_flight -> done/failed. Workers
+    in any number of processes lease batches of pending postings; a lease that
+    is not completed before it expires (e.g. the worker died) returns the
+    posting to pending. Completed JobInformation rows are stored in the same
+    database so re-running a finished or partially finished job is free.
+    """
+
+    def __init__(self, path: str, lease_seconds: float = 600.0, check_same_thread: bool = True):
+        """Open (or create) the queue database.
+
+        Args:
+            path: SQLite database file path
+            lease_seconds: How long a worker may hold a posting before it is reclaimed
+            check_same_thread: Whether only the opening thread may use the connection;
+                pass False to share it between threads that serialize their calls
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self._conn = sqlite3.connect(path, timeout=60.0, check_same_thread=check_same_thread, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS postings (
+                posting_id TEXT PRIMARY KEY,
+                description TEXT NOT NULL,
+                state TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_owner TEXT,
+                lease_expires REAL,
+                error TEXT,
+                result TEXT,
+                updated_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_postings_state ON postings (state)")
+
+    def enqueue(self, postings: Iterable[Tuple[str, str]], batch_size: int = 1000) -> int:
+        """Add postings to the queue, streaming them in batches.
+
+        Postings whose ID is already queued keep their existing state, so
+        re-enqueueing the same input after a crash does not repeat work.
+
+        Args:
+            postings: Iterable of (posting_id, description) pairs
+            batch_size: Number of rows inserted per transaction
+
+        Returns:
+            Number of newly added postings
+        """
+        added = 0
+        batch: List[Tuple[str, str, float]] = []
+        for posting_id, description in postings:
+            batch.append((posting_id, description, time.time()))
+            if len(batch) >= batch_size:
+                added += self._insert(batch)
+                batch = []
+        if batch:
+            added += self._insert(batch)
+        return added
+
+    def _insert(self, batch: List[Tuple[str, str, float]]) -> int:
+        """Insert one batch of postings in a single transaction."""
+        before = self._conn.total_changes
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO postings (posting_id, description, updated_at) VALUES (?, ?, ?)",
+                batch,
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return self._conn.total_changes - before
+
+    def lease(self, worker_id: str, limit: int = 1) -> List[Tuple[str, str]]:
+        """Atomically claim up to `limit` pending postings for a worker.
+
+        Expired leases are reclaimed first, so postings held by a crashed
+        worker are picked up again.
+
+        Args:
+            worker_id: ID of the leasing worker
+            limit: Maximum number of postings to claim
+
+        Returns:
+            List of (posting_id, description) pairs now owned by the worker
+        """
+        now = time.time()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.execute(
+                """UPDATE postings SET state = 'pending', lease_owner = NULL, lease_expires = NULL
+                   WHERE state = 'in_flight' AND lease_expires < ?""",
+                (now,),
+            )
+            rows = self._conn.execute(
+                "SELECT posting_id, description FROM postings WHERE state = 'pending' LIMIT ?",
+                (limit,),
+            ).fetchall()
+            self._conn.executemany(
+                """UPDATE postings
+                   SET state = 'in_flight', lease_owner = ?, lease_expires = ?,
+                       attempts = attempts + 1, updated_at = ?
+                   WHERE posting_id = ?""",
+                [(worker_id, now + self.lease_seconds, now, posting_id) for posting_id, _ in rows],
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return rows
+
+    def complete(self, posting_id: str, job_info: JobInformation, worker_id: Optional[str] = None) -> bool:
+        """Mark a posting done and checkpoint its extraction result.
+
+        Args:
+            posting_id: ID of the posting
+            job_info: Validated extraction result
+            worker_id: ID of the worker holding the lease; when given, nothing is
+                written unless that worker still holds it (its lease may have
+                expired and been taken by another worker)
+
+        Returns:
+            Whether the posting was updated
+        """
+        query = """UPDATE postings
+               SET state = 'done', result = ?, error = NULL,
+                   lease_owner = NULL, lease_expires = NULL, updated_at = ?
+               WHERE posting_id = ?"""
+        return self._update(query, (job_info.model_dump_json(), time.time(), posting_id), worker_id)
+
+    def fail(self, posting_id: str, reason: str, worker_id: Optional[str] = None) -> bool:
+        """Mark a posting failed, recording why.
+
+        Args:
+            posting_id: ID of the posting
+            reason: Human-readable failure reason
+            worker_id: ID of the worker holding the lease (see complete())
+
+        Returns:
+            Whether the posting was updated
+        """
+        query = """UPDATE postings
+               SET state = 'failed', error = ?, lease_owner = NULL, lease_expires = NULL, updated_at = ?
+               WHERE posting_id = ?"""
+        return self._update(query, (reason, time.time(), posting_id), worker_id)
+
+    def _update(self, query: str, params: Tuple, worker_id: Optional[str]) -> bool:
+        """Run a posting UPDATE, restricted to the lease of worker_id when given."""
+        if worker_id is not None:
+            query += " AND state = 'in_flight' AND lease_owner = ?"
+            params += (worker_id,)
+        return self._conn.execute(query, params).rowcount > 0
+
+    def release(self, worker_id: Optional[str] = None) -> int:
+        """Return all postings leased by a worker to pending (e.g. on shutdown).
+
+        Args:
+            worker_id: ID of the worker, or None to release every lease (only
+                safe when no other worker is draining the queue)
+
+        Returns:
+            Number of postings released
+        """
+        query = """UPDATE postings SET state = 'pending', lease_owner = NULL, lease_expires = NULL,
+                   attempts = MAX(attempts - 1, 0)
+               WHERE state = 'in_flight'"""
+        params: Tuple = ()
+        if worker_id is not None:
+            query += " AND lease_owner = ?"
+            params = (worker_id,)
+        cursor = self._conn.execute(query, params)
+        return cursor.rowcount
+
+    def retry_failed(self, max_attempts: Optional[int] = None) -> int:
+        """Move failed postings back to pending so only they are retried.
+
+        Args:
+            max_attempts: Skip postings that have already been attempted this many times
+
+        Returns:
+            Number of postings requeued
+        """
+        query = "UPDATE postings SET state = 'pending', error = NULL WHERE state = 'failed'"
+        params: Tuple = ()
+        if max_attempts is not None:
+            query += " AND attempts < ?"
+            params = (max_attempts,)
+        return self._conn.execute(query, params).rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of postings in each state."""
+        counts = {state: 0 for state in STATES}
+        for state, count in self._conn.execute(
+            "SELECT state, COUNT(*) FROM postings GROUP BY state"
+        ):
+            counts[state] = count
+        return counts
+
+    def failures(self) -> Iterator[Tuple[str, int, str]]:
+        """Iterate over failed postings.
+
+        Yields:
+            Tuples of (posting_id, attempts, reason)
+        """
+        yield from self._conn.execute(
+            "SELECT posting_id, attempts, error FROM postings WHERE state = 'failed' ORDER BY posting_id"
+        )
+
+    def results(self, limit: Optional[int] = None, offset: int = 0) -> Iterator[Tuple[str, JobInformation]]:
+        """Iterate over completed postings and their stored extraction results.
+
+        Args:
+            limit: Maximum number of results (e.g. one page), or None for all
+            offset: Number of results to skip, in posting ID order
+
+        Yields:
+            Tuples of (posting_id, JobInformation)
+        """
+        cursor = self._conn.execute(
+            "SELECT posting_id, result FROM postings WHERE state = 'done' ORDER BY posting_id LIMIT ? OFFSET ?",
+            (-1 if limit is None else limit, offset),
+        )
+        for posting_id, result in cursor:
+            yield posting_id, JobInformation.model_validate_json(result)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+async def run_worker(
+    job_queue: JobQueue,
+    extractor,
+    worker_id: Optional[str] = None,
+    concurrency: int = 8,
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None,
+    fields: Optional[Iterable[str]] = None,
+) -> Dict[str, int]:
+    """Drain the queue with one worker, checkpointing every result as it lands.
+
+    Args:
+        job_queue: Queue to pull leases from
+        extractor: Configured JobExtractor
+        worker_id: Lease owner ID (generated if omitted)
+        concurrency: Postings extracted at a time; leases are refilled as each one finishes
+        requests_per_minute: Optional request quota to stay under
+        tokens_per_minute: Optional token quota to stay under
+        fields: Names of the JobInformation fields to extract (default: all)
+
+    Returns:
+        Dictionary with the number of postings this worker completed and failed
+    """
+    worker_id = worker_id or default_worker_id()
+    stats = {DONE: 0, FAILED: 0}
+    # Posting IDs by batch index, for the postings handed to extract_many
+    leased: Dict[int, str] = {}
+
+    def descriptions() -> Iterator[str]:
+        # Pulled lazily by extract_many whenever a slot frees up, so a slow
+        # posting never holds back the next leases
+        index = 0
+        while True:
+            batch = job_queue.lease(worker_id, limit=concurrency)
+            if not batch:
+                return
+            for posting_id, description in batch:
+                leased[index] = posting_id
+                index += 1
+                yield description
+
+    try:
+        async for result in extractor.extract_many(
+            descriptions(),
+            concurrency=concurrency,
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+            fields=fields,
+        ):
+            posting_id = leased.pop(result.index)
+            if result.ok:
+                stored = job_queue.complete(posting_id, result.job_info, worker_id)
+            else:
+                stored = job_queue.fail(posting_id, result.error or "unknown error", worker_id)
+            # A result for a lease that expired and moved to another worker is dropped
+            if stored:
+                stats[DONE if result.ok else FAILED] += 1
+        return stats
+    finally:
+        job_queue.release(worker_id)
@@ -0,0 +1,200 @@
+"""Pluggable per-stage instrumentation with Prometheus and JSONL exporters."""
+import json
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
+
+
+# Stages timed by JobExtractor; "recover" includes any follow-up request it sends
+STAGES = ("lookup", "pre_extract", "compact", "prompt", "schema", "request", "validate", "recover")
+# Histogram bucket upper bounds in seconds, from sub-millisecond local work to slow API calls
+LATENCY_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class MetricsHook:
+    """Base class for instrumentation hooks; every callback is a no-op by default.
+
+    Callbacks run inline on the extraction path (possibly from several
+    threads at once), so implementations must be thread-safe and cheap.
+    """
+
+    def stage(self, name: str, seconds: float, error: Optional[BaseException]) -> None:
+        """Called after each timed stage.
+
+        Args:
+            name: Stage name (see STAGES)
+            seconds: Wall-clock duration of the stage
+            error: Exception the stage raised, or None if it succeeded
+        """
+
+    def tokens(self, model_name: str, prompt_tokens: int, output_tokens: int) -> None:
+        """Called with the token usage reported for each API response.
+
+        Args:
+            model_name: Model that served the request
+            prompt_tokens: Input tokens billed for the request
+            output_tokens: Output tokens billed for the request
+        """
+
+
+class _StageTimer:
+    """Context manager timing one stage and reporting it to every hook."""
+
+    __slots__ = ("hooks", "name", "start")
+
+    def __init__(self, hooks: List[MetricsHook], name: str):
+        self.hooks = hooks
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> "_StageTimer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        elapsed = time.perf_counter() - self.start
+        for hook in self.hooks:
+            hook.stage(self.name, elapsed, exc)
+        return False
+
+
+class Instrumentation:
+    """Fans stage timings and token usage out to a list of hooks."""
+
+    def __init__(self, hooks: Iterable[MetricsHook]):
+        """Create the dispatcher.
+
+        Args:
+            hooks: Hooks notified of every event
+        """
+        self.hooks = list(hooks)
+
+    def stage(self, name: str) -> _StageTimer:
+        """Context manager timing the stage `name`."""
+        return _StageTimer(self.hooks, name)
+
+    def tokens(self, model_name: str, usage) -> None:
+        """Report the usage_metadata of a response, if it has any."""
+        if usage is None:
+            return
+        prompt_tokens = usage.prompt_token_count or 0
+        output_tokens = usage.candidates_token_count or 0
+        for hook in self.hooks:
+            hook.tokens(model_name, prompt_tokens, output_tokens)
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class PrometheusMetrics(MetricsHook):
+    """Aggregates counters and latency histograms for the Prometheus text format."""
+
+    def __init__(self, namespace: str = "jobspecminer", buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        """Create empty metrics.
+
+        Args:
+            namespace: Prefix of every metric name
+            buckets: Latency histogram bucket upper bounds in seconds
+        """
+        self.namespace = namespace
+        self.buckets = buckets
+        # stage -> [per-bucket counts..., +Inf count], sum of seconds
+        self._histograms: Dict[str, Tuple[List[int], List[float]]] = {}
+        self._errors: Dict[Tuple[str, str], int] = {}
+        self._tokens: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def stage(self, name: str, seconds: float, error: Optional[BaseException]) -> None:
+        """Record one stage duration (and its error, if any)."""
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = ([0] * (len(self.buckets) + 1), [0.0])
+            histogram[0][index] += 1
+            histogram[1][0] += seconds
+            if error is not None:
+                key = (name, type(error).__name__)
+                self._errors[key] = self._errors.get(key, 0) + 1
+
+    def tokens(self, model_name: str, prompt_tokens: int, output_tokens: int) -> None:
+        """Add one response's token usage to the per-model counters."""
+        with self._lock:
+            for kind, count in (("prompt", prompt_tokens), ("output", output_tokens)):
+                key = (model_name, kind)
+                self._tokens[key] = self._tokens.get(key, 0) + count
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        ns = self.namespace
+        lines = [
+            f"# HELP {ns}_stage_seconds Duration of each extraction stage.",
+            f"# TYPE {ns}_stage_seconds histogram",
+        ]
+        with self._lock:
+            for stage, (counts, total) in sorted(self._histograms.items()):
+                cumulative = 0
+                label = _escape(stage)
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    lines.append(f'{ns}_stage_seconds_bucket{{stage="{label}",le="{bound}"}} {cumulative}')
+                cumulative += counts[-1]
+                lines.append(f'{ns}_stage_seconds_bucket{{stage="{label}",le="+Inf"}} {cumulative}')
+                lines.append(f'{ns}_stage_seconds_sum{{stage="{label}"}} {total[0]}')
+                lines.append(f'{ns}_stage_seconds_count{{stage="{label}"}} {cumulative}')
+            lines.append(f"# HELP {ns}_stage_errors_total Stages that raised, by exception type.")
+            lines.append(f"# TYPE {ns}_stage_errors_total counter")
+            for (stage, error), count in sorted(self._errors.items()):
+                lines.append(f'{ns}_stage_errors_total{{stage="{_escape(stage)}",error="{_escape(error)}"}} {count}')
+            lines.append(f"# HELP {ns}_tokens_total Tokens reported in response usage metadata.")
+            lines.append(f"# TYPE {ns}_tokens_total counter")
+            for (model_name, kind), count in sorted(self._tokens.items()):
+                lines.append(f'{ns}_tokens_total{{model="{_escape(model_name)}",kind="{kind}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """Write the rendered metrics to a file (e.g. for a node_exporter textfile collector).
+
+        Args:
+            path: Output file path
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.render())
+
+
+class JSONLLogger(MetricsHook):
+    """Writes every stage timing, error and token report as one JSON line."""
+
+    def __init__(self, stream: TextIO):
+        """Create the logger.
+
+        Args:
+            stream: Open text stream the lines are written to
+        """
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def _write(self, record: dict) -> None:
+        line = json.dumps(record) + "\n"
+        with self._lock:
+            self.stream.write(line)
+
+    def stage(self, name: str, seconds: float, error: Optional[BaseException]) -> None:
+        """Log one stage, including the error message if it failed."""
+        record = {"ts": time.time(), "event": "stage", "stage": name, "seconds": seconds}
+        if error is not None:
+            record["error"] = f"{type(error).__name__}: {error}"
+        self._write(record)
+
+    def tokens(self, model_name: str, prompt_tokens: int, output_tokens: int) -> None:
+        """Log one response's token usage."""
+        self._write({
+            "ts": time.time(),
+            "event": "tokens",
+            "model": model_name,
+            "prompt_tokens": prompt_tokens,
+            "output_tokens": output_tokens,
+        })
@@ -1,6 +1,7 @@
 """Pydantic models for structured job information extraction."""
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Type
+from pydantic import BaseModel, Field, create_model
 
 
 class JobInformation(BaseModel):
@@ -63,3 +64,105 @@ class JobInformation(BaseModel):
         default=None,
         description="Any additional relevant information"
     )
+
+
+ALL_FIELDS: FrozenSet[str] = frozenset(JobInformation.model_fields)
+# Fields holding lists of strings (skills, benefits, ...); the rest are single strings
+LIST_FIELDS: FrozenSet[str] = frozenset(
+    name for name, info in JobInformation.model_fields.items()
+    if getattr(info.annotation, "__origin__", None) is list
+)
+
+
+def normalize_fields(fields: Optional[Iterable[str]] = None) -> FrozenSet[str]:
+    """Validate a requested subset of JobInformation fields.
+    
+    Args:
+        fields: Field names to extract, or None for all fields
+        
+    Returns:
+        Frozen set of field names
+        
+    Raises:
+        ValueError: If a name is not a JobInformation field or the subset is empty
+    """
+    if fields is None:
+        return ALL_FIELDS
+    requested = frozenset(fields)
+    unknown = requested - ALL_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown JobInformation fields: {', '.join(sorted(unknown))}")
+    if not requested:
+        raise ValueError("At least one field must be requested")
+    return requested
+
+
+@lru_cache(maxsize=None)
+def job_information_subset(fields: FrozenSet[str] = ALL_FIELDS) -> Type[BaseModel]:
+    """Pydantic model with only the given JobInformation fields.
+    
+    Models are generated once per field set and cached. Field types,
+    defaults and descriptions are copied from JobInformation.
+    
+    Args:
+        fields: Names of the fields to keep
+        
+    Returns:
+        JobInformation itself for the full set, otherwise a generated model
+    """
+    if fields == ALL_FIELDS:
+        return JobInformation
+    definitions = {
+        name: (info.annotation, info)
+        for name, info in JobInformation.model_fields.items()
+        if name in fields
+    }
+    return create_model("JobInformationSubset", __doc__=JobInformation.__doc__, **definitions)
+
+
+@lru_cache(maxsize=None)
+def job_information_schema(fields: FrozenSet[str] = ALL_FIELDS) -> dict:
+    """JSON schema for a subset of JobInformation fields.
+    
+    Schemas are built once per field set and cached; callers must not mutate
+    the returned dictionary.
+    
+    Args:
+        fields: Names of the fields to include
+        
+    Returns:
+        JSON schema dictionary
+    """
+    return job_information_subset(fields).model_json_schema()
+
+
+@lru_cache(maxsize=None)
+def describe_fields(fields: FrozenSet[str] = ALL_FIELDS) -> str:
+    """Prompt bullet list describing the given fields, in model order.
+    
+    Args:
+        fields: Names of the fields to describe
+        
+    Returns:
+        One "- name: description" line per field
+    """
+    return "\n".join(
+        f"- {name}: {info.description}"
+        for name, info in JobInformation.model_fields.items()
+        if name in fields
+    )
+
+
+def expand_subset(data: Dict[str, Any]) -> JobInformation:
+    """Build a full JobInformation from a subset of its fields.
+    
+    Fields that are missing keep their defaults; job_title, which has no
+    default, becomes an empty string.
+    
+    Args:
+        data: Field values extracted so far
+        
+    Returns:
+        Validated JobInformation
+    """
+    return JobInformation.model_validate({"job_title": "", **data})
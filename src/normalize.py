@@ -0,0 +1,217 @@
+"""Parse free-text salary and experience values into structured numbers."""
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+
+# Working units per year used to annualize hourly, daily, weekly and monthly pay
+ANNUAL_FACTORS = {"hour": 2080, "day": 260, "week": 52, "month": 12, "year": 1}
+
+_CURRENCY_CODES = ("USD", "EUR", "GBP", "CAD", "AUD", "NZD", "CHF", "SEK", "NOK", "DKK", "PLN", "INR", "JPY", "SGD")
+_CURRENCY_SYMBOLS = {
+    "US$": "USD", "CA$": "CAD", "C$": "CAD", "AU$": "AUD", "A$": "AUD", "NZ$": "NZD",
+    "$": "USD", "€": "EUR", "£": "GBP", "¥": "JPY", "₹": "INR",
+}
+_CURRENCY_WORDS = {"dollar": "USD", "euro": "EUR", "pound": "GBP", "rupee": "INR"}
+_CURRENCY = r"(?:US\$|CA\$|C\$|AU\$|A\$|NZ\$|[$€£¥₹]|\b(?:" + "|".join(_CURRENCY_CODES) + r")\b\s?)"
+_CURRENCY_RE = re.compile(
+    _CURRENCY + r"|\b(?P<word>dollar|euro|pound|rupee)s?\b", re.IGNORECASE
+)
+# Digits with optional thousands separators (including Indian lakh grouping, "12,00,000")
+# and decimals, then an optional k/m multiplier
+_AMOUNT = r"\d+(?:,\d{2}(?=,\d{3}))*(?:[.,  ]\d{3})*(?:[.,]\d{1,2})?(?:\s?[kKmM](?![a-zA-Z]))?"
+_RANGE_RE = re.compile(
+    r"(?P<prefix>\b(?:up to|max(?:imum)?|from|starting at|min(?:imum)?|at least)\s*)?"
+    + _CURRENCY + r"?\s*(?P<low>" + _AMOUNT + r")"
+    + r"(?:\s*(?:-|–|—|\bto\b|\band\b)\s*" + _CURRENCY + r"?\s*(?P<high>" + _AMOUNT + r"))?",
+    re.IGNORECASE,
+)
+_PERIOD_RE = re.compile(
+    r"(?P<hour>\b(?:hour|hourly|hr|ph)\b|/\s?h\b)"
+    r"|(?P<day>\b(?:day|daily|diem)\b|/\s?d\b)"
+    r"|(?P<week>\b(?:week|weekly|wk)\b)"
+    r"|(?P<month>\b(?:month|monthly|mo|pcm)\b)"
+    r"|(?P<year>\b(?:year|yearly|yr|annum|annual|annually|pa|p\.a\.)(?!\w))",
+    re.IGNORECASE,
+)
+# Retirement plans ("401(k)", "403b") look like amounts and are removed before parsing
+_RETIREMENT_PLAN_RE = re.compile(r"\b(?:401|403|457)\s?(?:\([kb]\)|[kb]\b)", re.IGNORECASE)
+# A bare number followed by one of these counts days off, a percentage or equity, not pay
+_BENEFIT_RE = re.compile(
+    r"\s*(?:%|percent\b|days?\b|weeks?\b|(?:paid\s+)?(?:pto|vacation|holidays?|leave|sick)\b"
+    r"|(?:stock\s+)?(?:shares|options|rsus?|equity)\b|match(?:ing)?\b)",
+    re.IGNORECASE,
+)
+_THOUSANDS_RE = re.compile(r"\d{1,3}(?:,\d{2}(?=,\d{3}))*([.,  ])\d{3}(?:\1\d{3})*")
+_DECIMAL_RE = re.compile(r"(.+)[.,](\d{1,2})")
+_SEPARATOR_RE = re.compile(r"[.,  ]")
+
+_NUMBER_WORDS = {
+    "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10, "twelve": 12, "fifteen": 15,
+}
+_YEARS_NUMBER = r"(?:\d+(?:\.\d+)?|" + "|".join(_NUMBER_WORDS) + r")"
+_YEARS_RE = re.compile(
+    r"(?P<prefix>\b(?:at least|minimum(?: of)?|min\.?|over|more than|up to|maximum(?: of)?|max\.?)\s*)?"
+    r"(?P<low>" + _YEARS_NUMBER + r")\s*(?P<plus>\+|\bplus\b|\bor more\b|\b(?:and|or) above\b)?"
+    r"(?:\s*(?:-|–|—|\bto\b)\s*(?P<high>" + _YEARS_NUMBER + r")\s*\+?)?"
+    r"\s*(?P<unit>years?|yrs?|months?|mos?)\b(?P<more>\s*(?:\+|\bor more\b|\band above\b))?",
+    re.IGNORECASE,
+)
+_NO_EXPERIENCE_RE = re.compile(r"\b(?:no (?:prior )?experience|entry[- ]level|new grad(?:uate)?s?)\b", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class SalaryRange:
+    """A parsed salary: amounts as written, plus the same range per year.
+
+    An open range ("up to $90k", "from €50k") has only one bound. The
+    annualized bounds are None when the pay period could not be determined.
+    """
+
+    min_amount: Optional[float]
+    max_amount: Optional[float]
+    currency: Optional[str]
+    period: Optional[str]
+    annual_min: Optional[float]
+    annual_max: Optional[float]
+
+    @property
+    def annual(self) -> Optional[float]:
+        """Midpoint of the annualized range, or its only bound."""
+        if self.annual_min is not None and self.annual_max is not None:
+            return (self.annual_min + self.annual_max) / 2
+        return self.annual_min if self.annual_min is not None else self.annual_max
+
+
+@dataclass(frozen=True)
+class ExperienceRange:
+    """Parsed years of experience; max_years is None for open ranges such as "5+ years"."""
+
+    min_years: Optional[float]
+    max_years: Optional[float]
+
+
+def _amount(text: str) -> float:
+    """Numeric value of one matched amount ("120,000", "1.200.000", "45.5k", "1,2M")."""
+    text = text.strip()
+    multiplier = 1.0
+    if text[-1] in "kKmM":
+        multiplier = 1e3 if text[-1] in "kK" else 1e6
+        text = text[:-1].rstrip()
+    decimal = _DECIMAL_RE.fullmatch(text)
+    if decimal and not _THOUSANDS_RE.fullmatch(text):
+        whole = _SEPARATOR_RE.sub("", decimal.group(1))
+        return float(f"{whole}.{decimal.group(2)}") * multiplier
+    return float(_SEPARATOR_RE.sub("", text)) * multiplier
+
+
+def _currency(text: str) -> Optional[str]:
+    """ISO code of the first currency symbol, code or word in the text."""
+    match = _CURRENCY_RE.search(text)
+    if match is None:
+        return None
+    if match.group("word"):
+        return _CURRENCY_WORDS[match.group("word").lower()]
+    token = match.group(0).strip()
+    return _CURRENCY_SYMBOLS.get(token.upper(), token.upper())
+
+
+def _period(text: str, amount: float) -> Optional[str]:
+    """Pay period named in the text, else guessed from the amount's size."""
+    match = _PERIOD_RE.search(text)
+    if match is not None:
+        return match.lastgroup
+    # Without a period word, small amounts are hourly rates and large ones
+    # annual salaries; anything in between (e.g. 3,000) is left unknown
+    if amount < 300:
+        return "hour"
+    if amount >= 10000:
+        return "year"
+    return None
+
+
+@lru_cache(maxsize=65536)
+def parse_salary(text: Optional[str]) -> Optional[SalaryRange]:
+    """Parse a salary string such as "$120k - $150k", "€55,000 per year" or "£25/hr".
+
+    Args:
+        text: Extracted salary value
+
+    Returns:
+        SalaryRange, or None if the text holds no amount (e.g. "Competitive",
+        "401(k) and 20 days PTO")
+    """
+    if not text:
+        return None
+    text = _RETIREMENT_PLAN_RE.sub(" ", text)
+    for match in _RANGE_RE.finditer(text):
+        # Skip "20 days PTO", "6% match" and the like unless a currency marks them as pay
+        if _CURRENCY_RE.search(match.group(0)) or not _BENEFIT_RE.match(text, match.end()):
+            break
+    else:
+        return None
+    low = _amount(match.group("low"))
+    high = _amount(match.group("high")) if match.group("high") else None
+    if high is not None:
+        # "120-150k": the multiplier written once applies to both bounds
+        low_suffix, high_suffix = match.group("low").strip()[-1], match.group("high").strip()[-1]
+        if high_suffix in "kKmM" and low_suffix not in "kKmM" and low < 1000:
+            low *= 1e3 if high_suffix in "kK" else 1e6
+        if high < low:
+            # Not a range's upper bound, e.g. "$100k and 401(k)"
+            high = None
+    prefix = (match.group("prefix") or "").strip().lower()
+    if high is not None:
+        min_amount, max_amount = low, high
+    elif prefix.startswith(("up to", "max")):
+        min_amount, max_amount = None, low
+    elif prefix:
+        min_amount, max_amount = low, None
+    else:
+        min_amount = max_amount = low
+    period = _period(text, high if high is not None else low)
+    factor = ANNUAL_FACTORS.get(period)
+    return SalaryRange(
+        min_amount=min_amount,
+        max_amount=max_amount,
+        currency=_currency(text),
+        period=period,
+        annual_min=min_amount * factor if factor and min_amount is not None else None,
+        annual_max=max_amount * factor if factor and max_amount is not None else None,
+    )
+
+
+def _years(text: str) -> float:
+    lowered = text.lower()
+    return float(_NUMBER_WORDS[lowered]) if lowered in _NUMBER_WORDS else float(lowered)
+
+
+@lru_cache(maxsize=65536)
+def parse_experience(text: Optional[str]) -> Optional[ExperienceRange]:
+    """Parse a years-of-experience string such as "3-5 years", "5+ years" or "at least two years".
+
+    Args:
+        text: Extracted years_of_experience value
+
+    Returns:
+        ExperienceRange, or None if no duration is found. "Entry level" and
+        "no experience" parse as 0 years.
+    """
+    if not text:
+        return None
+    match = _YEARS_RE.search(text)
+    if match is None:
+        return ExperienceRange(0.0, 0.0) if _NO_EXPERIENCE_RE.search(text) else None
+    scale = 1 / 12 if match.group("unit").lower().startswith("mo") else 1.0
+    low = _years(match.group("low")) * scale
+    high = _years(match.group("high")) * scale if match.group("high") else None
+    prefix = (match.group("prefix") or "").strip().lower()
+    if high is not None:
+        return ExperienceRange(min(low, high), max(low, high))
+    if prefix.startswith(("up to", "max")):
+        return ExperienceRange(0.0, low)
+    if prefix or match.group("plus") or match.group("more"):
+        return ExperienceRange(low, None)
+    return ExperienceRange(low, low)
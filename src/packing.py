@@ -0,0 +1,403 @@
+"""Pack several short job descriptions into a single extraction request."""
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple, Type, Union
+
+from pydantic import BaseModel, Field, ValidationError, create_model
+
+from .batch import BatchResult, RateLimiter, estimate_tokens, set_rate_limiter
+from .models import (
+    ALL_FIELDS,
+    JobInformation,
+    describe_fields,
+    expand_subset,
+    job_information_subset,
+    normalize_fields,
+)
+from .resilience import ExtractionOutcome
+
+
+PACKED_PROMPT = """Analyze each of the following job descriptions and extract the structured information listed below for each one.
+
+Each job description starts with a line of the form "### Posting <ID>". Return exactly one entry per posting in "postings", with "posting_id" set to that ID. Treat every posting independently and never mix information between postings.
+
+Extract:
+{field_list}
+
+{postings}
+
+If a field is not mentioned in a job description, use null for optional string fields or an empty array for list fields."""
+
+
+@lru_cache(maxsize=None)
+def packed_models(fields: FrozenSet[str] = ALL_FIELDS) -> Type[BaseModel]:
+    """Response model for a packed request: a list of ID-tagged extractions (cached per field set).
+
+    Args:
+        fields: Names of the JobInformation fields to extract
+
+    Returns:
+        Pydantic model with a "postings" list of tagged subset models
+    """
+    tagged = create_model(
+        "TaggedJobInformation",
+        __base__=job_information_subset(fields),
+        posting_id=(str, Field(description="ID of the posting this entry was extracted from")),
+    )
+    return create_model(
+        "PackedJobInformation",
+        postings=(List[tagged], Field(description="One entry per job description, in any order")),
+    )
+
+
+@lru_cache(maxsize=None)
+def packed_schema(fields: FrozenSet[str] = ALL_FIELDS) -> dict:
+    """JSON schema of packed_models(fields); callers must not mutate it."""
+    return packed_models(fields).model_json_schema()
+
+
+@dataclass
+class PackLimits:
+    """Limits on which postings may share a request and how many.
+
+    Attributes:
+        max_chars: Longest description that may share a request
+        max_pack_size: Upper bound on postings per request
+        max_input_tokens: Budget for the descriptions in one request
+        max_output_tokens: Output token limit of the model
+        output_tokens_per_posting: Expected output tokens per extracted posting
+    """
+
+    max_chars: int = 1000
+    max_pack_size: int = 8
+    max_input_tokens: int = 6000
+    max_output_tokens: int = 8192
+    output_tokens_per_posting: int = 800
+
+    @property
+    def size_limit(self) -> int:
+        """Most postings per request, within both the pack size and the output budget."""
+        return max(1, min(self.max_pack_size, self.max_output_tokens // self.output_tokens_per_posting))
+
+    def full(self, count: int, tokens: int, added_tokens: int) -> bool:
+        """Whether a pack of `count` postings and `tokens` input tokens cannot take one more of `added_tokens`."""
+        return count > 0 and (count >= self.size_limit or tokens + added_tokens > self.max_input_tokens)
+
+
+def plan_packs(
+    job_descriptions: Sequence[str],
+    max_chars: int = 1000,
+    max_pack_size: int = 8,
+    max_input_tokens: int = 6000,
+    max_output_tokens: int = 8192,
+    output_tokens_per_posting: int = 800,
+) -> List[List[int]]:
+    """Group description indices into packs that fit within token limits.
+
+    Descriptions longer than `max_chars` are sent alone. Short ones are
+    packed greedily in input order while the estimated prompt size stays
+    under `max_input_tokens` and the expected output (about
+    `output_tokens_per_posting` per posting) stays under `max_output_tokens`.
+
+    Args:
+        job_descriptions: Raw job description texts
+        max_chars: Longest description that may share a request
+        max_pack_size: Upper bound on postings per request
+        max_input_tokens: Budget for the descriptions in one request
+        max_output_tokens: Output token limit of the model
+        output_tokens_per_posting: Expected output tokens per extracted posting
+
+    Returns:
+        List of packs, each a list of indices into job_descriptions
+    """
+    limits = PackLimits(max_chars, max_pack_size, max_input_tokens, max_output_tokens, output_tokens_per_posting)
+    packs: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+    for index, text in enumerate(job_descriptions):
+        if len(text) > limits.max_chars:
+            packs.append([index])
+            continue
+        tokens = estimate_tokens(text)
+        if limits.full(len(current), current_tokens, tokens):
+            packs.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += tokens
+    if current:
+        packs.append(current)
+    return packs
+
+
+@dataclass
+class _Member:
+    """A posting waiting for, or sent in, a packed request."""
+
+    index: int
+    text: str
+    fields: FrozenSet[str]
+    local: Dict[str, Any]
+    remaining: FrozenSet[str]
+
+
+@dataclass
+class _Pack:
+    """Postings requesting the same fields, collected until the pack is full."""
+
+    members: List[_Member] = field(default_factory=list)
+    tokens: int = 0
+
+
+class PackedExtractor:
+    """Extracts many short postings with few requests by packing them together.
+
+    Postings answered by the cache or near-duplicate index, or entirely by
+    the pre-extractor, are never sent. The others are packed with postings
+    requesting the same fields, and each pack asks only for the fields its
+    members did not pre-extract. Packed requests go through the same
+    retries, hedging, circuit breakers and model fallback as single ones.
+
+    Each packed response is split by posting ID and every entry is
+    validated on its own. Postings that are missing from the response or
+    fail validation are transparently re-extracted with a single-posting
+    call, so callers get the same results as unpacked extraction.
+    """
+
+    def __init__(self, resilient, **pack_options):
+        """Initialize the packer.
+
+        Args:
+            resilient: ResilientExtractor used for packed and single-posting requests
+            **pack_options: Overrides for PackLimits (max_chars, max_pack_size, ...)
+        """
+        self.resilient = resilient
+        self.extractor = resilient.extractor
+        self.limits = PackLimits(**pack_options)
+        self.packed_requests = 0
+        self.packed_postings = 0
+        self.fallbacks = 0
+
+    @property
+    def model_name(self) -> str:
+        """Primary model of the wrapped extractor."""
+        return self.resilient.models[0]
+
+    def _build_prompt(self, job_descriptions: Sequence[str], fields: FrozenSet[str]) -> str:
+        """Build a packed prompt with (compacted) postings tagged P1..Pn."""
+        postings = "\n\n".join(
+            f"### Posting P{number}\n{self.extractor.compact_description(text)}"
+            for number, text in enumerate(job_descriptions, 1)
+        )
+        return PACKED_PROMPT.format(field_list=describe_fields(fields), postings=postings)
+
+    def _generation_config(self, fields: FrozenSet[str]) -> dict:
+        """Structured-output config for a packed request."""
+        return {
+            "response_mime_type": "application/json",
+            "response_json_schema": packed_schema(fields),
+        }
+
+    @staticmethod
+    def _split(text: str, count: int, fields: FrozenSet[str]) -> List[Optional[Dict[str, Any]]]:
+        """Split a packed response into per-posting field values, None where invalid or missing."""
+        results: List[Optional[Dict[str, Any]]] = [None] * count
+        try:
+            entries = json.loads(text).get("postings", [])
+        except (ValueError, AttributeError):
+            return results
+        subset = job_information_subset(fields)
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            posting_id = str(entry.pop("posting_id", ""))
+            if not posting_id.startswith("P") or not posting_id[1:].isdigit():
+                continue
+            position = int(posting_id[1:]) - 1
+            if not 0 <= position < count or results[position] is not None:
+                continue
+            try:
+                results[position] = subset.model_validate(entry).model_dump()
+            except ValidationError:
+                continue
+        return results
+
+    async def _send_pack(
+        self, texts: Sequence[str], fields: FrozenSet[str], model_name: str
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Send one packed request to a model and split its response."""
+        response = await self.extractor._send_async({
+            "model": model_name,
+            "contents": self._build_prompt(texts, fields),
+            "config": self._generation_config(fields),
+        })
+        return self._split(response.text, len(texts), fields)
+
+    def _finish(self, member: _Member, values: Dict[str, Any]) -> JobInformation:
+        """A member's requested fields from the response, overlaid with its local values and canonicalized."""
+        data = {name: value for name, value in values.items() if name in member.fields}
+        data.update(member.local)
+        return self.extractor._canonical(expand_subset(data))
+
+    def extract_many(
+        self,
+        job_descriptions: Iterable[Union[str, Tuple[str, Iterable[str]]]],
+        concurrency: int = 8,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> AsyncIterator[BatchResult]:
+        """Packed counterpart of ResilientExtractor.extract_many (see batch.extract_many).
+
+        Args:
+            job_descriptions: Iterable of raw job description texts, or of (text, fields)
+                              pairs to request a different field subset for that description
+            concurrency: Maximum number of requests in flight
+            requests_per_minute: Optional request quota to stay under
+            tokens_per_minute: Optional token quota to stay under
+            fields: Names of the JobInformation fields to extract (default: all)
+
+        Returns:
+            Async iterator of BatchResult objects in completion order, tagged with their input index
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        return self._extract_many(
+            job_descriptions, concurrency, RateLimiter(requests_per_minute, tokens_per_minute), normalize_fields(fields)
+        )
+
+    async def _extract_many(
+        self,
+        job_descriptions: Iterable[Union[str, Tuple[str, Iterable[str]]]],
+        concurrency: int,
+        limiter: RateLimiter,
+        requested: FrozenSet[str],
+    ) -> AsyncIterator[BatchResult]:
+        """Body of extract_many()."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_single(index: int, text: str, item_fields: FrozenSet[str]) -> BatchResult:
+            set_rate_limiter(limiter)
+            start = time.perf_counter()
+            async with semaphore:
+                outcome = await self.resilient.extract_async(text, item_fields, lookup=False)
+            if outcome.job_info is None:
+                error = outcome.failure()
+                return BatchResult(index, error=f"{type(error).__name__}: {error}", elapsed=time.perf_counter() - start)
+            return BatchResult(index, job_info=outcome.job_info, elapsed=time.perf_counter() - start)
+
+        async def run_pack(members: List[_Member]) -> List[BatchResult]:
+            if len(members) == 1:
+                return [await run_single(members[0].index, members[0].text, members[0].fields)]
+            set_rate_limiter(limiter)
+            start = time.perf_counter()
+            texts = [member.text for member in members]
+            pack_fields = frozenset().union(*(member.remaining for member in members))
+            outcome = ExtractionOutcome()
+            async with semaphore:
+                success = await self.resilient.run_async(
+                    lambda model_name: self._send_pack(texts, pack_fields, model_name), outcome, kind="packed"
+                )
+            model_name, entries = success if success is not None else (None, [None] * len(members))
+            self.packed_requests += success is not None
+            results, retries = [], []
+            for member, values in zip(members, entries):
+                if values is None:
+                    self.fallbacks += 1
+                    retries.append(run_single(member.index, member.text, member.fields))
+                    continue
+                job_info = self._finish(member, values)
+                self.extractor._remember(member.text, member.fields, job_info, model_name)
+                self.packed_postings += 1
+                results.append(BatchResult(member.index, job_info=job_info, elapsed=time.perf_counter() - start))
+            results.extend(await asyncio.gather(*retries))
+            return results
+
+        source = iter(enumerate(job_descriptions))
+        # Short postings waiting for a pack, by requested field set
+        packs: Dict[FrozenSet[str], _Pack] = {}
+        ready: List[BatchResult] = []
+        pending: Set[asyncio.Task] = set()
+        exhausted = False
+        try:
+            while True:
+                # Keep one extra window queued so the semaphore never idles
+                while not exhausted and not ready and len(pending) < concurrency * 2:
+                    try:
+                        index, item = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        pending.update(asyncio.ensure_future(run_pack(pack.members)) for pack in packs.values())
+                        packs.clear()
+                        break
+                    text, item_fields = (item[0], normalize_fields(item[1])) if isinstance(item, tuple) else (item, requested)
+                    known = self.resilient._lookup(text, item_fields)
+                    if known is not None:
+                        ready.append(BatchResult(index, job_info=known))
+                        continue
+                    if len(text) > self.limits.max_chars:
+                        # Sent alone, as a pack of one
+                        pending.add(asyncio.ensure_future(run_pack([_Member(index, text, item_fields, {}, item_fields)])))
+                        continue
+                    local, remaining = self.extractor._plan(text, item_fields)
+                    if not remaining:
+                        job_info = self.extractor._canonical(expand_subset(local))
+                        self.extractor._remember(text, item_fields, job_info, self.model_name)
+                        ready.append(BatchResult(index, job_info=job_info))
+                        continue
+                    pack = packs.setdefault(item_fields, _Pack())
+                    tokens = estimate_tokens(text)
+                    if self.limits.full(len(pack.members), pack.tokens, tokens):
+                        pending.add(asyncio.ensure_future(run_pack(pack.members)))
+                        pack = packs[item_fields] = _Pack()
+                    pack.members.append(_Member(index, text, item_fields, local, remaining))
+                    pack.tokens += tokens
+                for result in ready:
+                    yield result
+                ready.clear()
+                if not pending:
+                    if exhausted:
+                        return
+                    continue
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    for result in task.result():
+                        yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def extract_packed_async(
+        self,
+        job_descriptions: Sequence[str],
+        fields: Optional[Iterable[str]] = None,
+        concurrency: int = 8,
+    ) -> List[Optional[JobInformation]]:
+        """Extract many descriptions, packing the short ones into shared requests.
+
+        Args:
+            job_descriptions: Raw job description texts
+            fields: Names of the JobInformation fields to extract (default: all)
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            Results in input order; None where even the single-posting fallback failed
+        """
+        results: List[Optional[JobInformation]] = [None] * len(job_descriptions)
+        async for result in self.extract_many(job_descriptions, concurrency=concurrency, fields=fields):
+            results[result.index] = result.job_info
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        """Packed requests sent, postings they answered, and postings that needed a single-posting fallback."""
+        return {
+            "packed_requests": self.packed_requests,
+            "packed_postings": self.packed_postings,
+            "fallbacks": self.fallbacks,
+        }
+
+    def close(self) -> None:
+        """Shut down the wrapped extractor's request threads."""
+        self.resilient.close()
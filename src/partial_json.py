@@ -0,0 +1,114 @@
+"""Incremental JSON parser that surfaces fields of a streamed object as they complete."""
+import json
+from typing import Any, List, NamedTuple, Optional
+
+
+class ParseEvent(NamedTuple):
+    """A piece of the streamed object that is now complete.
+
+    kind is "item" when one element of a top-level list field has been
+    received, "field" when a whole top-level field value is complete and
+    "complete" for the final validated object (emitted by JobExtractor).
+    """
+
+    kind: str
+    field: Optional[str]
+    value: Any
+
+
+class PartialJSONParser:
+    """Feed chunks of a JSON object and receive events for completed fields.
+
+    Only the top-level object is tracked: each key/value pair is reported as
+    soon as its value ends, and elements of top-level arrays (e.g. skills)
+    are reported one by one before the array itself closes. Each character
+    is scanned exactly once across all feed() calls.
+    """
+
+    def __init__(self):
+        self._buf = ""
+        self._pos = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._reading_key = False
+        self._key_start = 0
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None
+        self._item_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[ParseEvent]:
+        """Consume the next chunk of response text.
+
+        Args:
+            chunk: Next piece of the JSON document
+
+        Returns:
+            Events for every field or list item completed by this chunk
+        """
+        self._buf += chunk
+        events: List[ParseEvent] = []
+        buf = self._buf
+        for i in range(self._pos, len(buf)):
+            c = buf[i]
+            depth = len(self._stack)
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if self._reading_key:
+                        self._key = json.loads(buf[self._key_start:i + 1])
+                        self._reading_key = False
+                continue
+            if c in " \t\r\n":
+                continue
+            if depth == 1 and self._key is None and c == '"':
+                # Start of a top-level key
+                self._reading_key = True
+                self._key_start = i
+                self._in_string = True
+                continue
+            if depth == 1 and self._key is not None and self._value_start is None and c != ":":
+                self._value_start = i
+            if depth == 2 and self._stack[1] == "[" and self._item_start is None and c not in ",]":
+                self._item_start = i
+
+            if c == '"':
+                self._in_string = True
+            elif c in "{[":
+                self._stack.append(c)
+            elif c in "}]":
+                if depth == 2 and c == "]" and self._item_start is not None:
+                    events.append(self._emit_item(i))
+                self._stack.pop()
+                if depth == 1:
+                    if self._value_start is not None:
+                        events.append(self._emit_field(i))
+            elif c == ",":
+                if depth == 1 and self._value_start is not None:
+                    events.append(self._emit_field(i))
+                elif depth == 2 and self._stack[1] == "[" and self._item_start is not None:
+                    events.append(self._emit_item(i))
+        self._pos = len(buf)
+        return events
+
+    def _emit_field(self, end: int) -> ParseEvent:
+        """Finish the current top-level field whose value ends before `end`."""
+        event = ParseEvent("field", self._key, json.loads(self._buf[self._value_start:end]))
+        self._key = None
+        self._value_start = None
+        return event
+
+    def _emit_item(self, end: int) -> ParseEvent:
+        """Finish the current list element ending before `end`."""
+        event = ParseEvent("item", self._key, json.loads(self._buf[self._item_start:end]))
+        self._item_start = None
+        return event
+
+    @property
+    def text(self) -> str:
+        """All text received so far."""
+        return self._buf
@@ -0,0 +1,360 @@
+"""Compact job descriptions before extraction by stripping noise and learned boilerplate."""
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+from .batch import estimate_tokens
+
+
+# Headings that open sections the model must always see in full
+_PROTECTED_HEADING_RE = re.compile(
+    r"^\W*(?:minimum |basic |required |preferred |key |core )?"
+    r"(?:requirements?|qualifications?|skills|must[- ]haves?|responsibilities|duties"
+    r"|what you(?:'ll| will)? (?:need|bring|do)|who you are|you have|about the (?:role|job|position)"
+    r"|experience|education)\b",
+    re.IGNORECASE,
+)
+# Any short line ending in a colon starts a new section
+_HEADING_RE = re.compile(r"^[^.!?]{1,60}:$")
+# Paragraphs mentioning these are treated as requirements wherever they appear
+_REQUIREMENT_RE = re.compile(
+    r"\b(?:requir(?:e|ed|es|ements?)|must|qualifications?|years? of|degree|proficien(?:t|cy)|experience (?:with|in))\b",
+    re.IGNORECASE,
+)
+# Seed patterns for legal boilerplate that is removed even before anything is learned
+_SEED_BOILERPLATE_RE = re.compile(
+    r"equal (?:employment )?opportunity|without regard to|affirmative action"
+    r"|reasonable accommodations?|e-verify|pay transparency|privacy (?:notice|policy)",
+    re.IGNORECASE,
+)
+_SPACE_RE = re.compile(r"[ \t\f\v\u00a0\u2000-\u200b\u3000]+")
+_LINE_EDGE_RE = re.compile(r" ?\n ?")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_WORD_RE = re.compile(r"[a-z]+")
+_BULLET_RE = re.compile(r"^[-*>\u2022\u2023\u25aa\u25cf\u00b7\u2013\u2014]+\s*")
+
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse runs of spaces, strip every line and squeeze blank lines.
+
+    Args:
+        text: Raw job description text
+
+    Returns:
+        Text with single spaces, no trailing whitespace and at most one blank line in a row
+    """
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = _LINE_EDGE_RE.sub("\n", _SPACE_RE.sub(" ", text))
+    return _BLANK_LINES_RE.sub("\n\n", text).strip()
+
+
+def _paragraph_key(paragraph: str) -> str:
+    """Stable fingerprint of a paragraph, ignoring case, digits and punctuation."""
+    normalized = " ".join(_WORD_RE.findall(paragraph.lower()))
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _line_key(line: str) -> str:
+    """Key used to detect repeated lines, ignoring bullets and case."""
+    return _BULLET_RE.sub("", line).lower()
+
+
+def protected_lines(text: str) -> List[str]:
+    """Lines of a description that compaction must never drop.
+
+    These are the lines of requirement, qualification, skill and
+    responsibility sections, plus any paragraph that reads like a
+    requirement. Used by compact() and to verify its output.
+
+    Args:
+        text: Job description text
+
+    Returns:
+        Whitespace-normalized protected lines, in order
+    """
+    lines = []
+    for paragraph, protected in _paragraphs(normalize_whitespace(text)):
+        if protected:
+            lines.extend(line for line in paragraph.split("\n") if line)
+    return lines
+
+
+def _is_heading(line: str) -> bool:
+    """Whether a line opens a new section."""
+    return len(line) <= 60 and bool(_HEADING_RE.match(line) or _PROTECTED_HEADING_RE.match(line))
+
+
+def _paragraphs(text: str) -> Iterator[Tuple[str, bool]]:
+    """Split normalized text into (paragraph, protected) pairs.
+
+    Paragraphs are separated by blank lines and also start at heading
+    lines, so postings scraped without blank lines still split into
+    sections. A paragraph is protected when it is, or follows, a protected
+    heading (until the next heading) or mentions requirement keywords itself.
+    """
+    in_protected = False
+    for block in text.split("\n\n"):
+        current: List[str] = []
+        for line in block.split("\n"):
+            if current and _is_heading(line):
+                paragraph = "\n".join(current)
+                yield paragraph, in_protected or bool(_REQUIREMENT_RE.search(paragraph))
+                current = []
+            if not current:
+                if _PROTECTED_HEADING_RE.match(line):
+                    in_protected = True
+                elif _HEADING_RE.match(line):
+                    in_protected = False
+            current.append(line)
+        paragraph = "\n".join(current)
+        yield paragraph, in_protected or bool(_REQUIREMENT_RE.search(paragraph))
+
+
+@dataclass
+class CompactionResult:
+    """Compacted description and what compaction saved for one posting."""
+
+    text: str
+    original_tokens: int
+    compacted_tokens: int
+    boilerplate_removed: int = 0
+    duplicate_lines_removed: int = 0
+
+    @property
+    def saved_tokens(self) -> int:
+        """Estimated input tokens no longer sent."""
+        return self.original_tokens - self.compacted_tokens
+
+    @property
+    def savings_ratio(self) -> float:
+        """Fraction of input tokens saved."""
+        return self.saved_tokens / self.original_tokens if self.original_tokens else 0.0
+
+
+class Preprocessor:
+    """Strips whitespace noise, repeated lines and boilerplate paragraphs.
+
+    Boilerplate is learned from corpus frequency: every paragraph is
+    fingerprinted, and paragraphs that appear in at least `min_documents`
+    different postings (EEO statements, "About us" blurbs, application
+    instructions) are dropped from later postings. Learning happens online
+    as postings pass through compact(), or up front with fit(); the learned
+    counts can be saved and loaded. A few seed patterns catch common legal
+    text before anything has been learned.
+
+    Requirement, qualification, skill and responsibility sections are never
+    dropped (see protected_lines), and neither is the first line, which
+    usually carries the title and company.
+    """
+
+    def __init__(
+        self,
+        min_documents: int = 5,
+        min_chars: int = 80,
+        learn: bool = True,
+        max_paragraphs: int = 200000,
+        use_seed_patterns: bool = True,
+        recent_size: int = 1024,
+    ):
+        """Create a preprocessor with no learned boilerplate.
+
+        Args:
+            min_documents: Number of postings a paragraph must appear in to count as boilerplate
+            min_chars: Shorter paragraphs are never treated as boilerplate
+            learn: Whether compact() updates the paragraph counts
+            max_paragraphs: Bound on tracked paragraphs; singletons are pruned past it
+            use_seed_patterns: Also drop paragraphs matching built-in legal boilerplate patterns
+            recent_size: Number of recent results reused when the same description is compacted again
+        """
+        self.min_documents = min_documents
+        self.min_chars = min_chars
+        self.learn = learn
+        self.max_paragraphs = max_paragraphs
+        self.use_seed_patterns = use_seed_patterns
+        self.document_counts: Dict[str, int] = {}
+        self.documents = 0
+        self.postings = 0
+        self.original_tokens = 0
+        self.compacted_tokens = 0
+        self.recent_size = recent_size
+        self._recent: "OrderedDict[str, CompactionResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def fit(self, job_descriptions: Iterable[str]) -> "Preprocessor":
+        """Learn paragraph frequencies from a corpus without compacting it.
+
+        Args:
+            job_descriptions: Raw job description texts
+
+        Returns:
+            self, for chaining
+        """
+        for job_description in job_descriptions:
+            self._observe(self._keys(normalize_whitespace(job_description)))
+        return self
+
+    def _keys(self, text: str) -> Set[str]:
+        """Fingerprints of the long paragraphs and long lines of a normalized description."""
+        keys = set()
+        for paragraph, _ in _paragraphs(text):
+            keys.update(_paragraph_key(line) for line in paragraph.split("\n") if len(line) >= self.min_chars)
+            if "\n" in paragraph and len(paragraph) >= self.min_chars:
+                keys.add(_paragraph_key(paragraph))
+        return keys
+
+    def compact(self, job_description: str) -> CompactionResult:
+        """Compact one description for sending to the model.
+
+        Args:
+            job_description: Raw job description text
+
+        Returns:
+            CompactionResult with the compacted text and token savings
+        """
+        with self._lock:
+            cached = self._recent.get(job_description)
+            if cached is not None:
+                # Retries and hedged requests must not be counted (or learned from) twice
+                self._recent.move_to_end(job_description)
+                return cached
+
+        text = normalize_whitespace(job_description)
+        kept: List[str] = []
+        keys: Set[str] = set()
+        seen_lines: Set[str] = set()
+        boilerplate = duplicates = 0
+        for position, (paragraph, protected) in enumerate(_paragraphs(text)):
+            multiline = "\n" in paragraph
+            if len(paragraph) >= self.min_chars:
+                paragraph_key = _paragraph_key(paragraph)
+                keys.add(paragraph_key)
+                # Seed patterns are only applied per line so that one legal
+                # sentence cannot take a whole section down with it
+                if position > 0 and not protected and multiline and self._is_learned(paragraph_key):
+                    boilerplate += 1
+                    continue
+            lines = []
+            for number, line in enumerate(paragraph.split("\n")):
+                if len(line) >= self.min_chars:
+                    key = _paragraph_key(line) if multiline else paragraph_key
+                    keys.add(key)
+                    # The very first line usually carries the title and company
+                    removable = not protected and (position > 0 or number > 0)
+                    if removable and (self._is_learned(key) or self._is_seed(line)):
+                        boilerplate += 1
+                        continue
+                line_key = _line_key(line)
+                if len(line_key) > 2 and line_key in seen_lines:
+                    duplicates += 1
+                    continue
+                seen_lines.add(line_key)
+                lines.append(line)
+            if lines:
+                kept.append("\n".join(lines))
+        if self.learn:
+            self._observe(keys)
+
+        compacted = "\n\n".join(kept)
+        result = CompactionResult(
+            text=compacted,
+            original_tokens=estimate_tokens(job_description),
+            compacted_tokens=estimate_tokens(compacted),
+            boilerplate_removed=boilerplate,
+            duplicate_lines_removed=duplicates,
+        )
+        with self._lock:
+            self.postings += 1
+            self.original_tokens += result.original_tokens
+            self.compacted_tokens += result.compacted_tokens
+            self._recent[job_description] = result
+            if len(self._recent) > self.recent_size:
+                self._recent.popitem(last=False)
+        return result
+
+    def _is_learned(self, key: str) -> bool:
+        """Whether a paragraph or line fingerprint has been learned as boilerplate."""
+        return self.document_counts.get(key, 0) >= self.min_documents
+
+    def _is_seed(self, line: str) -> bool:
+        """Whether a line matches the built-in legal boilerplate patterns."""
+        return self.use_seed_patterns and bool(_SEED_BOILERPLATE_RE.search(line))
+
+    def _observe(self, keys: Set[str]) -> None:
+        """Count one document's distinct paragraph keys."""
+        with self._lock:
+            self.documents += 1
+            counts = self.document_counts
+            for key in keys:
+                counts[key] = counts.get(key, 0) + 1
+            if len(counts) > self.max_paragraphs:
+                self.document_counts = {key: count for key, count in counts.items() if count > 1}
+
+    def stats(self) -> Dict[str, float]:
+        """Return cumulative compaction savings.
+
+        Returns:
+            Dictionary with postings, original_tokens, compacted_tokens,
+            saved_tokens, savings_ratio and boilerplate_paragraphs
+        """
+        with self._lock:
+            saved = self.original_tokens - self.compacted_tokens
+            return {
+                "postings": self.postings,
+                "original_tokens": self.original_tokens,
+                "compacted_tokens": self.compacted_tokens,
+                "saved_tokens": saved,
+                "savings_ratio": saved / self.original_tokens if self.original_tokens else 0.0,
+                "boilerplate_paragraphs": sum(
+                    1 for count in self.document_counts.values() if count >= self.min_documents
+                ),
+            }
+
+    def save(self, path: str) -> None:
+        """Write the learned paragraph counts to a JSON file.
+
+        Args:
+            path: Output file path
+        """
+        with self._lock:
+            state = {"documents": self.documents, "document_counts": self.document_counts}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+
+    @classmethod
+    def load(cls, path: str, **options) -> "Preprocessor":
+        """Create a preprocessor from counts written by save().
+
+        Args:
+            path: File written by save()
+            **options: Constructor arguments (min_documents, learn, ...)
+
+        Returns:
+            Preprocessor with the learned counts restored
+        """
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        preprocessor = cls(**options)
+        preprocessor.documents = state["documents"]
+        preprocessor.document_counts = state["document_counts"]
+        return preprocessor
+
+
+def verify_compaction(original: str, compacted: str) -> List[str]:
+    """List protected lines of the original that are missing from the compacted text.
+
+    Repeated protected lines only need to survive once, with or without
+    their bullet.
+
+    Args:
+        original: Raw job description text
+        compacted: Output of Preprocessor.compact(original).text
+
+    Returns:
+        Missing lines; empty when nothing protected was dropped
+    """
+    kept = {_line_key(line) for line in compacted.split("\n")}
+    return [line for line in protected_lines(original) if _line_key(line) not in kept]
@@ -0,0 +1,163 @@
+"""Repair malformed extraction responses and salvage their valid fields."""
+import json
+import re
+import threading
+from typing import Any, Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+from pydantic import ValidationError
+
+from .models import JobInformation, job_information_subset
+from .partial_json import PartialJSONParser
+
+
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.IGNORECASE)
+# Separators used when a model returns one string instead of a list
+_LIST_SPLIT_RE = re.compile(r"\s*(?:\n+|;|•)\s*(?:[-*]\s+)?")
+
+
+# Fields that have no default and so must come from the model
+REQUIRED_FIELDS = frozenset(name for name, info in JobInformation.model_fields.items() if info.is_required())
+
+
+class Recovery(NamedTuple):
+    """Fields salvaged from a malformed response and those worth requesting again.
+
+    A complete response that simply omitted optional fields would leave them
+    at their defaults anyway, so `needed` only holds fields lost to
+    truncation, invalid values and missing required fields.
+    """
+
+    data: Dict[str, Any]
+    missing: FrozenSet[str]
+    needed: FrozenSet[str]
+
+
+def _load(text: str) -> Tuple[Dict[str, Any], bool]:
+    """Decode a response, keeping what completed if it is truncated or broken.
+
+    Returns:
+        The decoded top-level fields and whether the whole document decoded
+    """
+    text = _FENCE_RE.sub("", text)
+    start = text.find("{")
+    if start < 0:
+        return {}, False
+    try:
+        data = json.loads(text[start:])
+        return (data, True) if isinstance(data, dict) else ({}, False)
+    except ValueError:
+        pass
+    # Truncated or otherwise broken: keep every top-level field completed before the damage
+    parser = PartialJSONParser()
+    data: Dict[str, Any] = {}
+    try:
+        for line in text[start:].splitlines(keepends=True):
+            for event in parser.feed(line):
+                if event.kind == "field":
+                    data[event.field] = event.value
+    except (ValueError, IndexError):
+        pass
+    return data, False
+
+
+def _coerce(value: Any, is_list: bool) -> Any:
+    """Fix the common type mix-ups between string and list fields."""
+    if is_list:
+        if value is None:
+            return []
+        if isinstance(value, str):
+            return [item for item in _LIST_SPLIT_RE.split(value.strip()) if item]
+        if isinstance(value, list):
+            return [item if isinstance(item, str) else json.dumps(item) for item in value if item is not None]
+        return [str(value)]
+    if isinstance(value, list):
+        return "; ".join(str(item) for item in value if item is not None) or None
+    if isinstance(value, (int, float, bool)):
+        return str(value)
+    if isinstance(value, dict):
+        return json.dumps(value)
+    return value
+
+
+def recover(text: str, fields: FrozenSet[str]) -> Recovery:
+    """Salvage the valid requested fields of a response that failed validation.
+
+    Handles truncated JSON, Markdown code fences, strings where lists are
+    expected (and vice versa), non-string scalars and extra keys. Each field
+    is validated on its own so one bad field does not sink the others.
+
+    Args:
+        text: Raw response text
+        fields: Field names that were requested
+
+    Returns:
+        Recovery with the validated field values, the names still missing and
+        the subset of those worth requesting again
+    """
+    data, complete = _load(text)
+    salvaged: Dict[str, Any] = {}
+    invalid = set()
+    for name in fields:
+        if name not in data:
+            continue
+        annotation = JobInformation.model_fields[name].annotation
+        value = _coerce(data[name], getattr(annotation, "__origin__", None) is list)
+        try:
+            validated = job_information_subset(frozenset({name})).model_validate({name: value})
+        except ValidationError:
+            invalid.add(name)
+            continue
+        salvaged[name] = getattr(validated, name)
+    missing = fields - frozenset(salvaged)
+    needed = (missing & REQUIRED_FIELDS) | frozenset(invalid) if complete else missing
+    return Recovery(salvaged, missing, needed)
+
+
+class RecoveryStats:
+    """Counts how often responses needed repair or a follow-up request."""
+
+    def __init__(self):
+        self.responses = 0
+        self.repaired = 0
+        self.recalled = 0
+        self.failed = 0
+        self.fields_recalled = 0
+        self._lock = threading.Lock()
+
+    def record(self, repaired: bool = False, recalled: Optional[FrozenSet[str]] = None) -> None:
+        """Record one parsed response.
+
+        Args:
+            repaired: The response failed validation and went through recover()
+            recalled: Fields that had to be requested again, if any
+        """
+        with self._lock:
+            self.responses += 1
+            self.repaired += repaired
+            if recalled:
+                self.recalled += 1
+                self.fields_recalled += len(recalled)
+
+    def record_failure(self) -> None:
+        """Record that a follow-up request for missing fields failed validation too."""
+        with self._lock:
+            self.failed += 1
+
+    def stats(self) -> Dict[str, float]:
+        """Return repair counters and rates.
+
+        Returns:
+            Dictionary with responses, repaired, recalled, failed,
+            fields_recalled, repair_rate and recall_rate
+        """
+        with self._lock:
+            responses = self.responses
+            return {
+                "responses": responses,
+                "repaired": self.repaired,
+                "recalled": self.recalled,
+                "failed": self.failed,
+                "fields_recalled": self.fields_recalled,
+                "repair_rate": self.repaired / responses if responses else 0.0,
+                "recall_rate": self.recalled / responses if responses else 0.0,
+            }
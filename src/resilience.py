@@ -0,0 +1,532 @@
+"""Retry, hedging, circuit-breaking and model fallback around JobExtractor."""
+import asyncio
+import random
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Deque, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from .batch import BatchResult, extract_many
+from .job_extractor import RequestScope, request_scope
+from .models import JobInformation, normalize_fields
+
+
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+T = TypeVar("T")
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Decide whether an error is transient and worth retrying on the same model.
+
+    Args:
+        error: Exception raised by an extraction attempt
+
+    Returns:
+        True for rate limiting (429), server errors (5xx), timeouts and connection errors
+    """
+    code = getattr(error, "code", None)
+    if isinstance(code, int):
+        return code in RETRYABLE_STATUS_CODES
+    if isinstance(error, (TimeoutError, asyncio.TimeoutError, ConnectionError)):
+        return True
+    # httpx and the genai client raise their own timeout/transport exception types
+    name = type(error).__name__
+    return "Timeout" in name or "ConnectError" in name or "RemoteProtocolError" in name
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter."""
+
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 20.0
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number `attempt` (starting at 1)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """Stops sending traffic to a model after repeated consecutive failures.
+
+    After `failure_threshold` consecutive failures the breaker opens and
+    rejects calls for `reset_timeout` seconds, then lets a single trial call
+    through (half-open); its outcome closes or re-opens the breaker.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Create a closed breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds to stay open before allowing a trial call
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Whether a call may be attempted now."""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the breaker."""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker past the threshold."""
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class LatencyTracker:
+    """Sliding window of successful call latencies for percentile estimates."""
+
+    def __init__(self, window: int = 200):
+        """Create an empty tracker.
+
+        Args:
+            window: Number of most recent samples kept
+        """
+        self.samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """Add a latency sample."""
+        with self._lock:
+            self.samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Return the q-th quantile (0-1) of the window, or None if empty."""
+        with self._lock:
+            ordered = sorted(self.samples)
+        if not ordered:
+            return None
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+@dataclass
+class AttemptRecord:
+    """Timing and outcome of one request sent to a model."""
+
+    model_name: str
+    attempt: int
+    elapsed: float
+    outcome: str
+    hedged: bool = False
+
+
+@dataclass
+class ExtractionOutcome:
+    """Result of a resilient extraction together with every attempt made."""
+
+    job_info: Optional[JobInformation] = None
+    attempts: List[AttemptRecord] = field(default_factory=list)
+    error: Optional[BaseException] = None
+
+    def failure(self) -> BaseException:
+        """The error to report for a failed extraction."""
+        if self.error is not None:
+            return self.error
+        return RuntimeError("All models are unavailable (circuit breakers open)")
+
+
+class ResilientExtractor:
+    """Wraps a JobExtractor with retries, hedged requests, circuit breakers and fallbacks.
+
+    Each model in the chain (the extractor's own model followed by
+    `fallback_models`) is retried with exponential backoff and jitter on
+    retryable errors; non-retryable errors, exhausted retries or an open
+    circuit breaker move on to the next model. When hedging is enabled, a
+    duplicate request is sent if the first has not answered within the
+    observed p95 latency, and whichever finishes first wins.
+    """
+
+    def __init__(
+        self,
+        extractor,
+        fallback_models: Sequence[str] = ("gemini-2.5-flash-lite",),
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge: bool = True,
+        hedge_quantile: float = 0.95,
+        hedge_min_samples: int = 20,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        max_workers: int = 16,
+    ):
+        """Initialize the resilience layer.
+
+        Args:
+            extractor: JobExtractor used to send requests
+            fallback_models: Models tried in order after the extractor's own model
+            retry_policy: Backoff policy (defaults to RetryPolicy())
+            hedge: Whether to send hedged duplicate requests for slow calls
+            hedge_quantile: Latency quantile after which a hedge is sent
+            hedge_min_samples: Samples needed before hedging starts
+            failure_threshold: Consecutive failures that open a model's circuit breaker
+            reset_timeout: Seconds a breaker stays open before a trial call
+            max_workers: Threads available for concurrent and hedged sync requests
+        """
+        self.extractor = extractor
+        self.model_name = extractor.model_name
+        self.cache = extractor.cache
+        self.models = [extractor.model_name] + [m for m in fallback_models if m != extractor.model_name]
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+        self.breakers: Dict[str, CircuitBreaker] = {
+            model: CircuitBreaker(failure_threshold, reset_timeout) for model in self.models
+        }
+        # Keyed by model name, or "<model> <kind>" for other kinds of request (see run())
+        self.latencies: Dict[str, LatencyTracker] = {model: LatencyTracker() for model in self.models}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="extract")
+
+    def _hedge_delay(self, key: str) -> Optional[float]:
+        """Seconds to wait before hedging a request of this latency key, or None to not hedge."""
+        tracker = self.latencies.setdefault(key, LatencyTracker())
+        if not self.hedge or len(tracker.samples) < self.hedge_min_samples:
+            return None
+        return tracker.percentile(self.hedge_quantile)
+
+    @staticmethod
+    def _timed(scope: RequestScope, operation: Callable[[str], T], model_name: str) -> Tuple[float, T]:
+        """Run one request in `scope`, returning its latency alongside the result."""
+        start = time.perf_counter()
+        with request_scope(scope):
+            result = operation(model_name)
+        return time.perf_counter() - start, result
+
+    @staticmethod
+    async def _timed_async(
+        scope: RequestScope, operation: Callable[[str], Awaitable[T]], model_name: str
+    ) -> Tuple[float, T]:
+        """Asynchronously run one request in `scope`, returning its latency alongside the result."""
+        start = time.perf_counter()
+        with request_scope(scope):
+            result = await operation(model_name)
+        return time.perf_counter() - start, result
+
+    def _attempt(
+        self,
+        operation: Callable[[str], T],
+        model_name: str,
+        key: str,
+        attempt: int,
+        records: List[AttemptRecord],
+    ) -> T:
+        """Send one (possibly hedged) request and record every request made."""
+        start = time.perf_counter()
+        futures: Dict[Future, Tuple[bool, RequestScope]] = {}
+
+        def submit(hedged: bool) -> None:
+            scope = RequestScope()
+            futures[self._executor.submit(self._timed, scope, operation, model_name)] = (hedged, scope)
+
+        submit(False)
+        hedge_delay = self._hedge_delay(key)
+        if hedge_delay is not None:
+            done, _ = wait(futures, timeout=hedge_delay)
+            if not done:
+                submit(True)
+        pending = set(futures)
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    hedged, scope = futures[future]
+                    try:
+                        elapsed, result = future.result()
+                    except Exception as e:
+                        records.append(AttemptRecord(model_name, attempt, time.perf_counter() - start, f"{type(e).__name__}: {e}", hedged))
+                        error = e
+                        continue
+                    records.append(AttemptRecord(model_name, attempt, time.perf_counter() - start, "ok", hedged))
+                    # Results that never reached the network (e.g. all fields pre-extracted)
+                    # would drag the latency percentiles, and so the hedge delay, down
+                    if scope.sent:
+                        self.latencies[key].record(elapsed)
+                    return result
+            raise error
+        finally:
+            # A losing request that has not started is dropped; one that has sends
+            # nothing after its current request, and its result is discarded
+            for future in pending:
+                future.cancel()
+                futures[future][1].cancel()
+
+    async def _attempt_async(
+        self,
+        operation: Callable[[str], Awaitable[T]],
+        model_name: str,
+        key: str,
+        attempt: int,
+        records: List[AttemptRecord],
+    ) -> T:
+        """Asynchronously send one (possibly hedged) request and record every request made."""
+        start = time.perf_counter()
+        tasks: Dict[asyncio.Future, Tuple[bool, RequestScope]] = {}
+
+        def submit(hedged: bool) -> None:
+            scope = RequestScope()
+            tasks[asyncio.ensure_future(self._timed_async(scope, operation, model_name))] = (hedged, scope)
+
+        submit(False)
+        hedge_delay = self._hedge_delay(key)
+        if hedge_delay is not None:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if not done:
+                submit(True)
+        pending = set(tasks)
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    hedged, scope = tasks[task]
+                    try:
+                        elapsed, result = task.result()
+                    except Exception as e:
+                        records.append(AttemptRecord(model_name, attempt, time.perf_counter() - start, f"{type(e).__name__}: {e}", hedged))
+                        error = e
+                        continue
+                    records.append(AttemptRecord(model_name, attempt, time.perf_counter() - start, "ok", hedged))
+                    if scope.sent:
+                        self.latencies[key].record(elapsed)
+                    return result
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _failed(self, breaker: CircuitBreaker, error: Exception, attempt: int) -> bool:
+        """Record a failed attempt on the breaker; returns whether to retry the same model."""
+        if not is_retryable(error):
+            # The model answered (e.g. with an invalid response), so it is
+            # available: only transport errors, 429 and 5xx count against it
+            breaker.record_success()
+            return False
+        breaker.record_failure()
+        return attempt < self.retry_policy.max_attempts
+
+    def run(self, operation: Callable[[str], T], outcome: ExtractionOutcome, kind: str = "") -> Optional[Tuple[str, T]]:
+        """Call operation(model_name) with retries, hedging, circuit breakers and fallback.
+
+        Args:
+            operation: Sends one request to the given model and returns its result
+            outcome: Receives every attempt made and the last error
+            kind: Kind of request, when its latency differs from a single extraction's;
+                  each kind gets its own latency window for the hedge delay
+
+        Returns:
+            (model name, result) of the first successful call, or None if every model failed
+        """
+        for model_name in self.models:
+            breaker = self.breakers[model_name]
+            key = f"{model_name} {kind}" if kind else model_name
+            for attempt in range(1, self.retry_policy.max_attempts + 1):
+                if not breaker.allow():
+                    outcome.attempts.append(AttemptRecord(model_name, attempt, 0.0, "circuit open"))
+                    break
+                try:
+                    result = self._attempt(operation, model_name, key, attempt, outcome.attempts)
+                except Exception as e:
+                    outcome.error = e
+                    if not self._failed(breaker, e, attempt):
+                        break
+                    time.sleep(self.retry_policy.delay(attempt))
+                    continue
+                breaker.record_success()
+                outcome.error = None
+                return model_name, result
+        return None
+
+    async def run_async(
+        self, operation: Callable[[str], Awaitable[T]], outcome: ExtractionOutcome, kind: str = ""
+    ) -> Optional[Tuple[str, T]]:
+        """Asynchronous variant of run(), for a coroutine function operation(model_name)."""
+        for model_name in self.models:
+            breaker = self.breakers[model_name]
+            key = f"{model_name} {kind}" if kind else model_name
+            for attempt in range(1, self.retry_policy.max_attempts + 1):
+                if not breaker.allow():
+                    outcome.attempts.append(AttemptRecord(model_name, attempt, 0.0, "circuit open"))
+                    break
+                try:
+                    result = await self._attempt_async(operation, model_name, key, attempt, outcome.attempts)
+                except Exception as e:
+                    outcome.error = e
+                    if not self._failed(breaker, e, attempt):
+                        break
+                    await asyncio.sleep(self.retry_policy.delay(attempt))
+                    continue
+                breaker.record_success()
+                outcome.error = None
+                return model_name, result
+        return None
+
+    def _lookup(self, job_description: str, fields: FrozenSet[str]) -> Optional[JobInformation]:
+        """Cached or near-duplicate result for any model of the chain, without calling the API."""
+        for model_name in self.models:
+            known = self.extractor._lookup(job_description, fields, model_name)
+            if known is not None:
+                return known
+        return None
+
+    def extract(
+        self,
+        job_description: str,
+        fields: Optional[Iterable[str]] = None,
+        lookup: bool = True,
+    ) -> ExtractionOutcome:
+        """Extract with retries, hedging and fallback, recording every attempt.
+
+        Args:
+            job_description: Raw job description text
+            fields: Names of the JobInformation fields to extract (default: all)
+            lookup: Whether to check the cache and near-duplicate index first
+                    (False when the caller already has)
+
+        Returns:
+            ExtractionOutcome with the result (or last error) and per-attempt timings
+        """
+        requested = normalize_fields(fields)
+        outcome = ExtractionOutcome()
+        outcome.job_info = self._lookup(job_description, requested) if lookup else None
+        if outcome.job_info is None:
+            success = self.run(
+                lambda model_name: self.extractor.generate(job_description, model_name, requested), outcome
+            )
+            if success is not None:
+                model_name, outcome.job_info = success
+                self.extractor._remember(job_description, requested, outcome.job_info, model_name)
+        return outcome
+
+    def extract_information(
+        self,
+        job_description: str,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Optional[JobInformation]:
+        """Drop-in replacement for JobExtractor.extract_information.
+
+        Args:
+            job_description: Raw job description text
+            fields: Names of the JobInformation fields to extract (default: all)
+
+        Returns:
+            JobInformation object with extracted data, or None if every model failed
+        """
+        outcome = self.extract(job_description, fields)
+        if outcome.job_info is None:
+            print(f"Error extracting information: {outcome.error}", file=sys.stderr)
+            for record in outcome.attempts:
+                print(
+                    f"  {record.model_name} attempt {record.attempt}{' (hedge)' if record.hedged else ''}: "
+                    f"{record.outcome} after {record.elapsed:.2f}s",
+                    file=sys.stderr,
+                )
+        return outcome.job_info
+
+    async def extract_async(
+        self,
+        job_description: str,
+        fields: Optional[Iterable[str]] = None,
+        lookup: bool = True,
+    ) -> ExtractionOutcome:
+        """Asynchronous variant of extract().
+
+        Args:
+            job_description: Raw job description text
+            fields: Names of the JobInformation fields to extract (default: all)
+            lookup: Whether to check the cache and near-duplicate index first
+
+        Returns:
+            ExtractionOutcome with the result (or last error) and per-attempt timings
+        """
+        requested = normalize_fields(fields)
+        outcome = ExtractionOutcome()
+        outcome.job_info = self._lookup(job_description, requested) if lookup else None
+        if outcome.job_info is None:
+            success = await self.run_async(
+                lambda model_name: self.extractor.generate_async(job_description, model_name, requested), outcome
+            )
+            if success is not None:
+                model_name, outcome.job_info = success
+                self.extractor._remember(job_description, requested, outcome.job_info, model_name)
+        return outcome
+
+    async def extract_information_async(
+        self,
+        job_description: str,
+        fields: Optional[Iterable[str]] = None,
+    ) -> JobInformation:
+        """Drop-in replacement for JobExtractor.extract_information_async.
+
+        Args:
+            job_description: Raw job description text
+            fields: Names of the JobInformation fields to extract (default: all)
+
+        Returns:
+            JobInformation object with extracted data
+
+        Raises:
+            Exception: The last error seen once every model has failed
+        """
+        outcome = await self.extract_async(job_description, fields)
+        if outcome.job_info is None:
+            raise outcome.failure()
+        return outcome.job_info
+
+    def extract_many(
+        self,
+        job_descriptions: Iterable[str],
+        concurrency: int = 8,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> AsyncIterator[BatchResult]:
+        """Resilient counterpart of JobExtractor.extract_many (see batch.extract_many)."""
+        return extract_many(
+            self,
+            job_descriptions,
+            concurrency=concurrency,
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+            fields=fields,
+        )
+
+    def close(self) -> None:
+        """Shut down the threads used for sync, hedged and chunk requests, without waiting for them."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.extractor.close()
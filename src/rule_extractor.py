@@ -0,0 +1,143 @@
+"""Deterministic rule-based extraction of pattern-matchable JobInformation fields."""
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from .skills import default_canonicalizer
+
+
+@dataclass
+class FieldGuess:
+    """A locally extracted field value with a confidence between 0 and 1."""
+
+    value: Any
+    confidence: float
+
+
+_AMOUNT = r"\d{1,3}(?:[,.]\d{3})*(?:\.\d+)?\s*[kK]?"
+# Case-sensitive apart from the period words: currency codes are written in capitals,
+# and avoiding IGNORECASE on the leading alternation keeps the scan fast
+_SALARY_RE = re.compile(
+    r"(?P<cur>[$€£]|\b(?:USD|EUR|GBP|CAD|AUD) ?)(?P<low>" + _AMOUNT + r")"
+    r"(?:\s*(?:-|–|—|(?i:to))\s*(?:[$€£]|(?:USD|EUR|GBP|CAD|AUD) ?)?(?P<high>" + _AMOUNT + r"))?"
+    r"(?P<period>\s*(?i:/|per|an|a)\s*(?i:year|yr|annum|hour|hr|month|mo|day|week))?"
+)
+_SALARY_CONTEXT_RE = re.compile(r"\b(?:salary|compensation|pay|base|ote|wage|rate)\b", re.IGNORECASE)
+
+# Numbers of more than two digits ("100 years ago", "2024") are not experience requirements
+_YEARS_RE = re.compile(
+    r"(?<![\d.])(?P<low>\d{1,2})(?!\d)\s*(?P<plus>\+|\s*plus)?\s*(?:(?:-|–|to)\s*(?P<high>\d{1,2})(?!\d)\s*\+?)?\s*(?:years?|yrs?)\b",
+    re.IGNORECASE,
+)
+_EXPERIENCE_RE = re.compile(r"\bexperience\b", re.IGNORECASE)
+
+_WORK_TYPE_PATTERNS = {
+    "Remote": re.compile(r"\b(?:remote|work from home|wfh|fully distributed)\b", re.IGNORECASE),
+    "Hybrid": re.compile(r"\bhybrid\b", re.IGNORECASE),
+    "On-site": re.compile(r"\b(?:on-?site|in[- ]office|in person)\b", re.IGNORECASE),
+}
+_LABELED_RE = {
+    "work_type": re.compile(r"^\s*(?:work\s*type|work\s*arrangement|workplace(?:\s*type)?)\s*:\s*(.+)$", re.IGNORECASE | re.MULTILINE),
+    "location": re.compile(r"^\s*(?:location|based in|office location)\s*:\s*(.+)$", re.IGNORECASE | re.MULTILINE),
+}
+
+
+class RuleExtractor:
+    """Fast regex and dictionary extractor for salary, experience, work type, location and skills.
+
+    Every field is reported with a confidence so callers can decide which
+    values to trust and which to still request from the model.
+    """
+
+    fields = ("salary", "years_of_experience", "work_type", "location", "skills")
+
+    def extract(self, job_description: str) -> Dict[str, FieldGuess]:
+        """Extract the pattern-matchable fields from a job description.
+
+        Args:
+            job_description: Raw job description text
+
+        Returns:
+            Mapping of field name to FieldGuess for every field that was found
+        """
+        guesses: Dict[str, FieldGuess] = {}
+        for field, guess in (
+            ("salary", self._salary(job_description)),
+            ("years_of_experience", self._years(job_description)),
+            ("work_type", self._work_type(job_description)),
+            ("location", self._location(job_description)),
+            ("skills", self._skills(job_description)),
+        ):
+            if guess is not None:
+                guesses[field] = guess
+        return guesses
+
+    def extract_many(self, job_descriptions: Iterable[str]) -> List[Dict[str, FieldGuess]]:
+        """Run extract() over many descriptions."""
+        return [self.extract(text) for text in job_descriptions]
+
+    @staticmethod
+    def _salary(text: str) -> Optional[FieldGuess]:
+        match = _SALARY_RE.search(text)
+        if match is None:
+            return None
+        value = match.group(0).strip()
+        line_start = text.rfind("\n", 0, match.start()) + 1
+        line = text[line_start:match.start()]
+        confidence = 0.6
+        if match.group("high"):
+            confidence += 0.15
+        if _SALARY_CONTEXT_RE.search(line) or match.group("period"):
+            confidence += 0.2
+        if _SALARY_RE.search(text, match.end()) and not match.group("high"):
+            # Several unrelated amounts (e.g. bonus, equity) make a single value doubtful
+            confidence -= 0.2
+        return FieldGuess(value, round(min(confidence, 0.95), 2))
+
+    @staticmethod
+    def _years(text: str) -> Optional[FieldGuess]:
+        best: Optional[FieldGuess] = None
+        for match in _YEARS_RE.finditer(text):
+            low, high, plus = match.group("low"), match.group("high"), match.group("plus")
+            if high:
+                value = f"{low}-{high} years"
+            elif plus:
+                value = f"{low}+ years"
+            else:
+                value = f"{low} years"
+            line_end = text.find("\n", match.end())
+            line = text[text.rfind("\n", 0, match.start()) + 1:line_end if line_end != -1 else len(text)]
+            confidence = 0.9 if _EXPERIENCE_RE.search(line) else 0.4
+            if best is None or confidence > best.confidence:
+                best = FieldGuess(value, confidence)
+            if confidence >= 0.9:
+                break
+        return best
+
+    @staticmethod
+    def _work_type(text: str) -> Optional[FieldGuess]:
+        labeled = _LABELED_RE["work_type"].search(text)
+        scope = labeled.group(1) if labeled else text
+        found = [name for name, pattern in _WORK_TYPE_PATTERNS.items() if pattern.search(scope)]
+        if not found:
+            return None
+        if len(found) == 1:
+            return FieldGuess(found[0], 0.95 if labeled else 0.8)
+        # Several arrangements mentioned (e.g. "Remote/Hybrid") - let the model decide
+        return FieldGuess("/".join(found), 0.5 if labeled else 0.3)
+
+    @staticmethod
+    def _location(text: str) -> Optional[FieldGuess]:
+        labeled = _LABELED_RE["location"].search(text)
+        if labeled is None:
+            return None
+        value = labeled.group(1).strip().rstrip(".")
+        return FieldGuess(value, 0.9 if len(value) <= 80 else 0.5)
+
+    @staticmethod
+    def _skills(text: str) -> Optional[FieldGuess]:
+        skills = default_canonicalizer().find(text)
+        if not skills:
+            return None
+        # A dictionary can only find skills it knows, so never claim completeness
+        return FieldGuess(skills, 0.6)
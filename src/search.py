@@ -0,0 +1,562 @@
+"""In-memory faceted inverted index and query API over extracted JobInformation."""
+import heapq
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from .models import LIST_FIELDS, JobInformation
+
+
+FACET_FIELDS = ("skills", "seniority_level", "work_type", "location", "company_name")
+TEXT_FIELDS = (
+    "job_title",
+    "company_name",
+    "department",
+    "location",
+    "skills",
+    "required_criteria",
+    "preferred_qualifications",
+    "scope_of_responsibilities",
+    "education_requirements",
+    "additional_info",
+)
+
+# Keeps technology names such as c++, c#, node.js and ci/cd in one token
+_TOKEN_RE = re.compile(r"[a-z0-9](?:[a-z0-9+#./-]*[a-z0-9+#])?")
+# A posting list gets a bitmap once it holds at least 1/32 of all documents,
+# the point where the bitmap is no larger than the uint32 array
+_DENSE_FRACTION = 32
+# Facet counting gathers a result's value codes unless that would touch more
+# entries than this many times `limit` full bitmap intersections (in words)
+_GATHER_PER_BITMAP_WORD = 100
+_EMPTY_IDS = np.empty(0, dtype=np.uint32)
+_ONE = np.uint64(1)
+_POPCOUNT_8 = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+
+def normalize_facet_value(value: str) -> str:
+    """Normalize a facet value so casing and spacing differences match.
+
+    Args:
+        value: Raw field value
+
+    Returns:
+        Case-folded value with whitespace collapsed
+    """
+    return " ".join(value.split()).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lower-case search tokens.
+
+    Args:
+        text: Field value or query text
+
+    Returns:
+        Tokens in order
+    """
+    return _TOKEN_RE.findall(text.casefold())
+
+
+def _popcounts(words: np.ndarray) -> np.ndarray:
+    """Number of set bits in each uint64 word."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words)
+    return _POPCOUNT_8[words.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+
+def _bitmap_ids(words: np.ndarray, first_word: int = 0) -> np.ndarray:
+    """Sorted IDs of the set bits, unpacking only non-zero words."""
+    nonzero = np.flatnonzero(words)
+    bits = np.unpackbits(words[nonzero].view(np.uint8), bitorder="little").reshape(-1, 64)
+    rows, columns = np.nonzero(bits)
+    return ((nonzero[rows] + first_word) * 64 + columns).astype(np.uint32)
+
+
+def _probe(ids: np.ndarray, words: np.ndarray) -> np.ndarray:
+    """Mask of which IDs have their bit set in a bitmap."""
+    return ((words[ids >> 6] >> (ids & 63).astype(np.uint64)) & _ONE).astype(bool)
+
+
+def intersect(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Intersect two sorted, duplicate-free ID arrays.
+
+    Very unequal lengths use a binary search of the shorter array's IDs in
+    the longer one (O(n log m)); similar lengths use a linear merge.
+
+    Args:
+        first: Sorted document IDs
+        second: Sorted document IDs
+
+    Returns:
+        Sorted IDs present in both
+    """
+    if len(first) > len(second):
+        first, second = second, first
+    if not len(first):
+        return first
+    if len(first) * 16 < len(second):
+        positions = np.searchsorted(second, first)
+        positions[positions == len(second)] = 0
+        return first[second[positions] == first]
+    return np.intersect1d(first, second, assume_unique=True)
+
+
+class _GrowableArray:
+    """Append-only numpy array (a posting list or a CSR column).
+
+    Appends are staged in a Python list, which is far cheaper per item than
+    writing into numpy, and moved into the array (doubling its capacity as
+    needed) on the next view(). Views stay valid after later appends, which
+    either write past them or reallocate.
+    """
+
+    __slots__ = ("data", "size", "pending")
+
+    def __init__(self, dtype=np.uint32, capacity: int = 4):
+        self.data = np.empty(capacity, dtype=dtype)
+        self.size = 0
+        self.pending: list = []
+
+    def __len__(self) -> int:
+        return self.size + len(self.pending)
+
+    def view(self) -> np.ndarray:
+        if self.pending:
+            end = self.size + len(self.pending)
+            if end > len(self.data):
+                grown = np.empty(max(end, 2 * len(self.data)), dtype=self.data.dtype)
+                grown[:self.size] = self.data[:self.size]
+                self.data = grown
+            self.data[self.size:end] = self.pending
+            self.size = end
+            self.pending = []
+        return self.data[:self.size]
+
+
+class _PostingList(_GrowableArray):
+    """Sorted document IDs of one term, plus a bitmap of them once the term is dense."""
+
+    __slots__ = ("bitmap", "bitmap_ids")
+
+    def __init__(self):
+        super().__init__()
+        self.bitmap: Optional[np.ndarray] = None
+        self.bitmap_ids = 0
+
+    def bits(self, num_words: int) -> np.ndarray:
+        """The IDs as a bitmap of `num_words` uint64 words, updated incrementally (do not modify)."""
+        ids = self.view()
+        bitmap = self.bitmap
+        if bitmap is None or len(bitmap) < num_words:
+            grown = np.zeros(max(num_words, 2 * len(bitmap) if bitmap is not None else 0), dtype=np.uint64)
+            if bitmap is not None:
+                grown[:len(bitmap)] = bitmap
+            bitmap = self.bitmap = grown
+        new = ids[self.bitmap_ids:]
+        if len(new) > 4096:
+            mask = np.zeros(len(bitmap) * 64, dtype=bool)
+            mask[ids] = True
+            bitmap[:] = np.packbits(mask, bitorder="little").view(np.uint64)
+        elif len(new):
+            np.bitwise_or.at(bitmap, new >> 6, np.left_shift(_ONE, (new & 63).astype(np.uint64)))
+        self.bitmap_ids = len(ids)
+        return bitmap[:num_words]
+
+
+class _DocSet:
+    """Intermediate query result: sorted IDs when sparse, a bitmap when dense."""
+
+    __slots__ = ("ids", "words")
+
+    def __init__(self, ids: Optional[np.ndarray] = None, words: Optional[np.ndarray] = None):
+        self.ids = ids
+        self.words = words
+
+    def __len__(self) -> int:
+        if self.ids is not None:
+            return len(self.ids)
+        return int(_popcounts(self.words).sum())
+
+    def to_ids(self) -> np.ndarray:
+        if self.ids is None:
+            self.ids = _bitmap_ids(self.words)
+        return self.ids
+
+    def page(self, offset: int, limit: int) -> np.ndarray:
+        """IDs offset..offset+limit, unpacking only the bitmap words they fall in."""
+        if self.ids is not None or limit < 1:
+            return self.to_ids()[offset:offset + limit]
+        cumulative = np.cumsum(_popcounts(self.words), dtype=np.int64)
+        first = int(np.searchsorted(cumulative, offset, side="right"))
+        last = int(np.searchsorted(cumulative, offset + limit, side="left")) + 1
+        skipped = int(cumulative[first - 1]) if first else 0
+        ids = _bitmap_ids(self.words[first:last], first)
+        return ids[offset - skipped:offset - skipped + limit]
+
+    def intersect(self, other: "_DocSet") -> "_DocSet":
+        if self.ids is not None and other.ids is not None:
+            return _DocSet(ids=intersect(self.ids, other.ids))
+        if self.ids is not None:
+            return _DocSet(ids=self.ids[_probe(self.ids, other.words)])
+        if other.ids is not None:
+            return _DocSet(ids=other.ids[_probe(other.ids, self.words)])
+        return _DocSet(words=self.words & other.words)
+
+    def union(self, other: "_DocSet") -> "_DocSet":
+        if self.ids is not None and other.ids is not None:
+            return _DocSet(ids=np.union1d(self.ids, other.ids))
+        words = (self.words if self.words is not None else other.words).copy()
+        sparse = self if self.words is None else other
+        if sparse.words is not None:
+            words |= sparse.words
+        else:
+            np.bitwise_or.at(words, sparse.ids >> 6, np.left_shift(_ONE, (sparse.ids & 63).astype(np.uint64)))
+        return _DocSet(words=words)
+
+
+@dataclass
+class SearchResult:
+    """Matches of one query, in insertion order."""
+
+    total: int
+    posting_ids: List[str]
+    facets: Dict[str, List[Tuple[str, int]]] = field(default_factory=dict)
+
+
+class FacetIndex:
+    """Inverted index over JobInformation facets and text, with facet counts.
+
+    Each facet value and each text token maps to a posting list of sorted
+    uint32 document IDs (documents are numbered in insertion order, so
+    appends keep lists sorted). Lists holding at least 1/32 of all
+    documents also keep a bitmap, so common terms (a seniority level, a work
+    type) are intersected by AND-ing 64-bit words and rare ones by probing
+    their IDs into the bitmaps; the rarest list is always applied first.
+    Facet values are also stored per document in CSR form (offsets plus
+    value codes), so counting the facets of a small result set is one
+    gather and one np.bincount; large results count the most frequent
+    values with popcounts until the rest cannot make the top.
+
+    Postings can be added at any time, including between queries; adding a
+    posting ID again replaces its earlier version. The index is not
+    thread-safe.
+    """
+
+    def __init__(self, facet_fields: Iterable[str] = FACET_FIELDS, text_fields: Iterable[str] = TEXT_FIELDS):
+        """Create an empty index.
+
+        Args:
+            facet_fields: JobInformation fields indexed as exact (normalized) values
+            text_fields: JobInformation fields whose tokens are searchable with `text`
+        """
+        self.facet_fields = tuple(facet_fields)
+        self.text_fields = tuple(text_fields)
+        self._posting_ids: List[str] = []
+        self._doc_by_posting: Dict[str, int] = {}
+        self._deleted = np.zeros(16, dtype=np.uint64)
+        self._deleted_count = 0
+        # Per facet: normalized value -> code, code -> display value, code -> postings, CSR columns
+        self._codes: Dict[str, Dict[str, int]] = {name: {} for name in self.facet_fields}
+        self._values: Dict[str, List[str]] = {name: [] for name in self.facet_fields}
+        self._facet_postings: Dict[str, List[_PostingList]] = {name: [] for name in self.facet_fields}
+        self._offsets: Dict[str, _GrowableArray] = {}
+        self._value_codes: Dict[str, _GrowableArray] = {}
+        for name in self.facet_fields:
+            self._offsets[name] = _GrowableArray(np.int64, 1024)
+            self._offsets[name].pending.append(0)
+            self._value_codes[name] = _GrowableArray(np.uint32, 1024)
+        self._text_postings: Dict[str, _PostingList] = {}
+        self._orders: Dict[str, Tuple[int, np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        """Number of live (not replaced or removed) postings."""
+        return len(self._posting_ids) - self._deleted_count
+
+    @property
+    def _num_words(self) -> int:
+        return (len(self._posting_ids) + 63) // 64
+
+    def add(self, posting_id: str, job_info: JobInformation) -> None:
+        """Index one extraction result.
+
+        Args:
+            posting_id: ID of the posting the result belongs to
+            job_info: Extracted JobInformation
+        """
+        self.remove(posting_id)
+        doc = len(self._posting_ids)
+        self._posting_ids.append(posting_id)
+        self._doc_by_posting[posting_id] = doc
+        if doc >> 6 >= len(self._deleted):
+            grown = np.zeros(2 * len(self._deleted), dtype=np.uint64)
+            grown[:len(self._deleted)] = self._deleted
+            self._deleted = grown
+        values = job_info.__dict__
+
+        for name in self.facet_fields:
+            codes = self._codes[name]
+            column = self._value_codes[name]
+            for value in self._field_values(values.get(name)):
+                key = normalize_facet_value(value)
+                if not key:
+                    continue
+                code = codes.get(key)
+                if code is None:
+                    code = codes[key] = len(self._values[name])
+                    self._values[name].append(value.strip())
+                    self._facet_postings[name].append(_PostingList())
+                postings = self._facet_postings[name][code].pending
+                # A value repeated within one posting is indexed once
+                if not postings or postings[-1] != doc:
+                    postings.append(doc)
+                    column.pending.append(code)
+            self._offsets[name].pending.append(len(column))
+
+        text = " ".join(" ".join(self._field_values(values.get(name))) for name in self.text_fields)
+        text_postings = self._text_postings
+        for token in set(tokenize(text)):
+            postings = text_postings.get(token)
+            if postings is None:
+                postings = text_postings[token] = _PostingList()
+            postings.pending.append(doc)
+
+    def add_many(self, results: Iterable[Tuple[str, JobInformation]]) -> int:
+        """Index many results, e.g. JobQueue.results().
+
+        Args:
+            results: Iterable of (posting_id, JobInformation) pairs
+
+        Returns:
+            Number of results indexed
+        """
+        count = 0
+        for posting_id, job_info in results:
+            self.add(posting_id, job_info)
+            count += 1
+        return count
+
+    def remove(self, posting_id: str) -> bool:
+        """Drop a posting from future results.
+
+        Its postings stay in the lists and are filtered out at query time.
+
+        Args:
+            posting_id: ID of the posting
+
+        Returns:
+            True if the posting was indexed
+        """
+        doc = self._doc_by_posting.pop(posting_id, None)
+        if doc is None:
+            return False
+        self._deleted[doc >> 6] |= _ONE << np.uint64(doc & 63)
+        self._deleted_count += 1
+        return True
+
+    @staticmethod
+    def _field_values(value) -> List[str]:
+        """A field value as a list of strings (empty for None)."""
+        if value is None:
+            return []
+        if isinstance(value, list):
+            return [str(item) for item in value if item]
+        return [str(value)]
+
+    def _docs(self, postings: Optional[_PostingList]) -> _DocSet:
+        """The documents of one posting list, as a bitmap if the term is dense."""
+        if postings is None:
+            return _DocSet(ids=_EMPTY_IDS)
+        if len(postings) * _DENSE_FRACTION >= len(self._posting_ids):
+            return _DocSet(words=postings.bits(self._num_words))
+        return _DocSet(ids=postings.view())
+
+    def _all_docs(self) -> _DocSet:
+        words = np.full(self._num_words, np.iinfo(np.uint64).max, dtype=np.uint64)
+        tail = len(self._posting_ids) % 64
+        if tail:
+            words[-1] = (_ONE << np.uint64(tail)) - _ONE
+        return _DocSet(words=words)
+
+    def _facet_docs(self, name: str, wanted: Union[str, Iterable[str]]) -> List[_DocSet]:
+        """Document sets that must all match for one facet filter.
+
+        For multi-valued fields (lists such as skills) every value is
+        required; for single-valued fields any of the values may match.
+        """
+        if name not in self._codes:
+            raise ValueError(f"Not a facet field: {name}")
+        values = [wanted] if isinstance(wanted, str) else list(wanted)
+        postings = self._facet_postings[name]
+        sets = []
+        for value in values:
+            code = self._codes[name].get(normalize_facet_value(value))
+            sets.append(self._docs(postings[code] if code is not None else None))
+        if name in LIST_FIELDS or len(sets) < 2:
+            return sets
+        union = sets[0]
+        for docs in sets[1:]:
+            union = union.union(docs)
+        return [union]
+
+    def _match(self, filters: Optional[Mapping[str, Union[str, Iterable[str]]]], text: Optional[str]) -> _DocSet:
+        """Intersect every filter and text token, sparsest first."""
+        sets: List[_DocSet] = []
+        for name, wanted in (filters or {}).items():
+            sets.extend(self._facet_docs(name, wanted))
+        for token in set(tokenize(text or "")):
+            sets.append(self._docs(self._text_postings.get(token)))
+        # Sorted ID arrays first, shortest first; bitmaps are then applied by probing
+        sets.sort(key=lambda docs: (docs.ids is None, len(docs.ids) if docs.ids is not None else 0))
+        result = sets[0] if sets else self._all_docs()
+        for docs in sets[1:]:
+            if result.ids is not None and not len(result.ids):
+                break
+            result = result.intersect(docs)
+        if self._deleted_count:
+            deleted = self._deleted[:self._num_words]
+            if result.ids is not None:
+                result = _DocSet(ids=result.ids[~_probe(result.ids, deleted)])
+            else:
+                result = _DocSet(words=result.words & ~deleted)
+        return result
+
+    def match(self, filters: Optional[Mapping[str, Union[str, Iterable[str]]]] = None, text: Optional[str] = None) -> np.ndarray:
+        """Internal document IDs matching every filter and every text token.
+
+        Args:
+            filters: Facet field -> value or list of values (see search())
+            text: Free text; every token must appear in one of the text fields
+
+        Returns:
+            Sorted uint32 array of document IDs
+        """
+        return self._match(filters, text).to_ids()
+
+    def facet_counts(self, ids: np.ndarray, name: str, limit: int = 10) -> List[Tuple[str, int]]:
+        """Most common values of a facet among a set of documents.
+
+        Args:
+            ids: Internal document IDs, e.g. from match()
+            name: Facet field
+            limit: Number of values to return
+
+        Returns:
+            (value, count) pairs, most common first
+        """
+        return self._facet_counts(_DocSet(ids=ids), name, limit)
+
+    def _value_order(self, name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Codes of a facet's values, most frequent first, with their posting list lengths."""
+        cached = self._orders.get(name)
+        if cached is None or cached[0] != len(self._posting_ids):
+            totals = np.array([len(postings) for postings in self._facet_postings[name]], dtype=np.int64)
+            cached = self._orders[name] = (len(self._posting_ids), np.argsort(-totals, kind="stable"), totals)
+        return cached[1], cached[2]
+
+    def _facet_counts(self, docs: _DocSet, name: str, limit: int) -> List[Tuple[str, int]]:
+        """Top facet values of a result set.
+
+        Results up to a few million value entries gather their documents'
+        value codes from the CSR column and bincount them. Larger ones
+        instead count the values most frequent overall first, by popcount
+        or probing, and stop once the next value's overall frequency (an
+        upper bound on its count here) cannot reach the current top `limit`.
+        """
+        postings = self._facet_postings[name]
+        if limit < 1 or not postings:
+            return []
+        values_per_doc = len(self._value_codes[name]) / max(len(self._posting_ids), 1)
+        gather_cost = len(docs) * (values_per_doc + 1)
+        if docs.ids is None and gather_cost > _GATHER_PER_BITMAP_WORD * limit * self._num_words:
+            order, totals = self._value_order(name)
+            top: List[Tuple[int, int]] = []
+            for code in order.tolist():
+                if len(top) == limit and top[0][0] >= totals[code]:
+                    break
+                count = len(docs.intersect(self._docs(postings[code])))
+                if len(top) < limit:
+                    heapq.heappush(top, (count, -code))
+                elif count > top[0][0]:
+                    heapq.heapreplace(top, (count, -code))
+            return [(self._values[name][-code], count) for count, code in sorted(top, reverse=True) if count]
+
+        ids = docs.to_ids()
+        offsets = self._offsets[name].view()
+        starts = offsets[ids]
+        lengths = offsets[ids.astype(np.int64) + 1] - starts
+        total = int(lengths.sum())
+        if not total:
+            return []
+        # Positions of every value of every selected document in the CSR code column
+        positions = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths) + np.arange(total)
+        counts = np.bincount(self._value_codes[name].view()[positions], minlength=len(postings))
+        if len(counts) > limit:
+            top = np.argpartition(-counts, limit - 1)[:limit]
+        else:
+            top = np.arange(len(counts))
+        top = top[np.argsort(-counts[top], kind="stable")]
+        return [(self._values[name][code], int(counts[code])) for code in top if counts[code]]
+
+    def search(
+        self,
+        filters: Optional[Mapping[str, Union[str, Iterable[str]]]] = None,
+        text: Optional[str] = None,
+        facets: Iterable[str] = (),
+        limit: int = 20,
+        offset: int = 0,
+        facet_limit: int = 10,
+    ) -> SearchResult:
+        """Find postings by facet values and free text.
+
+        Example: senior remote roles requiring Kubernetes in Berlin::
+
+            index.search({"seniority_level": "Senior", "work_type": "Remote",
+                          "skills": ["Kubernetes"], "location": "Berlin"},
+                         facets=["company_name"])
+
+        Args:
+            filters: Facet field -> value or list of values. All values of a
+                list field (skills) are required; for single-valued fields
+                any of the values may match. Matching ignores case and spacing.
+            text: Free text; every token must appear in one of the text fields
+            facets: Facet fields to count over the whole result set
+            limit: Number of posting IDs to return
+            offset: Number of matches to skip (for paging)
+            facet_limit: Number of values per facet
+
+        Returns:
+            SearchResult with the total match count, one page of posting IDs
+            in insertion order, and the requested facet counts
+
+        Raises:
+            ValueError: If a filter or facet names a field that is not a facet
+        """
+        for name in facets:
+            if name not in self._codes:
+                raise ValueError(f"Not a facet field: {name}")
+        docs = self._match(filters, text)
+        return SearchResult(
+            total=len(docs),
+            posting_ids=[self._posting_ids[doc] for doc in docs.page(offset, limit).tolist()],
+            facets={name: self._facet_counts(docs, name, facet_limit) for name in facets},
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """Index size: postings, distinct terms and bytes held by posting lists, bitmaps and facet columns."""
+        lists = list(self._text_postings.values())
+        lists += [postings for values in self._facet_postings.values() for postings in values]
+        return {
+            "postings": len(self),
+            "text_terms": len(self._text_postings),
+            "facet_values": sum(len(values) for values in self._facet_postings.values()),
+            "posting_list_bytes": sum(postings.data.nbytes + 8 * len(postings.pending) for postings in lists),
+            "bitmap_bytes": sum(postings.bitmap.nbytes for postings in lists if postings.bitmap is not None),
+            "facet_column_bytes": sum(
+                column.data.nbytes + 8 * len(column.pending)
+                for name in self.facet_fields
+                for column in (self._offsets[name], self._value_codes[name])
+            ),
+        }
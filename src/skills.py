@@ -0,0 +1,652 @@
+"""Skill canonicalization with a token-level trie compiled from an alias dictionary."""
+import hashlib
+import json
+import os
+import re
+import string
+from itertools import compress, count
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from .models import JobInformation
+
+
+# Canonical skill name -> lowercase aliases safe to match anywhere in prose.
+# Canonical names are always accepted as exact, whole-skill matches, so
+# ambiguous words ("Go", "Swift", "R", "Excel") are only recognized when an
+# extracted skill is exactly that word.
+SKILL_ALIASES: Dict[str, List[str]] = {
+    # Languages
+    "Python": ["python", "python3", "python 3"],
+    "Java": ["java", "java 8", "java 11", "java 17", "core java"],
+    "JavaScript": ["javascript", "js", "ecmascript", "es6", "es2015", "vanilla js", "vanilla javascript"],
+    "TypeScript": ["typescript", "ts"],
+    "Go": ["golang", "go lang", "go language"],
+    "Rust": ["rust", "rustlang"],
+    "C": ["c programming", "ansi c", "c language", "c99", "c11"],
+    "C++": ["c++", "cpp", "c++11", "c++14", "c++17", "c++20", "modern c++"],
+    "C#": ["c#", "csharp", "c sharp"],
+    "Ruby": ["ruby"],
+    "PHP": ["php", "php7", "php8"],
+    "Kotlin": ["kotlin"],
+    "Swift": ["swiftui", "swift programming", "swift language", "swift 5"],
+    "Objective-C": ["objective-c", "objective c", "objc"],
+    "Scala": ["scala"],
+    "R": ["r programming", "r language", "rstudio", "tidyverse"],
+    "Julia": ["julia programming", "julia language"],
+    "MATLAB": ["matlab"],
+    "Perl": ["perl"],
+    "Haskell": ["haskell"],
+    "Elixir": ["elixir"],
+    "Erlang": ["erlang"],
+    "Clojure": ["clojure"],
+    "F#": ["f#", "fsharp"],
+    "Dart": ["dart"],
+    "Lua": ["lua"],
+    "Groovy": ["groovy"],
+    "Fortran": ["fortran"],
+    "COBOL": ["cobol"],
+    "Assembly": ["assembly language", "x86 assembly", "arm assembly"],
+    "Solidity": ["solidity"],
+    "Bash": ["bash", "shell scripting", "bash scripting", "shell script", "unix shell"],
+    "PowerShell": ["powershell"],
+    "SQL": ["sql", "t-sql", "tsql", "pl/sql", "plsql", "ansi sql"],
+    "HTML": ["html", "html5"],
+    "CSS": ["css", "css3"],
+    "Sass": ["sass", "scss"],
+    "WebAssembly": ["webassembly", "wasm"],
+    # Databases and storage
+    "PostgreSQL": ["postgresql", "postgres", "psql"],
+    "MySQL": ["mysql"],
+    "MariaDB": ["mariadb"],
+    "SQLite": ["sqlite"],
+    "Oracle Database": ["oracle database", "oracle db", "oracle rdbms"],
+    "Microsoft SQL Server": ["sql server", "mssql", "ms sql", "microsoft sql server"],
+    "MongoDB": ["mongodb", "mongo"],
+    "Redis": ["redis"],
+    "Memcached": ["memcached"],
+    "Cassandra": ["cassandra", "apache cassandra"],
+    "DynamoDB": ["dynamodb", "dynamo db"],
+    "Elasticsearch": ["elasticsearch", "elastic search"],
+    "OpenSearch": ["opensearch"],
+    "Neo4j": ["neo4j"],
+    "CouchDB": ["couchdb"],
+    "HBase": ["hbase"],
+    "ClickHouse": ["clickhouse"],
+    "Snowflake": ["snowflake"],
+    "BigQuery": ["bigquery", "big query"],
+    "Redshift": ["redshift", "amazon redshift"],
+    "Databricks": ["databricks"],
+    "Firebase": ["firebase"],
+    "Supabase": ["supabase"],
+    # Data engineering
+    "Kafka": ["kafka", "apache kafka"],
+    "RabbitMQ": ["rabbitmq", "rabbit mq"],
+    "Spark": ["spark", "apache spark", "pyspark", "spark sql"],
+    "Flink": ["flink", "apache flink"],
+    "Hadoop": ["hadoop", "hdfs", "mapreduce"],
+    "Hive": ["hive", "apache hive"],
+    "Presto": ["presto", "trino"],
+    "Airflow": ["airflow", "apache airflow"],
+    "dbt": ["dbt", "data build tool"],
+    "Dagster": ["dagster"],
+    "Prefect": ["prefect"],
+    "Beam": ["apache beam"],
+    "ETL": ["etl", "elt", "etl pipelines"],
+    "Data Warehousing": ["data warehousing", "data warehouse", "data warehouses"],
+    "Data Modeling": ["data modeling", "data modelling", "dimensional modeling"],
+    # Frontend
+    "React": ["react", "react.js", "reactjs", "react js"],
+    "React Native": ["react native"],
+    "Redux": ["redux"],
+    "Next.js": ["next.js", "nextjs"],
+    "Angular": ["angular", "angularjs", "angular.js"],
+    "Vue.js": ["vue", "vue.js", "vuejs", "vue js"],
+    "Nuxt.js": ["nuxt", "nuxt.js", "nuxtjs"],
+    "Svelte": ["svelte", "sveltekit"],
+    "Ember.js": ["ember.js", "emberjs"],
+    "jQuery": ["jquery"],
+    "Tailwind CSS": ["tailwind", "tailwindcss", "tailwind css"],
+    "Bootstrap": ["bootstrap"],
+    "Webpack": ["webpack"],
+    "Vite": ["vite"],
+    "Flutter": ["flutter"],
+    "Xamarin": ["xamarin"],
+    "Ionic": ["ionic"],
+    "Electron": ["electron.js", "electronjs"],
+    # Backend
+    "Node.js": ["node.js", "nodejs", "node js"],
+    "Express.js": ["express.js", "expressjs"],
+    "NestJS": ["nestjs", "nest.js"],
+    "Deno": ["deno"],
+    "Django": ["django"],
+    "Flask": ["flask"],
+    "FastAPI": ["fastapi"],
+    "Spring": ["spring boot", "spring framework", "springboot", "spring mvc"],
+    "Ruby on Rails": ["ruby on rails", "rails", "ror"],
+    "Laravel": ["laravel"],
+    "Symfony": ["symfony"],
+    ".NET": [".net", "dotnet", ".net core", "asp.net", "asp.net core"],
+    "Hibernate": ["hibernate"],
+    "GraphQL": ["graphql"],
+    "gRPC": ["grpc"],
+    "REST APIs": ["restful", "rest api", "rest apis", "restful apis", "restful api"],
+    "Microservices": ["microservices", "microservice", "microservice architecture"],
+    "WebSockets": ["websockets", "websocket"],
+    "OAuth": ["oauth", "oauth2", "oauth 2.0"],
+    # Cloud and infrastructure
+    "AWS": ["aws", "amazon web services"],
+    "AWS Lambda": ["aws lambda"],
+    "Amazon S3": ["amazon s3", "aws s3"],
+    "Amazon EC2": ["amazon ec2", "aws ec2", "ec2"],
+    "Google Cloud Platform": ["gcp", "google cloud", "google cloud platform"],
+    "Azure": ["azure", "microsoft azure"],
+    "Heroku": ["heroku"],
+    "Vercel": ["vercel"],
+    "Cloudflare": ["cloudflare"],
+    "Docker": ["docker", "docker compose", "docker-compose"],
+    "Kubernetes": ["kubernetes", "k8s", "eks", "gke", "aks"],
+    "Helm": ["helm charts", "helm chart"],
+    "OpenShift": ["openshift"],
+    "Terraform": ["terraform"],
+    "Pulumi": ["pulumi"],
+    "CloudFormation": ["cloudformation", "aws cloudformation"],
+    "Ansible": ["ansible"],
+    "Chef": ["chef infra"],
+    "Puppet": ["puppet enterprise"],
+    "Vagrant": ["vagrant"],
+    "Nginx": ["nginx"],
+    "Apache HTTP Server": ["apache http server", "apache httpd", "httpd"],
+    "Linux": ["linux", "ubuntu", "centos", "rhel", "red hat enterprise linux", "debian"],
+    "Unix": ["unix"],
+    "Windows Server": ["windows server"],
+    "Serverless": ["serverless"],
+    "Infrastructure as Code": ["infrastructure as code", "iac"],
+    "Networking": ["tcp/ip", "computer networking", "network engineering"],
+    # DevOps and tooling
+    "CI/CD": ["ci/cd", "ci cd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "Jenkins": ["jenkins"],
+    "GitHub Actions": ["github actions"],
+    "GitLab CI": ["gitlab ci", "gitlab-ci", "gitlab ci/cd"],
+    "CircleCI": ["circleci", "circle ci"],
+    "Travis CI": ["travis ci", "travisci"],
+    "Argo CD": ["argocd", "argo cd"],
+    "Git": ["git"],
+    "GitHub": ["github"],
+    "GitLab": ["gitlab"],
+    "Bitbucket": ["bitbucket"],
+    "Prometheus": ["prometheus"],
+    "Grafana": ["grafana"],
+    "Datadog": ["datadog"],
+    "Splunk": ["splunk"],
+    "New Relic": ["new relic", "newrelic"],
+    "ELK Stack": ["elk", "elk stack", "logstash", "kibana"],
+    "OpenTelemetry": ["opentelemetry", "otel"],
+    "SRE": ["sre", "site reliability engineering"],
+    "DevOps": ["devops"],
+    "Jira": ["jira"],
+    "Confluence": ["confluence"],
+    # Testing
+    "Unit Testing": ["unit testing", "unit tests"],
+    "Test Automation": ["test automation", "automated testing"],
+    "TDD": ["tdd", "test-driven development", "test driven development"],
+    "Selenium": ["selenium", "selenium webdriver"],
+    "Cypress": ["cypress"],
+    "Playwright": ["playwright"],
+    "Jest": ["jest"],
+    "pytest": ["pytest"],
+    "JUnit": ["junit"],
+    # Machine learning and data science
+    "Machine Learning": ["machine learning", "ml"],
+    "Deep Learning": ["deep learning"],
+    "Artificial Intelligence": ["artificial intelligence", "ai"],
+    "Generative AI": ["generative ai", "genai", "gen ai"],
+    "Large Language Models": ["large language models", "large language model", "llm", "llms"],
+    "NLP": ["nlp", "natural language processing"],
+    "Computer Vision": ["computer vision", "opencv"],
+    "Reinforcement Learning": ["reinforcement learning"],
+    "MLOps": ["mlops", "ml ops"],
+    "TensorFlow": ["tensorflow", "tf2"],
+    "Keras": ["keras"],
+    "PyTorch": ["pytorch", "torch"],
+    "JAX": ["jax"],
+    "scikit-learn": ["scikit-learn", "sklearn", "scikit learn"],
+    "XGBoost": ["xgboost"],
+    "LightGBM": ["lightgbm"],
+    "Hugging Face": ["hugging face", "huggingface", "transformers library"],
+    "LangChain": ["langchain"],
+    "Pandas": ["pandas"],
+    "NumPy": ["numpy"],
+    "SciPy": ["scipy"],
+    "Jupyter": ["jupyter", "jupyter notebooks", "jupyter notebook"],
+    "MLflow": ["mlflow"],
+    "Kubeflow": ["kubeflow"],
+    "SageMaker": ["sagemaker", "amazon sagemaker"],
+    "Vertex AI": ["vertex ai"],
+    "Statistics": ["statistics", "statistical modeling", "statistical analysis"],
+    "A/B Testing": ["a/b testing", "ab testing"],
+    "Data Analysis": ["data analysis", "data analytics"],
+    "Data Visualization": ["data visualization", "data visualisation"],
+    # Analytics and BI
+    "Tableau": ["tableau"],
+    "Power BI": ["power bi", "powerbi"],
+    "Looker": ["looker", "lookml"],
+    "Excel": ["microsoft excel", "ms excel", "advanced excel"],
+    "Google Analytics": ["google analytics", "ga4"],
+    "SAS": ["sas"],
+    "SPSS": ["spss"],
+    "Stata": ["stata"],
+    # Security
+    "Cybersecurity": ["cybersecurity", "cyber security", "information security", "infosec"],
+    "Penetration Testing": ["penetration testing", "pen testing", "pentesting"],
+    "SIEM": ["siem"],
+    "IAM": ["iam", "identity and access management"],
+    "SOC 2": ["soc 2", "soc2"],
+    "OWASP": ["owasp"],
+    # Design and product
+    "Figma": ["figma"],
+    "Sketch": ["sketch app"],
+    "Adobe XD": ["adobe xd"],
+    "Adobe Photoshop": ["photoshop", "adobe photoshop"],
+    "Adobe Illustrator": ["adobe illustrator"],
+    "UX Design": ["ux design", "ux", "user experience"],
+    "UI Design": ["ui design", "user interface design"],
+    "Product Management": ["product management"],
+    "Agile": ["agile", "scrum", "kanban", "agile methodologies"],
+    # Business systems
+    "Salesforce": ["salesforce", "sfdc"],
+    "SAP": ["sap", "sap erp", "sap s/4hana"],
+    "HubSpot": ["hubspot"],
+    "ServiceNow": ["servicenow"],
+    "Workday": ["workday hcm", "workday financials"],
+    # Embedded and systems
+    "Embedded Systems": ["embedded systems", "embedded software", "firmware"],
+    "RTOS": ["rtos", "freertos"],
+    "FPGA": ["fpga", "verilog", "vhdl"],
+    "Unity": ["unity3d", "unity engine"],
+    "Unreal Engine": ["unreal engine", "unreal", "ue5", "ue4"],
+    "Blockchain": ["blockchain", "web3", "ethereum"],
+    # Mobile
+    "iOS": ["ios", "ios development"],
+    "Android": ["android", "android sdk", "android development"],
+}
+
+SKILLS_CACHE_DIR = os.path.join(".cache", "skills")
+# Bumped whenever tokenization or the serialized layout changes
+_FORMAT_VERSION = 1
+# Text is split on every ASCII byte except letters, digits and the punctuation
+# of names like "node.js", "c++", "c#", ".net" and "scikit-learn", so "/"
+# separates ("python/django", "ci/cd"). bytes.translate() and split() run in C,
+# several times faster than a tokenizing regex.
+_TOKEN_CHARS = (string.ascii_lowercase + string.digits + "+#.-").encode("ascii")
+_SEPARATORS = bytes(byte if byte >= 128 or byte in _TOKEN_CHARS else 32 for byte in range(256))
+_ID_REPLACEMENTS = (("+", "p"), ("#", "sharp"))
+_ID_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+
+
+def _split(text: str) -> List[bytes]:
+    """Lowercase UTF-8 tokens of text, possibly ending in "." or "-"."""
+    return text.lower().encode("utf-8").translate(_SEPARATORS).split()
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into the lowercase tokens aliases are matched on.
+
+    Args:
+        text: Alias, skill or description text
+
+    Returns:
+        Tokens with trailing periods and hyphens removed
+    """
+    tokens = (token.rstrip(b".-").decode("utf-8") for token in _split(text))
+    return [token for token in tokens if token]
+
+
+def skill_id(name: str) -> str:
+    """Stable identifier of a canonical skill name.
+
+    "C++" becomes "cpp", "C#" "csharp", ".NET" "dotnet" and "Node.js"
+    "node-js".
+
+    Args:
+        name: Canonical skill name
+
+    Returns:
+        Lowercase identifier of letters, digits and hyphens
+    """
+    text = name.lower()
+    if text.startswith("."):
+        text = "dot" + text[1:]
+    for symbol, replacement in _ID_REPLACEMENTS:
+        text = text.replace(symbol, replacement)
+    return _ID_SEPARATOR_RE.sub("-", text).strip("-")
+
+
+def aliases_fingerprint(aliases: Mapping[str, Iterable[str]]) -> str:
+    """Fingerprint an alias dictionary, so a compiled trie can be matched to it.
+
+    Args:
+        aliases: Canonical skill name -> aliases
+
+    Returns:
+        Short hex digest
+    """
+    material = json.dumps(
+        {"version": _FORMAT_VERSION, "aliases": {name: sorted(values) for name, values in aliases.items()}},
+        sort_keys=True,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+
+
+class SkillCanonicalizer:
+    """Maps free-text skills and description text to canonical skills in one pass.
+
+    Aliases are split into tokens and compiled into one trie whose edges
+    are token IDs rather than characters. Scanning a description tokenizes
+    it once, finds the tokens that start some alias with a single C-level
+    set-membership pass, and walks the trie only from those. Each walk stops
+    at the first token that cannot extend a match, and aliases are a few
+    tokens long, so the cost is linear in the text and independent of the
+    dictionary size. Overlapping matches resolve leftmost-longest
+    ("apache spark sql" is one match, not three).
+    """
+
+    def __init__(self, aliases: Optional[Mapping[str, Iterable[str]]] = None):
+        """Compile an alias dictionary.
+
+        Args:
+            aliases: Canonical skill name -> aliases matched in prose (default:
+                     SKILL_ALIASES). Each canonical name also matches itself when
+                     it is a whole extracted skill.
+        """
+        aliases = SKILL_ALIASES if aliases is None else aliases
+        self.fingerprint = aliases_fingerprint(aliases)
+        self.names: List[str] = list(aliases)
+        self.ids: List[str] = [skill_id(name) for name in self.names]
+        # Token -> ID, including a variant ending in "." for each token, so words at
+        # the end of a sentence need no stripping
+        self._vocab: Dict[bytes, int] = {}
+        # Trie edges in one dictionary keyed by node << 32 | token ID, which loads
+        # from disk in a single dict(zip()); then per node, the skill (or -1) of a
+        # prose alias ending there, and the skill of a whole alias or canonical
+        # name ending there, for lookups of extracted skills. Node 0 is the root.
+        self._edges: Dict[int, int] = {}
+        self._out: List[int] = [-1]
+        self._exact: List[int] = [-1]
+        for skill, name in enumerate(self.names):
+            for alias in aliases[name]:
+                self._insert(alias, skill, prose=True)
+            self._insert(name, skill, prose=False)
+        self._index_starts()
+
+    def _insert(self, alias: str, skill: int, prose: bool) -> None:
+        """Add one alias path to the trie."""
+        tokens = tokenize(alias)
+        if not tokens:
+            return
+        node = 0
+        for token in tokens:
+            key = node << 32 | self._token_id(token)
+            node = self._edges.get(key, 0)
+            if not node:
+                node = self._edges[key] = len(self._out)
+                self._out.append(-1)
+                self._exact.append(-1)
+        # The first skill to claim an alias keeps it
+        if self._exact[node] < 0:
+            self._exact[node] = skill
+        if prose and self._out[node] < 0:
+            self._out[node] = skill
+
+    def _token_id(self, token: str) -> int:
+        """ID of an alias token, assigning the next one to a new token."""
+        key = token.encode("utf-8")
+        token_id = self._vocab.get(key)
+        if token_id is None:
+            token_id = self._vocab[key] = self._vocab[key + b"."] = len(self._vocab) // 2 + 1
+        return token_id
+
+    def _index_starts(self) -> None:
+        """Map each token that starts an alias straight to its node below the root."""
+        edges = self._edges
+        # Root edges are keyed by the bare token ID
+        self._starts: Dict[bytes, int] = {
+            token: edges[token_id] for token, token_id in self._vocab.items() if token_id in edges
+        }
+        # Set membership is the cheapest per-token test for the first pass of _scan
+        self._start_tokens = frozenset(self._starts)
+
+    def __len__(self) -> int:
+        """Number of canonical skills."""
+        return len(self.names)
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of trie nodes."""
+        return len(self._out)
+
+    def _scan(self, text: str) -> List[int]:
+        """Skill indices of the leftmost-longest prose matches in text, in text order."""
+        tokens = _split(text)
+        vocab, edges, out, starts = self._vocab, self._edges, self._out, self._starts
+        end = len(tokens)
+        found: List[int] = []
+        covered = 0
+        # One C-level pass finds the tokens that can start a match; only those are walked
+        for position in compress(count(), map(self._start_tokens.__contains__, tokens)):
+            if position < covered:
+                continue
+            node = starts[tokens[position]]
+            skill, last = out[node], position
+            following = position + 1
+            while following < end:
+                node = edges.get(node << 32 | vocab.get(tokens[following], 0))
+                if node is None:
+                    break
+                if out[node] >= 0:
+                    skill, last = out[node], following
+                following += 1
+            if skill >= 0:
+                found.append(skill)
+                covered = last + 1
+        return found
+
+    def find(self, text: str) -> List[str]:
+        """Canonical names of the skills mentioned in text, in order of first mention.
+
+        Args:
+            text: Any text, e.g. a raw job description
+
+        Returns:
+            Distinct canonical skill names
+        """
+        names = self.names
+        return [names[skill] for skill in dict.fromkeys(self._scan(text))]
+
+    def find_ids(self, text: str) -> List[str]:
+        """Like find(), but returning canonical skill IDs."""
+        ids = self.ids
+        return [ids[skill] for skill in dict.fromkeys(self._scan(text))]
+
+    def _lookup(self, skill: str) -> int:
+        """Skill index of a whole alias or canonical name, or -1."""
+        node = 0
+        vocab, edges = self._vocab, self._edges
+        for token in _split(skill):
+            node = edges.get(node << 32 | vocab.get(token, 0), 0)
+            if not node:
+                return -1
+        return self._exact[node]
+
+    def canonical(self, skill: str) -> Optional[str]:
+        """Canonical name of one extracted skill ("JS" -> "JavaScript").
+
+        Args:
+            skill: Free-text skill as returned by the model
+
+        Returns:
+            The canonical name, or None if the skill is not in the dictionary
+        """
+        index = self._lookup(skill)
+        return self.names[index] if index >= 0 else None
+
+    def canonicalize(self, skills: Iterable[str], keep_unknown: bool = True) -> List[str]:
+        """Replace extracted skills by their canonical names, dropping duplicates.
+
+        Args:
+            skills: Free-text skills as returned by the model
+            keep_unknown: Keep skills missing from the dictionary (whitespace-normalized)
+                          instead of dropping them
+
+        Returns:
+            Distinct skills in their original order
+        """
+        result: Dict[str, None] = {}
+        seen_unknown = set()
+        for skill in skills:
+            index = self._lookup(skill)
+            if index >= 0:
+                result.setdefault(self.names[index], None)
+            elif keep_unknown:
+                text = " ".join(skill.split())
+                key = text.casefold()
+                if text and key not in seen_unknown:
+                    seen_unknown.add(key)
+                    result.setdefault(text, None)
+        return list(result)
+
+    def apply(self, job_info: JobInformation) -> JobInformation:
+        """Return a copy of a result whose skills are canonicalized.
+
+        Args:
+            job_info: Extracted JobInformation
+
+        Returns:
+            The same result when nothing changes, otherwise an updated copy
+        """
+        skills = self.canonicalize(job_info.skills)
+        if skills == job_info.skills:
+            return job_info
+        return job_info.model_copy(update={"skills": skills})
+
+    def save(self, path: str) -> None:
+        """Write the compiled trie to a JSON file.
+
+        Args:
+            path: Output file path
+        """
+        state = {
+            "version": _FORMAT_VERSION,
+            "fingerprint": self.fingerprint,
+            "names": self.names,
+            "ids": self.ids,
+            # Tokens in ID order, without their "." variants
+            "vocab": [token.decode("utf-8") for token in self._vocab if not token.endswith(b".")],
+            "edge_keys": list(self._edges),
+            "edge_nodes": list(self._edges.values()),
+            "out": self._out,
+            "exact": self._exact,
+        }
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(state, f, separators=(",", ":"))
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> "SkillCanonicalizer":
+        """Load a trie written by save(), without recompiling it.
+
+        Args:
+            path: File written by save()
+
+        Returns:
+            SkillCanonicalizer equivalent to the one saved
+
+        Raises:
+            ValueError: If the file was written by an incompatible version
+        """
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported skill trie version in {path}: {state.get('version')}")
+        canonicalizer = cls.__new__(cls)
+        canonicalizer.fingerprint = state["fingerprint"]
+        canonicalizer.names = state["names"]
+        canonicalizer.ids = state["ids"]
+        tokens = [token.encode("utf-8") for token in state["vocab"]]
+        canonicalizer._vocab = dict(zip(tokens, count(1)))
+        canonicalizer._vocab.update(zip([token + b"." for token in tokens], count(1)))
+        canonicalizer._edges = dict(zip(state["edge_keys"], state["edge_nodes"]))
+        canonicalizer._out = state["out"]
+        canonicalizer._exact = state["exact"]
+        canonicalizer._index_starts()
+        return canonicalizer
+
+
+def load_aliases(path: str) -> Dict[str, List[str]]:
+    """Read an alias dictionary from a JSON file of {"Canonical name": ["alias", ...]}.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        Canonical name -> lowercase aliases
+
+    Raises:
+        ValueError: If the file is not a JSON object of string lists
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or not all(
+        isinstance(values, list) and all(isinstance(value, str) for value in values) for values in data.values()
+    ):
+        raise ValueError(f"{path} must be a JSON object mapping skill names to lists of aliases")
+    return {name: [value.lower() for value in values] for name, values in data.items()}
+
+
+def load_canonicalizer(aliases_path: Optional[str] = None, cache_dir: Optional[str] = SKILLS_CACHE_DIR) -> SkillCanonicalizer:
+    """Build the canonicalizer for the built-in dictionary plus optional extra aliases, reusing a compiled copy.
+
+    The compiled trie is stored in cache_dir under the dictionary's
+    fingerprint, so later runs with the same aliases load it instead of
+    compiling again, and any change to the aliases compiles a new one.
+
+    Args:
+        aliases_path: JSON file of extra aliases (see load_aliases); entries for
+                      an existing canonical name extend its aliases
+        cache_dir: Directory of compiled tries, or None to always compile
+
+    Returns:
+        SkillCanonicalizer ready to use
+    """
+    aliases = {name: list(values) for name, values in SKILL_ALIASES.items()}
+    if aliases_path:
+        for name, values in load_aliases(aliases_path).items():
+            aliases.setdefault(name, []).extend(values)
+    if cache_dir is None:
+        return SkillCanonicalizer(aliases)
+    path = os.path.join(cache_dir, f"{aliases_fingerprint(aliases)}.json")
+    if os.path.exists(path):
+        try:
+            return SkillCanonicalizer.load(path)
+        except (OSError, ValueError, KeyError):
+            pass
+    canonicalizer = SkillCanonicalizer(aliases)
+    try:
+        canonicalizer.save(path)
+    except OSError:
+        pass
+    return canonicalizer
+
+
+_default: Optional[SkillCanonicalizer] = None
+
+
+def default_canonicalizer() -> SkillCanonicalizer:
+    """Shared canonicalizer of the built-in dictionary, compiled in memory on first use."""
+    global _default
+    if _default is None:
+        _default = SkillCanonicalizer()
+    return _default
@@ -0,0 +1,237 @@
+"""Per-posting change tracking for incremental re-extraction of re-crawled postings."""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .cache import normalize_description, schema_fingerprint
+from .chunking import SECTION_FIELDS, labeled_sections
+from .models import ALL_FIELDS, JobInformation, expand_subset, normalize_fields
+
+
+DEFAULT_TRACKER_PATH = os.path.join(".cache", "tracking.sqlite")
+
+# Lines that change between crawls without changing the posting
+_VOLATILE_LINE_RE = re.compile(
+    r"^\W*(?:(?:re)?posted|updated|refreshed|last (?:updated|modified))\b.*$"
+    r"|^\W*(?:over )?\d[\d,]*\+? (?:applicants|applications|views|clicks)\b.*$"
+    r"|^\W*(?:be among the first|actively (?:recruiting|hiring))\b.*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def section_fingerprints(job_description: str) -> List[Tuple[str, str]]:
+    """Fingerprint each section of a description.
+
+    Sections are split and classified as for chunking. Whitespace, Unicode
+    form, case and volatile lines ("Posted 3 days ago", "120 applicants")
+    do not affect a fingerprint.
+
+    Args:
+        job_description: Raw job description text
+
+    Returns:
+        (kind, fingerprint) pairs in document order, kind as in labeled_sections()
+    """
+    fingerprints = []
+    for kind, section in labeled_sections(job_description):
+        text = normalize_description(_VOLATILE_LINE_RE.sub("", section)).casefold()
+        fingerprints.append((kind, hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()))
+    return fingerprints
+
+
+def affected_fields(old: List[Tuple[str, str]], new: List[Tuple[str, str]]) -> FrozenSet[str]:
+    """Fields that may have changed between two versions of a posting.
+
+    A section whose fingerprint appears in only one version was added,
+    removed or edited; it affects the fields its kind can contain
+    (SECTION_FIELDS). The opening section and unrecognized sections can
+    contain anything, so a change there affects every field. Reordered
+    sections affect nothing.
+
+    Args:
+        old: section_fingerprints() of the stored version
+        new: section_fingerprints() of the new version
+
+    Returns:
+        Affected field names (empty when nothing meaningful changed)
+    """
+    changed = set(old) ^ set(new)
+    if any(kind == "" for kind, _ in changed):
+        return ALL_FIELDS
+    return frozenset().union(*(SECTION_FIELDS[kind] for kind, _ in changed))
+
+
+@dataclass
+class ChangePlan:
+    """What a re-crawled posting needs: nothing, some fields, or a full extraction."""
+
+    posting_id: str
+    requested: FrozenSet[str]
+    fields: FrozenSet[str]
+    sections: List[Tuple[str, str]]
+    record: Optional[JobInformation] = None
+    # Fields the stored record holds once this plan is committed
+    valid: FrozenSet[str] = frozenset()
+
+    @property
+    def unchanged(self) -> bool:
+        """Whether the stored record can be reused as is."""
+        return not self.fields
+
+    @property
+    def full(self) -> bool:
+        """Whether every requested field must be extracted (new or fully changed posting)."""
+        return self.record is None or self.fields >= self.requested
+
+
+class ChangeTracker:
+    """SQLite store of each posting's section fingerprints and latest extracted record.
+
+    plan() compares a re-crawled description with the stored fingerprints
+    and returns the fields to re-extract; commit() patches those fields
+    into the stored record. Counters since the tracker was opened (one
+    crawl) are reported by stats().
+    """
+
+    def __init__(self, path: str = DEFAULT_TRACKER_PATH, model_name: str = "gemini-2.5-flash"):
+        """Open (or create) the tracking database.
+
+        Args:
+            path: SQLite database file path (":memory:" for a process-local store)
+            model_name: Model the records are extracted with; records stored by
+                        another model or schema are extracted again in full
+        """
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.model_name = model_name
+        self.fingerprint = schema_fingerprint()
+        self._lock = threading.Lock()
+        self._counts = {"postings": 0, "new": 0, "unchanged": 0, "partial": 0, "full": 0}
+        self._fields_requested = 0
+        self._fields_extracted = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS tracked (
+                posting_id TEXT PRIMARY KEY,
+                model_name TEXT NOT NULL,
+                schema TEXT NOT NULL,
+                fields TEXT NOT NULL,
+                sections TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )"""
+        )
+
+    def plan(self, posting_id: str, job_description: str, fields: Optional[Iterable[str]] = None) -> ChangePlan:
+        """Decide what a crawled posting needs, and count it in stats().
+
+        Args:
+            posting_id: Stable posting ID across crawls
+            job_description: Raw job description text as crawled now
+            fields: Names of the JobInformation fields wanted (default: all)
+
+        Returns:
+            ChangePlan; extract plan.fields unless plan.unchanged, then commit()
+        """
+        requested = normalize_fields(fields)
+        sections = section_fingerprints(job_description)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT model_name, schema, fields, sections, payload FROM tracked WHERE posting_id = ?",
+                (posting_id,),
+            ).fetchone()
+        if row is None or row[0] != self.model_name or row[1] != self.fingerprint:
+            plan = ChangePlan(posting_id, requested, requested, sections, valid=requested)
+        else:
+            stored = frozenset(row[2].split(","))
+            old = [tuple(pair) for pair in json.loads(row[3])]
+            affected = affected_fields(old, sections)
+            wanted = (affected | (requested - stored)) & requested
+            record = JobInformation.model_validate_json(row[4])
+            plan = ChangePlan(posting_id, requested, wanted, sections, record, (stored - affected) | wanted)
+            if plan.unchanged and old != sections:
+                # Same sections in a new order: keep the stored order current
+                self._store(posting_id, row[2], sections, row[4])
+        with self._lock:
+            self._counts["postings"] += 1
+            kind = "new" if row is None else "unchanged" if plan.unchanged else "full" if plan.full else "partial"
+            self._counts[kind] += 1
+            self._fields_requested += len(requested)
+            self._fields_extracted += len(plan.fields)
+        return plan
+
+    def commit(self, plan: ChangePlan, job_info: JobInformation) -> JobInformation:
+        """Store the result of a plan and return the up-to-date record.
+
+        Args:
+            plan: Plan from plan()
+            job_info: Extraction of plan.fields from the new description
+                      (ignored when the plan is unchanged)
+
+        Returns:
+            The stored record: job_info for new postings, otherwise the
+            previous record with plan.fields replaced by job_info's values
+        """
+        if plan.unchanged:
+            return plan.record
+        if plan.record is None:
+            record = job_info
+        else:
+            # Fields outside the request that the change may have touched are
+            # dropped rather than kept stale; a later crawl asking for them re-extracts them
+            record = expand_subset({
+                name: getattr(job_info if name in plan.fields else plan.record, name) for name in plan.valid
+            })
+        self._store(plan.posting_id, ",".join(sorted(plan.valid)), plan.sections, record.model_dump_json())
+        return record
+
+    def _store(self, posting_id: str, fields: str, sections: List[Tuple[str, str]], payload: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tracked (posting_id, model_name, schema, fields, sections, payload, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (posting_id, self.model_name, self.fingerprint, fields, json.dumps(sections), payload, time.time()),
+            )
+
+    def get(self, posting_id: str) -> Optional[JobInformation]:
+        """The stored record of a posting, or None if it was never committed."""
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM tracked WHERE posting_id = ?", (posting_id,)).fetchone()
+        return JobInformation.model_validate_json(row[0]) if row else None
+
+    def __len__(self) -> int:
+        """Number of tracked postings."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM tracked").fetchone()[0]
+
+    def stats(self) -> Dict[str, float]:
+        """Return what this crawl avoided.
+
+        Returns:
+            Dictionary with postings, new, unchanged, partial and full counts,
+            calls_avoided_ratio (unchanged postings over all postings) and
+            fields_avoided_ratio (fields not re-extracted over fields requested)
+        """
+        with self._lock:
+            stats: Dict[str, float] = dict(self._counts)
+            stats["calls_avoided_ratio"] = self._counts["unchanged"] / self._counts["postings"] if self._counts["postings"] else 0.0
+            stats["fields_avoided_ratio"] = (
+                1 - self._fields_extracted / self._fields_requested if self._fields_requested else 0.0
+            )
+        return stats
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()